@@ -0,0 +1,496 @@
+import importlib
+import math
+import re
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from . import Rules
+from .hooks import Rules as HookRules
+from .Helpers import clamp
+from .Items import get_item_value_key
+
+######################################################################################
+## The requires of a Manual game, evaluated by the client from the received items, so it can
+## tell which locations are in logic without Universal Tracker generating the whole game again.
+##
+## Requires strings are parsed once, the way Rules.py reads them every time: every |item| and
+## |@category| becomes an operand and the rest goes through the same operator handling, so
+## they mean exactly the same thing. {Function()} results are put in the text first like
+## Rules.py does, and every text that gives is parsed once too. Functions are the world's own,
+## called with stand-ins for the world, multiworld and state that answer from the received
+## items. Reachable regions are only worked out again when the received items change.
+######################################################################################
+
+_function_pattern = re.compile(r'\{(\w+)\(([^)]*)\)\}')
+_item_pattern = re.compile(r'\|[^|]+\|')
+_and_pattern = re.compile(r'\s?\bAND\b\s?', re.IGNORECASE)
+_or_pattern = re.compile(r'\s?\bOR\b\s?', re.IGNORECASE)
+_precedence = {"&": 2, "|": 2, "!": 3}
+
+# operands are put in the requires text as Hangul syllables, word characters like the 1 and 0
+# Rules.py puts there (so AND/OR are matched the same around them) that aren't numbers
+_operand_base = 0xAC00
+_operand_limit = 0xD7A3 - _operand_base
+
+
+class UnknownOption(Exception):
+    """A requires asked for an option the slot data doesn't have, so what it needs can't be known"""
+
+def get_requires_function(name: str) -> Optional[Callable]:
+    """Find a function used in requires where Rules.py does: its own functions first, then the hooks'"""
+    func = getattr(Rules, name, None)
+    if func is None:
+        func = getattr(HookRules, name, None)
+    return func if callable(func) else None
+
+def _to_postfix(tokens: list) -> Optional[list]:
+    """infix_to_postfix of Rules.py over tokens instead of characters, returns None where it would raise"""
+    stack = []
+    postfix = []
+    for token in tokens:
+        if not isinstance(token, str) or token.isnumeric():
+            postfix.append(token)
+        elif token in _precedence:
+            while stack and stack[-1] != "(" and _precedence[token] <= _precedence[stack[-1]]:
+                postfix.append(stack.pop())
+            stack.append(token)
+        elif token == "(":
+            stack.append(token)
+        elif token == ")":
+            while stack and stack[-1] != "(":
+                postfix.append(stack.pop())
+            if not stack:
+                return None
+            stack.pop()
+    while stack:
+        postfix.append(stack.pop())
+    return postfix
+
+def _is_valid_postfix(postfix: list) -> bool:
+    """Would evaluate_postfix of Rules.py get through this without raising, whatever the operands are"""
+    depth = 0
+    for token in postfix:
+        if not isinstance(token, str) or token in ("0", "1"):
+            depth += 1
+        elif token in ("&", "|"):
+            if depth < 2:
+                return False
+            depth -= 1
+        elif token == "!" and not depth:
+            return False
+    return depth == 1
+
+
+class CompiledRequires:
+    """A requires string turned into postfix over its operands, ready to be evaluated many times.\n
+    Requires with functions only keep the functions: what's left to read depends on their results."""
+
+    def __init__(self, requires: str, functions: list, operands: list[Callable[[], bool]], sources: list[tuple], postfix: Optional[list], error: Optional[Exception]):
+        self.requires = requires
+        # (name, function, args, call text) of every {Function()}, called in order before anything else like Rules.py does
+        self.functions = functions
+        self.operands = operands
+        # what each operand stands for: (require type, name, items counted, count needed)
+        self.sources = sources
+        self.postfix = postfix
+        self.error = error
+
+
+class ClientLogic:
+    """Reachability of a Manual game's regions and locations for a multiset of received items.\n
+    items, locations and regions are shaped like the tables of a .apmanual file: items with their "category",
+    "value" and "count" (how many are in this player's pool), locations with their "region" and "requires",
+    regions with their "connects_to" and "requires". options holds the player's option values, like slot data does.
+    option_names are all the options of the game, others are missing like they are in generation. Without them every
+    option that isn't in options is unknown.\n
+    Regions and locations whose requires ask for an unknown option aren't reachable, they're in unknown_regions and unknown_locations.
+    """
+
+    def __init__(self, items: Mapping[str, dict], locations: Mapping[str, dict], regions: Mapping[str, dict],
+                 options: Optional[Mapping[str, Any]] = None, player: int = 1, item_counts: Optional[Mapping[str, int]] = None,
+                 option_names: Optional[Iterable[str]] = None):
+        self.items = items
+        self.locations = locations
+        self.regions = regions
+        self.player = player
+        # how many of each item the player's pool has, what all/half/% are counted against
+        self.item_counts = dict(item_counts) if item_counts is not None else \
+            {name: int(item.get("count", 1)) for name, item in items.items()}
+
+        self.category_items: dict[str, list[str]] = {}
+        for name, item in items.items():
+            for category in item.get("category", []):
+                self.category_items.setdefault(category, []).append(name)
+
+        self.item_value_keys: dict[str, list[tuple[str, int]]] = {
+            name: [(get_item_value_key(value_name), int(amount)) for value_name, amount in item["value"].items()]
+            for name, item in items.items() if item.get("value")
+        }
+
+        self.root_region = "Menu" if "Menu" in regions else "Manual"
+        self.world = ClientWorld(self, options or {}, option_names)
+        self.multiworld = SimpleNamespace(worlds={player: self.world}, player_ids=(player,))
+        self.state = ClientState(self)
+        # what requires functions are called with, (world, multiworld, state, player)
+        self.function_context = (self.world, self.multiworld, self.state, player)
+
+        self._compiled: dict[str, CompiledRequires] = {}
+        self._asked_reachability = False
+        self.set_counts(Counter(), compare=False)
+
+    @classmethod
+    def from_world(cls, world) -> "ClientLogic":
+        """The logic of a generated slot, from the world itself"""
+        regions = importlib.import_module(f"{type(world).__module__}.Regions").regionMap
+        return cls(world.item_name_to_item, world.location_name_to_location, {**regions, "Menu": {"connects_to": ["Manual"]}},
+                   {name: getattr(world.options, name).value for name in world.options_dataclass.type_hints.keys()},
+                   world.player, world.get_item_counts(world.player), world.options_dataclass.type_hints.keys())
+
+    @classmethod
+    def from_world_type(cls, world_type, options: Mapping[str, Any], player: int = 1) -> "ClientLogic":
+        """The logic of an installed apworld, before anything its options change. Item counts are the ones in its data."""
+        regions = importlib.import_module(f"{world_type.__module__}.Regions").regionMap
+        return cls(world_type.item_name_to_item, world_type.location_name_to_location, {**regions, "Menu": {"connects_to": ["Manual"]}},
+                   options, player, option_names=world_type.options_dataclass.type_hints.keys())
+
+    def set_counts(self, counts: Mapping[str, int], compare: bool = True) -> bool:
+        """Use counts as the received items from now on, returns False if they're the same as the current ones"""
+        if compare and counts == self.counts:
+            return False
+
+        self.counts = counts
+        self._prog_items = None
+        self._regions = None
+        self._regions_in_progress = None
+        self.unknown_regions: set[str] = set()
+        self.unknown_locations: set[str] = set()
+        return True
+
+    @property
+    def prog_items(self) -> Counter:
+        """The received items with the total of every value, the way CollectionState.prog_items holds them"""
+        if self._prog_items is None:
+            prog_items = Counter(self.counts)
+            for name, value_keys in self.item_value_keys.items():
+                count = self.counts.get(name, 0)
+                if count:
+                    for value_key, amount in value_keys:
+                        prog_items[value_key] += amount * count
+            self._prog_items = prog_items
+        return self._prog_items
+
+    def count(self, item_name: str) -> int:
+        return self.counts.get(item_name, 0)
+
+    ######################
+    # Requires
+    ######################
+
+    def check_requires(self, area: Optional[dict]) -> bool:
+        """fullLocationOrRegionCheck of Rules.py, for the current counts"""
+        if not area or "requires" not in area.keys():
+            return True
+
+        requires = area["requires"]
+        if isinstance(requires, str):
+            return self.evaluate(self.compile(requires, area), area)
+        return self.check_requires_list(requires)
+
+    def check_requires_list(self, requires: Iterable) -> bool:
+        """checkRequireDictForArea of Rules.py: plain items are all needed, unless an or group (all of whose items are needed) is met first"""
+        can_access = True
+        for item in requires:
+            if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or isinstance(item, list):
+                or_items = item["or"] if isinstance(item, dict) else item
+                if all(self._has_list_item(or_item) for or_item in or_items):
+                    return True
+            elif not self._has_list_item(item):
+                can_access = False
+        return can_access
+
+    def _has_list_item(self, item: str) -> bool:
+        item_parts = item.split(":")
+        if len(item_parts) > 1:
+            return self.count(item_parts[0]) >= int(item_parts[1])
+        return self.count(item) >= 1
+
+    def compile(self, requires: str, area: Any, with_functions: bool = True) -> CompiledRequires:
+        """Parse a requires string once, keeping every error Rules.py would raise for it to raise on evaluation.\n
+        Without functions, {Function()} calls are left as text, like Rules.py does for the ones function results bring in."""
+        key = requires if with_functions else "\0" + requires
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compile(requires, area, with_functions)
+            self._compiled[key] = compiled
+        return compiled
+
+    def _compile(self, requires: str, area: Any, with_functions: bool) -> CompiledRequires:
+        if requires == "" and with_functions:
+            return CompiledRequires(requires, [], [], [], [True], None)
+
+        if with_functions:
+            functions = []
+            for func_name, func_args in _function_pattern.findall(requires):
+                args = func_args.split(",")
+                if args == ['']:
+                    args.pop()
+
+                func = get_requires_function(func_name)
+                functions.append((func_name, func, args, "{" + func_name + "(" + func_args + ")}"))
+                if func is None:
+                    break # raises once the functions before it are called
+            if functions:
+                return CompiledRequires(requires, functions, [], [], None, None)
+
+        operands = []
+        sources = []
+        error = None
+
+        text = requires
+        for item_base in _item_pattern.findall(requires):
+            try:
+                require_type, item_name, item_names, item_count = self.parse_item(item_base, area)
+            except ValueError as e:
+                error = error or e
+                continue
+            operands.append(self._item_operand(require_type, item_names, item_count))
+            sources.append((require_type, item_name, item_names, item_count))
+            text = text.replace(item_base, chr(_operand_base + len(operands) - 1))
+
+        if len(operands) > _operand_limit:
+            raise ValueError(f"Too many items in the requires of {area} to evaluate in the client.")
+
+        text = _and_pattern.sub('&', text)
+        text = _or_pattern.sub('|', text)
+        tokens = [ord(c) - _operand_base if _operand_base <= ord(c) <= _operand_base + len(operands) - 1 else c for c in text]
+
+        postfix = _to_postfix(tokens)
+        if postfix is None or not _is_valid_postfix(postfix):
+            error = error or KeyError("Invalid logic format for location/region {}.".format(area))
+            postfix = None
+        return CompiledRequires(requires, [], operands, sources, postfix, error)
+
+    @staticmethod
+    def paste_results(compiled: CompiledRequires, results: list) -> str:
+        """The requires with its function calls replaced by their results, like Rules.py does before reading the items"""
+        text = compiled.requires
+        for (_, _, _, call), result in zip(compiled.functions, results):
+            if isinstance(result, bool):
+                text = text.replace(call, "1" if result else "0")
+            else:
+                text = text.replace(call, str(result))
+        return text
+
+    def parse_item(self, item_base: str, area: Any) -> tuple[str, str, list[str], int]:
+        """Read an |item| or |@category| of a requires string like Rules.py does,
+        returns its type ('item' or 'category'), its name, the items it counts and how many of them it needs"""
+        require_type = 'category' if '|@' in item_base else 'item'
+        item = item_base.lstrip('|@$').rstrip('|')
+
+        item_parts = item.split(":")
+        item_name = item
+        item_count = "1"
+        if len(item_parts) > 1:
+            item_name = item_parts[0].strip()
+            item_count = item_parts[1].strip()
+
+        if require_type == 'category':
+            category_items = self.category_items.get(item_name, [])
+            pool_count = sum(self.item_counts.get(name, 0) for name in category_items)
+        else:
+            pool_count = self.item_counts.get(item_name, 0)
+
+        if item_count.lower() == 'all':
+            item_count = pool_count
+        elif item_count.lower() == 'half':
+            item_count = int(pool_count / 2)
+        elif item_count.endswith('%') and len(item_count) > 1:
+            percent = clamp(float(item_count[:-1]) / 100, 0, 1)
+            item_count = math.ceil(pool_count * percent)
+        elif require_type == 'category':
+            try:
+                item_count = int(item_count)
+            except ValueError as e:
+                raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
+        else:
+            item_count = int(item_count)
+
+        return require_type, item_name, category_items if require_type == 'category' else [item_name], item_count
+
+    def _item_operand(self, require_type: str, item_names: list[str], item_count: int) -> Callable[[], bool]:
+        if require_type == 'category':
+            if not item_names:
+                # Rules.py only marks a category met from inside its loop over the category's items
+                return lambda: False
+            return lambda: sum(self.count(name) for name in item_names) >= item_count
+        item_name = item_names[0]
+        return lambda: self.count(item_name) >= item_count
+
+    def evaluate(self, compiled: CompiledRequires, area: Any = None) -> bool:
+        if compiled.functions:
+            results = []
+            world, multiworld, state, player = self.function_context
+            for func_name, func, args, _ in compiled.functions:
+                if func is None:
+                    raise ValueError(f"Invalid function `{func_name}` in requires.")
+                results.append(func(world, multiworld, state, player, *args))
+            compiled = self.compile(self.paste_results(compiled, results), area, with_functions=False)
+
+        if compiled.error is not None:
+            raise compiled.error
+
+        operands = compiled.operands
+        stack = []
+        for token in compiled.postfix:
+            if token is True:
+                stack.append(True)
+            elif not isinstance(token, str):
+                stack.append(operands[token]())
+            elif token == "0":
+                stack.append(False)
+            elif token == "1":
+                stack.append(True)
+            elif token == "&":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                stack.append(op1 and op2)
+            elif token == "|":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                stack.append(op1 or op2)
+            elif token == "!":
+                stack.append(not stack.pop())
+        return stack.pop()
+
+    ######################
+    # Reachability
+    ######################
+
+    @property
+    def reachable_regions(self) -> set[str]:
+        if self._regions is None:
+            self._regions = self._find_reachable_regions()
+        return self._regions
+
+    def _find_reachable_regions(self) -> set[str]:
+        # exits of a region need that region's requires, like the entrances set_rules makes.
+        # Requires can ask if a region is reachable, so go again until nothing new is reached.
+        reachable = self._regions_in_progress = {self.root_region}
+        passed = set()
+        try:
+            while True:
+                self._asked_reachability = False
+                size = len(reachable)
+                queue = [region for region in reachable if region not in passed]
+                while queue:
+                    region = queue.pop()
+                    if region not in passed:
+                        try:
+                            if not self.check_requires(self.regions.get(region)):
+                                continue
+                        except UnknownOption:
+                            self.unknown_regions.add(region)
+                            continue
+                        self.unknown_regions.discard(region)
+                        passed.add(region)
+                    for exit_region in self.regions.get(region, {}).get("connects_to") or []:
+                        if exit_region not in reachable:
+                            reachable.add(exit_region)
+                            queue.append(exit_region)
+
+                if len(reachable) == size or not self._asked_reachability:
+                    return reachable
+        finally:
+            self._regions_in_progress = None
+
+    def can_reach_region(self, name: str) -> bool:
+        self._asked_reachability = True
+        if self._regions_in_progress is not None:
+            return name in self._regions_in_progress
+        return name in self.reachable_regions
+
+    def can_reach_location(self, name: str) -> bool:
+        location = self.locations.get(name)
+        if location is None:
+            return False
+        region = location.get("region", "Manual")
+        return self.can_reach_region(region) and self.check_requires(location) and self.check_requires(self.regions.get(region))
+
+    def get_reachable_locations(self, names: Optional[Iterable[str]] = None) -> list[str]:
+        """The locations (out of names, or all of them) that are in logic with the current counts.
+        The ones asking for an unknown option are left out and put in unknown_locations."""
+        reachable = []
+        for name in self.locations.keys() if names is None else names:
+            try:
+                if self.can_reach_location(name):
+                    reachable.append(name)
+            except UnknownOption:
+                self.unknown_locations.add(name)
+        return reachable
+
+
+class ClientWorld:
+    """Stands in for the ManualWorld in requires functions called by the client"""
+
+    def __init__(self, logic: ClientLogic, options: Mapping[str, Any], option_names: Optional[Iterable[str]] = None):
+        self.logic = logic
+        self.player = logic.player
+        self.item_name_to_item = logic.items
+        self.location_name_to_location = logic.locations
+        self.item_name_groups = {category: set(names) for category, names in logic.category_items.items()}
+        self.options = ClientOptions(options, option_names)
+
+    def get_item_counts(self, player: Optional[int] = None, reset: bool = False) -> dict[str, int]:
+        return self.logic.item_counts
+
+
+class ClientOptions:
+    """Stands in for the options of the world, with the values of the slot data.
+    Options it doesn't have raise UnknownOption, unless option_names tells they don't exist at all."""
+
+    def __init__(self, options: Mapping[str, Any], option_names: Optional[Iterable[str]] = None):
+        self._option_names = set(option_names) if option_names is not None else None
+        for name, value in options.items():
+            setattr(self, name, SimpleNamespace(value=value))
+
+    def __getattr__(self, name: str):
+        # only called for the options that weren't set
+        if name.startswith("_") or (self._option_names is not None and name not in self._option_names):
+            raise AttributeError(name)
+        raise UnknownOption(f"The option {name} isn't in the slot data")
+
+
+class ClientState:
+    """Stands in for the CollectionState in requires functions called by the client, answering from the received items"""
+
+    def __init__(self, logic: ClientLogic):
+        self.logic = logic
+
+    @property
+    def prog_items(self) -> dict[int, Counter]:
+        return {self.logic.player: self.logic.prog_items}
+
+    def count(self, item: str, player: int) -> int:
+        return self.logic.count(item)
+
+    def has(self, item: str, player: int, count: int = 1) -> bool:
+        return self.logic.count(item) >= count
+
+    def has_all(self, items: Iterable[str], player: int) -> bool:
+        return all(self.logic.count(item) for item in items)
+
+    def has_any(self, items: Iterable[str], player: int) -> bool:
+        return any(self.logic.count(item) for item in items)
+
+    def has_all_counts(self, item_counts: Mapping[str, int], player: int) -> bool:
+        return all(self.logic.count(item) >= count for item, count in item_counts.items())
+
+    def has_group(self, item_name_group: str, player: int, count: int = 1) -> bool:
+        return sum(self.logic.count(item) for item in self.logic.category_items.get(item_name_group, [])) >= count
+
+    def can_reach_region(self, region: str, player: int) -> bool:
+        return self.logic.can_reach_region(region)
+
+    def can_reach_location(self, location: str, player: int) -> bool:
+        return self.logic.can_reach_location(location)
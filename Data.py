@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import os
@@ -22,6 +23,13 @@ def load_data_file(*args) -> dict:
 
     return filedata
 
+def get_table_hash(*tables) -> str:
+    """Returns a hash of the content of the given tables, to tell if two copies of a manual's data are the same"""
+    table_hash = hashlib.sha256()
+    for table in tables:
+        table_hash.update(json.dumps(table, sort_keys=True, default=str).encode())
+    return table_hash.hexdigest()
+
 game_table = load_data_file('game.json')
 item_table = load_data_file('items.json')
 location_table = load_data_file('locations.json')
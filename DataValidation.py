@@ -1,6 +1,7 @@
 import logging
 import re
 import json
+from collections import Counter
 from worlds.AutoWorld import World
 from BaseClasses import MultiWorld, ItemClassification
 
@@ -236,6 +237,8 @@ class DataValidation():
         if values_requested:
 
             # get all the available values with total count
+            from .Items import get_item_value_totals
+            progression_counts = {}
             for item in DataValidation.item_table:
                 # if the item is already progression, no need to check
                 if not item.get("progression") and not item.get("progression_skip_balancing"):
@@ -245,10 +248,9 @@ class DataValidation():
                 if item_count is None: #check with none because 0 == false
                     item_count = '1'
 
-                for key, count in item.get("value", {}).items():
-                    if not values_available.get(key.lower().strip()):
-                        values_available[key] = 0
-                    values_available[key] += int(count) * int(item_count)
+                progression_counts[item["name"]] = progression_counts.get(item["name"], 0) + int(item_count)
+
+            values_available = get_item_value_totals(progression_counts, values_requested.keys())
 
             # compare whats available vs requested
             errors = []
@@ -260,7 +262,7 @@ class DataValidation():
 
     @staticmethod
     def preFillCheckIfEnoughItemsForValue(world: World, multiworld: MultiWorld):
-        from .Helpers import get_items_with_value, get_items_for_player
+        from .Items import get_item_value_totals
         player = world.player
         values_requested = {}
 
@@ -282,17 +284,12 @@ class DataValidation():
         # compare whats available vs requested but only if there's anything requested
         if values_requested:
             errors = []
-            existing_items = [item for item in get_items_for_player(multiworld, player) if item.code is not None and
-                        item.classification == ItemClassification.progression or item.classification == ItemClassification.progression_skip_balancing]
+            progression_counts = Counter(item.name for item in multiworld.get_items() if item.player == player and item.code is not None and
+                        item.classification in (ItemClassification.progression, ItemClassification.progression_skip_balancing))
+            values_available = get_item_value_totals(progression_counts, values_requested.keys())
 
             for value, val_count in values_requested.items():
-                items_value = get_items_with_value(world, multiworld, value, player, True)
-                found_count = 0
-                if items_value:
-                    for item in existing_items:
-                        if item.name in items_value:
-                            found_count += items_value[item.name]
-
+                found_count = values_available[value]
                 if found_count < val_count:
                     errors.append(f"   '{value}': {found_count} out of the {val_count} {value} worth of progression items required can be found.")
             if errors:
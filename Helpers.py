@@ -2,12 +2,19 @@ from BaseClasses import MultiWorld, Item
 from typing import Optional, List
 from worlds.AutoWorld import World
 from .Data import category_table
-from .Items import ManualItem
+from .Items import ManualItem, item_value_columns, value_item_names
 from .Locations import ManualLocation
-from .hooks.Helpers import before_is_category_enabled, before_is_item_enabled, before_is_location_enabled
+from .Hooks import Hook, register_hook_module
+from .hooks import Helpers as helper_hooks
 
 from typing import Union
 
+register_hook_module("Helpers", helper_hooks)
+
+before_is_category_enabled = Hook("Helpers", "before_is_category_enabled", "first")
+before_is_item_enabled = Hook("Helpers", "before_is_item_enabled", "first")
+before_is_location_enabled = Hook("Helpers", "before_is_location_enabled", "first")
+
 def is_option_enabled(multiworld: MultiWorld, player: int, name: str) -> bool:
     return get_option_value(multiworld, player, name) > 0
 
@@ -29,9 +36,17 @@ def clamp(value, min, max):
 
 def is_category_enabled(multiworld: MultiWorld, player: int, category_name: str) -> bool:
     """Check if a category has been disabled by a yaml option."""
-    hook_result = before_is_category_enabled(multiworld, player, category_name)
-    if hook_result is not None:
-        return hook_result
+    enabled_categories = getattr(multiworld.worlds[player], "enabled_categories", None)
+    if enabled_categories is not None:
+        if category_name in enabled_categories:
+            return True
+        if category_name in multiworld.worlds[player].disabled_categories:
+            return False
+
+    if before_is_category_enabled:
+        hook_result = before_is_category_enabled(multiworld, player, category_name)
+        if hook_result is not None:
+            return hook_result
 
     category_data = category_table.get(category_name, {})
     if "yaml_option" in category_data:
@@ -55,9 +70,15 @@ def is_item_name_enabled(multiworld: MultiWorld, player: int, item_name: str) ->
 
 def is_item_enabled(multiworld: MultiWorld, player: int, item: ManualItem) -> bool:
     """Check if an item has been disabled by a yaml option."""
-    hook_result = before_is_item_enabled(multiworld, player, item)
-    if hook_result is not None:
-        return hook_result
+    world = multiworld.worlds[player]
+    enabled_items = getattr(world, "enabled_items", None)
+    if enabled_items is not None and world.item_name_to_item.get(item.get("name")) is item:
+        return item["name"] in enabled_items
+
+    if before_is_item_enabled:
+        hook_result = before_is_item_enabled(multiworld, player, item)
+        if hook_result is not None:
+            return hook_result
 
     return _is_manualobject_enabled(multiworld, player, item)
 
@@ -71,9 +92,15 @@ def is_location_name_enabled(multiworld: MultiWorld, player: int, location_name:
 
 def is_location_enabled(multiworld: MultiWorld, player: int, location: ManualLocation) -> bool:
     """Check if a location has been disabled by a yaml option."""
-    hook_result = before_is_location_enabled(multiworld, player, location)
-    if hook_result is not None:
-        return hook_result
+    world = multiworld.worlds[player]
+    enabled_locations = getattr(world, "enabled_locations", None)
+    if enabled_locations is not None and world.location_name_to_location.get(location.get("name")) is location:
+        return location["name"] in enabled_locations
+
+    if before_is_location_enabled:
+        hook_result = before_is_location_enabled(multiworld, player, location)
+        if hook_result is not None:
+            return hook_result
 
     return _is_manualobject_enabled(multiworld, player, location)
 
@@ -89,6 +116,28 @@ def _is_manualobject_enabled(multiworld: MultiWorld, player: int, object: any) -
 
     return enabled
 
+def set_enabled_content(world: World):
+    """Work out once which categories, items and locations are enabled for the world's player, so the is_*_enabled helpers can look them up.\n
+    Must be called after options are resolved. The before_is_*_enabled hooks are evaluated here, once per category, item and location.
+    """
+    multiworld, player = world.multiworld, world.player
+    world.enabled_categories = world.disabled_categories = world.enabled_items = world.enabled_locations = None
+
+    category_names = set(category_table.keys())
+    for manual_object in [*world.item_name_to_item.values(), *world.location_name_to_location.values()]:
+        category_names.update(manual_object.get("category", []))
+
+    enabled_categories = frozenset(category for category in category_names if is_category_enabled(multiworld, player, category))
+    world.enabled_categories = enabled_categories
+    world.disabled_categories = frozenset(category_names - enabled_categories)
+
+    world.enabled_items = frozenset(name for name, item in world.item_name_to_item.items() if is_item_enabled(multiworld, player, item))
+    world.enabled_locations = frozenset(name for name, location in world.location_name_to_location.items() if is_location_enabled(multiworld, player, location))
+
+def clear_enabled_content(world: World):
+    """Drop the precomputed enabled content, eg. after options were changed"""
+    world.enabled_categories = world.disabled_categories = world.enabled_items = world.enabled_locations = None
+
 def get_items_for_player(multiworld: MultiWorld, player: int) -> List[Item]:
     """Return list of items of a player including placed items"""
     return [i for i in multiworld.get_items() if i.player == player]
@@ -101,11 +150,6 @@ def get_items_with_value(world: World, multiworld: MultiWorld, value: str, playe
     if player is None:
         player = world.player
 
-    player_items = get_items_for_player(multiworld, player)
-    # Just a small check to prevent caching {} if items don't exist yet
-    if not player_items:
-        return {value: -1}
-
     value = value.lower().strip()
 
     if not hasattr(world, 'item_values'): #Cache of just the item values
@@ -115,8 +159,12 @@ def get_items_with_value(world: World, multiworld: MultiWorld, value: str, playe
         world.item_values[player] = {}
 
     if value not in world.item_values.get(player, {}).keys() or force:
-        item_with_values = {i.name: world.item_name_to_item[i.name]['value'].get(value, 0)
-                            for i in player_items if i.code is not None
-                            and i.name in world.item_name_groups.get(f'has_{value}_value', [])}
-        world.item_values[player][value] = item_with_values
+        item_counts = world.get_item_counts(player, reset=force)
+        # Just a small check to prevent caching {} if items don't exist yet
+        if not item_counts:
+            return {value: -1}
+
+        column = item_value_columns.get(value, ())
+        world.item_values[player][value] = {item_name: amount for item_name, amount in zip(value_item_names, column)
+                                            if amount and item_name in item_counts}
     return world.item_values[player].get(value)
@@ -0,0 +1,127 @@
+import dis
+from types import ModuleType
+from typing import Callable
+
+from .Instrumentation import instrumentation_enabled, instrument_hook
+
+######################################################################################
+## Dispatch for the functions in hooks/*.py.
+##
+## Each Hook calls the function of the same name from every module registered for its
+## group ("World", "Helpers", "Data", ...), in the order the modules were registered.
+## Functions left the way they come in hooks/ (returning their first argument, None or
+## False and nothing else) or marked with @noop_hook are left out when the hook is built,
+## and a Hook without any function left is falsy, so hot paths can skip it entirely.
+######################################################################################
+
+hook_kinds = ("filter", "first", "any", "notify")
+
+# modules registered for each group of hooks, in calling order
+hook_modules: dict[str, list[ModuleType]] = {}
+_hooks: list["Hook"] = []
+
+
+def noop_hook(func: Callable) -> Callable:
+    """Mark a hook function as doing nothing, so it is never called.\n
+    Only needed when its body isn't trivial, eg. it was left with some logging in it."""
+    func.manual_noop_hook = True
+    return func
+
+def _hook_instructions(func: Callable) -> list[tuple]:
+    return [(i.opname, i.argval if i.opname.endswith("CONST") else i.arg)
+            for i in dis.get_instructions(func) if i.opname not in ("RESUME", "NOP")]
+
+def _return_first_argument(value, *args):
+    return value
+
+def _return_none(*args):
+    return None
+
+def _return_false(*args):
+    return False
+
+# for each kind of hook, the bodies that leave the result as if the hook didn't exist
+_noop_bodies = {
+    "filter": [_return_first_argument],
+    "first": [_return_none],
+    "any": [_return_none, _return_false],
+    "notify": [_return_none, _return_false, _return_first_argument],
+}
+
+def is_noop_hook(func: Callable, kind: str = "filter") -> bool:
+    """Check if calling func as a hook of that kind would change nothing, like the unmodified hooks in hooks/"""
+    if getattr(func, "manual_noop_hook", False):
+        return True
+
+    try:
+        instructions = _hook_instructions(func)
+    except TypeError:
+        return False
+    return any(instructions == _hook_instructions(body) for body in _noop_bodies[kind])
+
+def register_hook_module(group: str, module: ModuleType):
+    """Add a module of hooks to a group, after the ones already registered. Hooks of that group pick it up right away."""
+    modules = hook_modules.setdefault(group, [])
+    if module in modules:
+        return
+
+    modules.append(module)
+    for hook in _hooks:
+        if hook.group == group:
+            hook.refresh()
+
+
+class Hook:
+    """A hook point, calling every registered implementation of name in its group.\n
+    kind is how the results combine:\n
+        'filter': each gets the previous result as its first argument, the last result is returned\n
+        'first': the first result that isn't None is returned, or None\n
+        'any': all of them are called, True is returned if any returned something truthy\n
+        'notify': all of them are called, None is returned
+    """
+
+    def __init__(self, group: str, name: str, kind: str):
+        if kind not in hook_kinds:
+            raise ValueError(f"Unknown kind of hook '{kind}' for {name}, must be one of {', '.join(hook_kinds)}.")
+
+        self.group = group
+        self.name = name
+        self.kind = kind
+        self.implementations: tuple[Callable, ...] = ()
+        self.refresh()
+        _hooks.append(self)
+
+    def refresh(self):
+        implementations = []
+        for module in hook_modules.get(self.group, []):
+            func = getattr(module, self.name, None)
+            if callable(func) and not is_noop_hook(func, self.kind):
+                if instrumentation_enabled:
+                    func = instrument_hook(f"{module.__name__.rpartition('.')[2]}.{self.name}", func)
+                implementations.append(func)
+        self.implementations = tuple(implementations)
+
+    def __bool__(self) -> bool:
+        return bool(self.implementations)
+
+    def __repr__(self) -> str:
+        return f"Hook({self.group}.{self.name}, {self.kind}, {len(self.implementations)} implementation(s))"
+
+    def __call__(self, *args):
+        if self.kind == "filter":
+            value = args[0]
+            for func in self.implementations:
+                value = func(value, *args[1:])
+            return value
+
+        if self.kind == "first":
+            for func in self.implementations:
+                result = func(*args)
+                if result is not None:
+                    return result
+            return None
+
+        results = [func(*args) for func in self.implementations]
+        if self.kind == "any":
+            return any(results)
+        return None
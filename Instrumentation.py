@@ -0,0 +1,180 @@
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from typing import Callable
+
+from .Game import game_name
+from .Meta import enable_instrumentation
+
+######################################################################################
+## Opt-in timing and memory measurements of generation, for this manual.
+##
+## Turn it on with "enable_instrumentation": true in meta.json, or by setting the
+## MANUAL_INSTRUMENTATION environment variable to 1 before generating.
+## Every instrumented stage of every slot is logged as it ends, and once all slots of this
+## manual are done a json report is written to logs/<game>_instrumentation_<seed>.json.
+## A stage that raises writes what was measured so far right away, and a report still
+## unwritten when the process exits (like when generation failed elsewhere) is written then.
+##
+## When turned off, instrumented_stage returns the stage unchanged and hooks aren't wrapped.
+## Memory is measured with tracemalloc, which slows generation down noticeably while on.
+## Instrumented stages run one at a time, but generate_output and fill_slot_data run in
+## threads next to the other games' output, so their memory is marked as shared with them.
+## Top allocations are compared with the snapshot taken when the previous instrumented stage
+## ended, so they include what ran in between.
+######################################################################################
+
+instrumentation_enabled = enable_instrumentation or os.environ.get("MANUAL_INSTRUMENTATION", "").lower() in ("1", "true", "yes")
+
+# the final stages of a slot, the report is written once every slot has done them.
+# They run in threads, so the traced memory of other games' output is in theirs too.
+_last_stages = ("fill_slot_data", "generate_output")
+_top_allocations = 5
+
+# (calls, seconds) of every hook implementation so far, by "Group.hook_name"
+hook_totals: dict[str, list] = {}
+# per seed, then per player, what was measured
+seed_reports: dict[str, dict] = {}
+# generate_output and fill_slot_data run in threads of their own, this guards hook_totals and seed_reports
+_lock = threading.Lock()
+# held for the whole of an instrumented stage, so the peak tracemalloc resets isn't shared between them
+_stage_lock = threading.RLock()
+# taken when the last instrumented stage ended, what the next one's allocations are compared with
+_last_snapshot = None
+
+
+def instrument_hook(name: str, func: Callable) -> Callable:
+    """Wrap a hook implementation so its calls and time are added to hook_totals under name"""
+    totals = hook_totals.setdefault(name, [0, 0.0])
+
+    @functools.wraps(func)
+    def timed_hook(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            with _lock:
+                totals[0] += 1
+                totals[1] += seconds
+
+    return timed_hook
+
+def _get_hook_totals() -> dict[str, tuple]:
+    with _lock:
+        return {name: tuple(totals) for name, totals in hook_totals.items()}
+
+def instrumented_stage(stage: Callable) -> Callable:
+    """Decorate a ManualWorld stage to time it and measure what it allocates, when instrumentation is on"""
+    if not instrumentation_enabled:
+        return stage
+
+    @functools.wraps(stage)
+    def measured_stage(world, *args, **kwargs):
+        with _stage_lock:
+            return _measure_stage(stage, world, *args, **kwargs)
+
+    return measured_stage
+
+def _measure_stage(stage: Callable, world, *args, **kwargs):
+    global _last_snapshot
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if _last_snapshot is None:
+        _last_snapshot = tracemalloc.take_snapshot()
+
+    hooks_before = _get_hook_totals()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    error = None
+    try:
+        return stage(world, *args, **kwargs)
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        memory_after, memory_peak = tracemalloc.get_traced_memory()
+        snapshot_before, _last_snapshot = _last_snapshot, tracemalloc.take_snapshot()
+
+        measurement = {
+            "seconds": seconds,
+            "memory_allocated": memory_after - memory_before,
+            "memory_peak": memory_peak - memory_before,
+            "top_allocations": [
+                {"line": str(stat.traceback), "size": stat.size_diff, "count": stat.count_diff}
+                for stat in _last_snapshot.compare_to(snapshot_before, "lineno")[:_top_allocations]
+            ],
+            "hooks": {},
+        }
+        if stage.__name__ in _last_stages:
+            measurement["memory_shared"] = True
+        if error is not None:
+            measurement["error"] = f"{type(error).__name__}: {error}"
+        for name, (calls, hook_seconds) in _get_hook_totals().items():
+            calls_before, seconds_before = hooks_before.get(name, (0, 0.0))
+            if calls > calls_before:
+                measurement["hooks"][name] = {"calls": calls - calls_before, "seconds": hook_seconds - seconds_before}
+
+        _record_stage(world, stage.__name__, measurement)
+
+def _record_stage(world, stage_name: str, measurement: dict):
+    multiworld, player = world.multiworld, world.player
+    player_name = multiworld.player_name.get(player, str(player))
+    seed_name = str(multiworld.seed_name)
+
+    logging.info(f"[{game_name}] {player_name} {stage_name}: {measurement['seconds']:.4f}s, "
+                 f"{measurement['memory_allocated'] / 1024:.0f} KiB kept, {measurement['memory_peak'] / 1024:.0f} KiB peak" +
+                 (" (shared with other output)" if measurement.get("memory_shared") else "") +
+                 "".join(f", {name} {hook['seconds']:.4f}s over {hook['calls']} call(s)" for name, hook in measurement["hooks"].items()))
+
+    with _lock:
+        report = seed_reports.setdefault(seed_name, {"game": game_name, "seed": seed_name, "players": {}})
+        player_report = report["players"].setdefault(str(player), {"name": player_name, "stages": {}})
+        player_report["stages"][stage_name] = measurement
+
+        players_done = all(
+            all(stage in report["players"].get(str(game_player), {}).get("stages", {}) for stage in _last_stages)
+            for game_player in multiworld.get_game_players(game_name)
+        )
+        if players_done and not report.get("written"):
+            report["written"] = True
+            write_instrumentation_report(seed_name)
+        elif "error" in measurement:
+            # generation stops here, so what was measured so far is all there will be
+            _try_write_report(seed_name)
+
+def _try_write_report(seed_name: str):
+    """Write a report without raising, for when generation is failing or the process is exiting"""
+    try:
+        write_instrumentation_report(seed_name)
+    except Exception as e:
+        logging.warning(f"[{game_name}] Couldn't write the instrumentation report of seed {seed_name}: {e}")
+
+def _write_unwritten_reports():
+    with _lock:
+        for seed_name, report in seed_reports.items():
+            if not report.get("written"):
+                report["written"] = True
+                _try_write_report(seed_name)
+
+if instrumentation_enabled:
+    atexit.register(_write_unwritten_reports)
+
+def write_instrumentation_report(seed_name: str) -> str:
+    """Write what was measured for a seed as json in the logs folder and return the file's path"""
+    from Utils import user_path
+
+    report = {key: value for key, value in seed_reports[seed_name].items() if key != "written"}
+    path = user_path("logs", f"{game_name}_instrumentation_{seed_name}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    logging.info(f"[{game_name}] Instrumentation report written to {path}")
+    return path
@@ -1,4 +1,8 @@
-from BaseClasses import Item
+from array import array
+from functools import lru_cache
+from operator import mul
+from typing import Iterable, Optional
+from BaseClasses import Item, ItemClassification
 from .Data import item_table
 from .Game import filler_item_name, starting_index
 from .hooks.Items import before_item_table_processed
@@ -52,6 +56,84 @@ item_id_to_name[None] = "__Victory__"
 item_name_to_id = {name: id for id, name in item_id_to_name.items()}
 
 
+def get_item_value_key(value_name: str) -> str:
+    """Name under which the running total of a value is kept in CollectionState.prog_items"""
+    return f"__Manual Value: {value_name.lower().strip()}__"
+
+######################
+# Item value matrix
+######################
+
+# One row per item that has a 'value', one column per value type (lowercased and stripped),
+# stored column by column so a value total is a dot product of that column with a vector of item counts.
+value_item_names: list[str] = [item_name for item_name, item in item_name_to_item.items() if item.get("value")]
+value_item_index: dict[str, int] = {item_name: row for row, item_name in enumerate(value_item_names)}
+item_value_names: list[str] = sorted({value_name.lower().strip() for item_name in value_item_names
+                                      for value_name in item_name_to_item[item_name]["value"].keys()})
+item_value_columns: dict[str, array] = {value_name: array("q", bytes(8 * len(value_item_names))) for value_name in item_value_names}
+
+for row, item_name in enumerate(value_item_names):
+    for value_name, amount in item_name_to_item[item_name]["value"].items():
+        item_value_columns[value_name.lower().strip()][row] += int(amount)
+
+# every item with a 'value', as a list of (prog_items key, amount) that collecting one copy of it adds
+item_name_to_value_keys: dict[str, list[tuple[str, int]]] = {
+    item_name: [(get_item_value_key(value_name), column[row]) for value_name, column in item_value_columns.items() if column[row]]
+    for row, item_name in enumerate(value_item_names)
+}
+
+def get_item_count_vector(item_counts: dict[str, int]) -> array:
+    """Turn a dict of item name to count into a vector lined up with the rows of the value matrix"""
+    return array("q", (item_counts.get(item_name, 0) for item_name in value_item_names))
+
+def get_item_value_totals(item_counts: dict[str, int], value_names: Optional[Iterable[str]] = None) -> dict[str, int]:
+    """Return the total of every value type (or just those in value_names) for a multiset of items,
+    given as a dict of item name to count. Value types no item has are totalled as 0."""
+    counts = get_item_count_vector(item_counts)
+    if value_names is None:
+        value_names = item_value_names
+
+    totals = {}
+    for value_name in value_names:
+        value_name = value_name.lower().strip()
+        column = item_value_columns.get(value_name)
+        totals[value_name] = sum(map(mul, column, counts)) if column is not None else 0
+    return totals
+
+
+@lru_cache(maxsize=None)
+def get_item_names_in_categories(categories: tuple[str, ...]) -> frozenset[str]:
+    """Return the names of every item that has any of the categories. Cached per unique tuple of categories."""
+    item_names = set()
+    for category in categories:
+        item_names.update(item_name_groups.get(category, []))
+    return frozenset(item_names)
+
+@lru_cache(maxsize=None)
+def get_forbidden_item_names(item_names: tuple[str, ...], categories: tuple[str, ...]) -> frozenset[str]:
+    """Return the names forbidden by a location's dont_place_item and dont_place_item_category.
+    Cached, so locations with the same constraints share the same set."""
+    return frozenset(item_names) | get_item_names_in_categories(categories)
+
+def get_item_classification(item: dict) -> ItemClassification:
+    """Return the ItemClassification matching the flags of an item from items.json"""
+    classification = ItemClassification.filler
+
+    if "trap" in item and item["trap"]:
+        classification = ItemClassification.trap
+
+    if "useful" in item and item["useful"]:
+        classification = ItemClassification.useful
+
+    if "progression" in item and item["progression"]:
+        classification = ItemClassification.progression
+
+    if "progression_skip_balancing" in item and item["progression_skip_balancing"]:
+        classification = ItemClassification.progression_skip_balancing
+
+    return classification
+
+
 ######################
 # Item classes
 ######################
@@ -59,3 +141,53 @@ item_name_to_id = {name: id for id, name in item_id_to_name.items()}
 
 class ManualItem(Item):
     game = "Manual"
+
+
+class ManualItemPool:
+    """Multiset of pool items keyed by item name, with category-filtered views.\n
+    Items are kept in pool order, and removed like list.remove does (the first equal item) in O(1).
+    Hooks still receive plain lists, use to_list() at those boundaries.
+    """
+
+    def __init__(self, items: Iterable[Item] = ()):
+        # insertion index -> item, in pool order
+        self.items: dict[int, Item] = {}
+        # insertion indexes of the items of each name, in pool order
+        self.indexes_by_name: dict[str, dict[int, None]] = {}
+        self.next_index = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def append(self, item: Item):
+        self.items[self.next_index] = item
+        self.indexes_by_name.setdefault(item.name, {})[self.next_index] = None
+        self.next_index += 1
+
+    def extend(self, items: Iterable[Item]):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: Item):
+        indexes = self.indexes_by_name.get(item.name, {})
+        index = next((index for index in indexes if self.items[index] == item), None)
+        if index is None:
+            raise ValueError(f"{item} is not in the item pool")
+        del indexes[index]
+        del self.items[index]
+
+    def count(self, item_name: str) -> int:
+        return len(self.indexes_by_name.get(item_name, {}))
+
+    def items_named(self, item_names: Iterable[str]) -> list[Item]:
+        """Return every pool item whose name is in item_names, in pool order."""
+        indexes = [index for name in set(item_names) for index in self.indexes_by_name.get(name, {})]
+        return [self.items[index] for index in sorted(indexes)]
+
+    def items_in_categories(self, categories: Iterable[str]) -> list[Item]:
+        """Return every pool item that has any of the categories, in pool order."""
+        return self.items_named(get_item_names_in_categories(tuple(categories)))
+
+    def to_list(self) -> list[Item]:
+        return list(self.items.values())
@@ -52,6 +52,12 @@ for item in location_table:
 # location_id_to_name[None] = "__Manual Game Complete__"
 location_name_to_id = {name: id for id, name in location_id_to_name.items()}
 
+# locations that restrict which items can be placed at them, so generation doesn't have to search for them every time
+location_name_to_forbid: dict[str, dict] = {name: location for name, location in location_name_to_location.items()
+                                            if "dont_place_item" in location or "dont_place_item_category" in location}
+location_name_to_placement: dict[str, dict] = {name: location for name, location in location_name_to_location.items()
+                                               if "place_item" in location or "place_item_category" in location}
+
 ######################
 # Location classes
 ######################
@@ -0,0 +1,394 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, Union
+
+from .ClientLogic import ClientLogic, CompiledRequires
+from .Helpers import get_option_value
+from .Items import get_item_value_key
+from .Locations import victory_names
+
+if TYPE_CHECKING:
+    from . import ManualWorld
+
+######################################################################################
+## What each location needs, worked out at generation for clients and trackers that can't
+## run requires functions themselves.
+##
+## Every location's requires, its region's, and what it takes to reach that region are
+## expanded into the smallest sets of items that put it in logic: a list of clauses, any one
+## of which is enough. Option checks and OptOne/OptAll are already decided for the player.
+## A clause needs a number of an item, or a total over a group of items (a category, or the
+## amounts of a value for ItemValue). Locations whose requires can't be written that way,
+## like ones using other functions or "!", are left out.
+##
+## It's written to the .apmanual file unless "include_logic_summary" is false in meta.json.
+## Item and group references are item ids and negative group indexes:
+##   {"groups": [[[item id, weight], ...], ...],
+##    "locations": {location id: [[[item id or -(group index + 1), count], ...], ...]},
+##    "goal": [...]}
+######################################################################################
+
+# a location needing more clauses than this is left out
+max_clauses = 256
+# starts the name of the |items| that function results which are summaries are put in the requires as
+_pasted_marker = "\0summary "
+
+Clause = dict # key (item name, or ("category"/"value", name)) -> count needed
+Summary = list[Clause]
+
+always: Summary = [{}]
+never: Summary = []
+
+
+class Unsummarizable(Exception):
+    """These requires can't be written as sets of items"""
+
+
+class LogicSummaryBuilder:
+    """Expands the requires of a generated slot into clauses of items"""
+
+    def __init__(self, world: "ManualWorld"):
+        self.world = world
+        self.logic = ClientLogic.from_world(world)
+        # the most of each item the player can have, what clauses needing more are dropped against
+        self.obtainable = Counter(self.logic.item_counts)
+        self.obtainable.update(item.name for item in world.multiworld.precollected_items[world.player])
+        self.reachable: dict[str, Summary] = {}
+        self.unknown_regions: set[str] = set()
+        self._locations_in_progress: set[str] = set()
+        self._empty_state = None
+
+    ######################
+    # Clauses
+    ######################
+
+    def pool_total(self, key) -> int:
+        """How much of an item or group the player can have in all"""
+        if isinstance(key, str):
+            return self.obtainable[key]
+        group_type, name = key
+        return sum(self.obtainable[item_name] * weight for item_name, weight in self.group_weights(group_type, name))
+
+    def group_weights(self, group_type: str, name: str) -> list[tuple[str, int]]:
+        if group_type == "category":
+            return [(item_name, 1) for item_name in self.logic.category_items.get(name, [])]
+        key = get_item_value_key(name)
+        return [(item_name, amount) for item_name, value_keys in self.logic.item_value_keys.items() for found_key, amount in value_keys if found_key == key]
+
+    def need(self, key, count: int) -> Summary:
+        if count <= 0:
+            return always
+        return [{key: count}] if count <= self.pool_total(key) else never
+
+    def both(self, a: Summary, b: Summary) -> Summary:
+        if not a or not b:
+            return never
+
+        # the product is capped as it's built, so wide requires give up before minimizing instead of after
+        clauses = {}
+        for a_clause in a:
+            for b_clause in b:
+                clause = dict(a_clause)
+                for key, count in b_clause.items():
+                    if clause.get(key, 0) < count:
+                        clause[key] = count
+                if any(count > self.pool_total(key) for key, count in clause.items()):
+                    continue
+                clauses[frozenset(clause.items())] = clause
+                if len(clauses) > max_clauses:
+                    raise Unsummarizable(f"more than {max_clauses} ways to meet them")
+        return self.minimize(list(clauses.values()))
+
+    def either(self, a: Summary, b: Summary) -> Summary:
+        return self.minimize(a + b)
+
+    def minimize(self, clauses: list[Clause]) -> Summary:
+        """Drop the clauses another one already covers, and the ones the player can't meet"""
+        result = []
+        for clause in sorted(clauses, key=lambda clause: (len(clause), sum(clause.values()))):
+            if any(_covers(clause, kept) for kept in result):
+                continue
+            if any(count > self.pool_total(key) for key, count in clause.items()):
+                continue
+            result.append(clause)
+
+        if len(result) > max_clauses:
+            raise Unsummarizable(f"more than {max_clauses} ways to meet them")
+        return result
+
+    ######################
+    # Requires
+    ######################
+
+    def summarize_requires(self, area: Optional[dict]) -> Summary:
+        """What meets the requires of an area, like fullLocationOrRegionCheck of Rules.py"""
+        if not area or "requires" not in area.keys():
+            return always
+
+        requires = area["requires"]
+        if isinstance(requires, str):
+            return self.summarize_compiled(self.logic.compile(requires, area), area)
+        return self.summarize_list(requires)
+
+    def summarize_list(self, requires: Iterable) -> Summary:
+        # an or group that's met is enough on its own, otherwise every plain item is needed
+        plain = always
+        groups = never
+        for item in requires:
+            if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or isinstance(item, list):
+                group = always
+                for or_item in item["or"] if isinstance(item, dict) else item:
+                    group = self.both(group, self._summarize_list_item(or_item))
+                groups = self.either(groups, group)
+            else:
+                plain = self.both(plain, self._summarize_list_item(item))
+        return self.either(plain, groups)
+
+    def _summarize_list_item(self, item: str) -> Summary:
+        item_parts = item.split(":")
+        if len(item_parts) > 1:
+            try:
+                return self.need(item_parts[0], int(item_parts[1]))
+            except ValueError as e:
+                raise Unsummarizable(f"invalid count in {item}") from e
+        return self.need(item, 1)
+
+    def summarize_compiled(self, compiled: CompiledRequires, area: Any = None, pasted: Optional[list[Summary]] = None) -> Summary:
+        if compiled.functions:
+            # results are put in the text like Rules.py does, summaries as an |item| of their own where a 1 or 0 would go
+            pasted = []
+            results = []
+            for name, func, args, _ in compiled.functions:
+                result = self.summarize_function(name, func, args)
+                if isinstance(result, list):
+                    results.append(f"|{_pasted_marker}{len(pasted)}|")
+                    pasted.append(result)
+                else:
+                    results.append(result)
+            text = self.logic.paste_results(compiled, results)
+            return self.summarize_compiled(self.logic.compile(text, area, with_functions=False), area, pasted)
+
+        if compiled.error is not None:
+            raise Unsummarizable(str(compiled.error))
+
+        stack = []
+        for token in compiled.postfix:
+            if token is True:
+                stack.append(always)
+            elif not isinstance(token, str):
+                require_type, item_name, item_names, item_count = compiled.sources[token]
+                if pasted is not None and item_name.startswith(_pasted_marker):
+                    stack.append(pasted[int(item_name[len(_pasted_marker):])])
+                elif require_type == "category":
+                    # Rules.py never meets a category without items
+                    stack.append(self.need(("category", item_name), item_count) if item_names else never)
+                else:
+                    stack.append(self.need(item_name, item_count))
+            elif token == "0":
+                stack.append(never)
+            elif token == "1":
+                stack.append(always)
+            elif token == "&":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                stack.append(self.both(op1, op2))
+            elif token == "|":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                stack.append(self.either(op1, op2))
+            elif token == "!":
+                raise Unsummarizable("! can't be written as items that are needed")
+        return stack.pop()
+
+    def summarize_function(self, name: str, func: Optional[Callable], args: list[str]) -> Union[bool, str, Summary]:
+        summarize = summary_functions.get(name)
+        if func is None or summarize is None:
+            raise Unsummarizable(f"{{{name}()}} can't be summarized")
+
+        try:
+            result = summarize(self, func, args)
+        except Unsummarizable:
+            raise
+        except Exception as e:
+            raise Unsummarizable(f"{{{name}()}} raised {e!r}") from e
+        return result
+
+    def call_function(self, func: Callable, args: list[str]) -> Any:
+        """Call a function whose result doesn't depend on the state"""
+        if self._empty_state is None:
+            from BaseClasses import CollectionState
+            self._empty_state = CollectionState(self.world.multiworld)
+        return func(self.world, self.world.multiworld, self._empty_state, self.world.player, *args)
+
+    ######################
+    # Reachability
+    ######################
+
+    def summarize_regions(self):
+        """Work out what reaches every region, going around until nothing changes since requires can ask about other regions"""
+        regions = self.logic.regions
+        self.reachable = {self.logic.root_region: always}
+        self.unknown_regions = set()
+
+        for _ in range(2 * len(regions) + 2):
+            changed = False
+            for region, data in regions.items():
+                if region not in self.reachable or region in self.unknown_regions:
+                    continue
+
+                exits = data.get("connects_to") or []
+                try:
+                    leaving = self.both(self.reachable[region], self.summarize_requires(data))
+                except Unsummarizable:
+                    leaving = None
+
+                for exit_region in exits:
+                    if exit_region in self.unknown_regions:
+                        continue
+                    if leaving is None:
+                        self.unknown_regions.add(exit_region)
+                        changed = True
+                        continue
+
+                    try:
+                        reachable = self.either(self.reachable.get(exit_region, never), leaving)
+                    except Unsummarizable:
+                        self.unknown_regions.add(exit_region)
+                        changed = True
+                        continue
+
+                    if exit_region not in self.reachable or _as_set(reachable) != _as_set(self.reachable[exit_region]):
+                        self.reachable[exit_region] = reachable
+                        changed = True
+            if not changed:
+                return
+
+        self.unknown_regions.update(regions.keys())
+
+    def summarize_region(self, name: str) -> Summary:
+        if name in self.unknown_regions:
+            raise Unsummarizable(f"what reaches {name} can't be summarized")
+        return self.reachable.get(name, never)
+
+    def summarize_location(self, name: str) -> Summary:
+        location = self.logic.locations.get(name)
+        if location is None:
+            return never
+        if name in self._locations_in_progress:
+            raise Unsummarizable(f"{name} needs itself")
+
+        self._locations_in_progress.add(name)
+        try:
+            region = location.get("region", "Manual")
+            summary = self.both(self.summarize_requires(location), self.summarize_requires(self.logic.regions.get(region)))
+            return self.both(self.summarize_region(region), summary)
+        finally:
+            self._locations_in_progress.discard(name)
+
+    ######################
+    # Slot data
+    ######################
+
+    def build(self) -> dict:
+        self.summarize_regions()
+
+        groups = []
+        group_indexes = {}
+
+        def encode_key(key) -> int:
+            if isinstance(key, str):
+                return self.world.item_name_to_id[key]
+            if key not in group_indexes:
+                group_indexes[key] = len(groups)
+                groups.append([[self.world.item_name_to_id[item_name], weight] for item_name, weight in self.group_weights(*key)])
+            return -(group_indexes[key] + 1)
+
+        def encode(summary: Summary) -> list:
+            return [sorted([encode_key(key), count] for key, count in clause.items()) for clause in summary]
+
+        locations = {}
+        for location in self.world.multiworld.get_locations(self.world.player):
+            if location.address is None:
+                continue
+            try:
+                locations[str(location.address)] = encode(self.summarize_location(location.name))
+            except (Unsummarizable, KeyError):
+                continue
+
+        summary = {"groups": groups, "locations": locations}
+        goal = victory_names[get_option_value(self.world.multiworld, self.world.player, "goal")]
+        try:
+            summary["goal"] = encode(self.summarize_location(goal))
+        except (Unsummarizable, KeyError):
+            pass
+        return summary
+
+
+def _covers(clause: Clause, other: Clause) -> bool:
+    """Does meeting clause always meet other"""
+    return all(key in clause and clause[key] >= count for key, count in other.items())
+
+def _as_set(summary: Summary) -> frozenset:
+    return frozenset(frozenset(clause.items()) for clause in summary)
+
+def _summarize_item_value(builder: LogicSummaryBuilder, func: Callable, args: list[str]) -> Summary:
+    args_list = args[0].split(":") if args else []
+    if not len(args_list) == 2 or not args_list[1].isnumeric():
+        raise Unsummarizable("ItemValue needs a number after :")
+    return builder.need(("value", args_list[0]), int(args_list[1].strip()))
+
+# How to summarize the functions used in requires, from the builder, the function and its arguments.
+# Return a bool, a requires string (put in the requires like Rules.py does) or a summary. Functions missing from here leave out the locations using them.
+summary_functions: dict[str, Callable[[LogicSummaryBuilder, Callable, list[str]], Union[bool, str, Summary]]] = {
+    # these only depend on the player's options and pool
+    "YamlEnabled": LogicSummaryBuilder.call_function,
+    "YamlDisabled": LogicSummaryBuilder.call_function,
+    "OptOne": LogicSummaryBuilder.call_function,
+    "OptAll": LogicSummaryBuilder.call_function,
+    "ItemValue": _summarize_item_value,
+    "canReachRegion": lambda builder, func, args: builder.summarize_region(args[0]),
+    "canReachLocation": lambda builder, func, args: builder.summarize_location(args[0]),
+}
+
+def build_logic_summary(world: "ManualWorld") -> dict:
+    """The logic summary of a generated slot, for its .apmanual file"""
+    return LogicSummaryBuilder(world).build()
+
+
+class LogicSummary:
+    """Reads the logic summary of an .apmanual file, for the items received so far"""
+
+    def __init__(self, summary: Mapping[str, Any]):
+        self.groups: list[list[tuple[int, int]]] = [[(item_id, weight) for item_id, weight in group] for group in summary.get("groups", [])]
+        self.locations: dict[int, list] = {int(location_id): clauses for location_id, clauses in summary.get("locations", {}).items()}
+        self.goal: Optional[list] = summary.get("goal")
+        self.counts: Mapping[int, int] = {}
+        self._group_totals: dict[int, int] = {}
+
+    def set_counts(self, counts: Mapping[int, int]) -> bool:
+        """Use counts (item id -> how many were received) from now on, returns False if they're the same as the current ones"""
+        if counts == self.counts:
+            return False
+        self.counts = counts
+        self._group_totals = {}
+        return True
+
+    def _total(self, reference: int) -> int:
+        if reference >= 0:
+            return self.counts.get(reference, 0)
+
+        total = self._group_totals.get(reference)
+        if total is None:
+            total = sum(self.counts.get(item_id, 0) * weight for item_id, weight in self.groups[-reference - 1])
+            self._group_totals[reference] = total
+        return total
+
+    def _is_met(self, clauses: list) -> bool:
+        return any(all(self._total(reference) >= count for reference, count in clause) for clause in clauses)
+
+    def is_location_in_logic(self, location_id: int) -> Optional[bool]:
+        """Whether the location is in logic, or None if it isn't in the summary"""
+        clauses = self.locations.get(location_id)
+        return None if clauses is None else self._is_met(clauses)
+
+    def is_goal_in_logic(self) -> Optional[bool]:
+        return None if self.goal is None else self._is_met(self.goal)
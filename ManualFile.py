@@ -0,0 +1,115 @@
+import json
+import zlib
+from base64 import b64encode, b64decode
+from typing import BinaryIO, Iterator
+
+######################################################################################
+## .apmanual files are base64 text, so older tools can still tell what they're looking at.
+##
+## Version 1 is the base64 of the client data json.
+## Version 2 is the base64 of a small header followed by the json, deflated when the
+## header's compressed flag is set. Both are written and read in chunks, so the full
+## json never has to exist as one string next to its encoded copies.
+######################################################################################
+
+apmanual_magic = b"APMANUAL"
+apmanual_version = 2
+apmanual_flag_compressed = 1
+
+_chunk_size = 3 * 64 * 1024 # a multiple of 3 so every chunk encodes to base64 without padding
+
+
+class _Base64Writer:
+    """Base64 encodes bytes as they are written, without holding on to more than one chunk."""
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.buffer = bytearray()
+
+    def write(self, data: bytes):
+        self.buffer += data
+        if len(self.buffer) >= _chunk_size:
+            cutoff = len(self.buffer) - len(self.buffer) % 3
+            self.file.write(b64encode(self.buffer[:cutoff]))
+            del self.buffer[:cutoff]
+
+    def close(self):
+        if self.buffer:
+            self.file.write(b64encode(self.buffer))
+            self.buffer.clear()
+
+
+def _iter_base64_decoded(file: BinaryIO) -> Iterator[bytes]:
+    pending = b""
+    while True:
+        chunk = file.read(_chunk_size // 3 * 4)
+        if not chunk:
+            break
+        pending += b"".join(chunk.split()) # tolerate line breaks added by editors
+        cutoff = len(pending) - len(pending) % 4
+        if cutoff:
+            yield b64decode(pending[:cutoff])
+            pending = pending[cutoff:]
+    if pending:
+        yield b64decode(pending)
+
+
+def _read_remaining(buffer: bytearray, chunks: Iterator[bytes]) -> bytearray:
+    for chunk in chunks:
+        buffer += chunk
+    return buffer
+
+
+def write_apmanual_file(path: str, data: dict, compress: bool = True):
+    """Stream data as json into a version 2 .apmanual file, deflating it if compress is True"""
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    compressor = zlib.compressobj(9) if compress else None
+
+    with open(path, "wb") as f:
+        writer = _Base64Writer(f)
+        writer.write(apmanual_magic + bytes([apmanual_version, apmanual_flag_compressed if compress else 0]))
+
+        pieces = []
+        pieces_length = 0
+        for piece in encoder.iterencode(data):
+            pieces.append(piece)
+            pieces_length += len(piece)
+            if pieces_length >= _chunk_size:
+                encoded = "".join(pieces).encode("utf-8")
+                writer.write(compressor.compress(encoded) if compressor else encoded)
+                pieces.clear()
+                pieces_length = 0
+
+        encoded = "".join(pieces).encode("utf-8")
+        writer.write(compressor.compress(encoded) + compressor.flush() if compressor else encoded)
+        writer.close()
+
+
+def read_apmanual_file(path: str) -> dict:
+    """Read a .apmanual file of any version and return the client data it contains"""
+    with open(path, "rb") as f:
+        decoded = _iter_base64_decoded(f)
+        header = b""
+        for chunk in decoded:
+            header += chunk
+            if len(header) >= len(apmanual_magic) + 2 or not header.startswith(apmanual_magic[:len(header)]):
+                break
+
+        if not header.startswith(apmanual_magic):
+            # version 1, the whole file is plain json
+            return json.loads(_read_remaining(bytearray(header), decoded))
+
+        version, flags = header[len(apmanual_magic)], header[len(apmanual_magic) + 1]
+        if version > apmanual_version:
+            raise Exception(f"This .apmanual file uses format version {version}, which is newer than this client supports. Please update it.")
+
+        body = header[len(apmanual_magic) + 2:]
+        if not flags & apmanual_flag_compressed:
+            return json.loads(_read_remaining(bytearray(body), decoded))
+
+        decompressor = zlib.decompressobj()
+        inflated = bytearray(decompressor.decompress(body))
+        for chunk in decoded:
+            inflated += decompressor.decompress(chunk)
+        inflated += decompressor.flush()
+        return json.loads(inflated)
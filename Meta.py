@@ -72,3 +72,9 @@ world_description: str = set_world_description("""
 world_webworld: ManualWeb = set_world_webworld(ManualWeb())
 
 enable_region_diagram = bool(meta_table.get("enable_region_diagram", False))
+# Deflate the .apmanual file. Only turn this off if players use an older Manual client that cannot read compressed files.
+compress_apmanual = bool(meta_table.get("compress_apmanual", True))
+# Time and measure the memory of every generation stage and hook, see Instrumentation.py. The MANUAL_INSTRUMENTATION environment variable does the same.
+enable_instrumentation = bool(meta_table.get("enable_instrumentation", False))
+# Write what each location needs to the .apmanual file, so the client can show what's in logic without running requires. See LogicSummary.py.
+include_logic_summary = bool(meta_table.get("include_logic_summary", True))
@@ -1,8 +1,8 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from worlds.generic.Rules import set_rule
 from .Regions import regionMap
 from .hooks import Rules
-from BaseClasses import MultiWorld, CollectionState
+from BaseClasses import MultiWorld, CollectionState, Item, Location, Region
 from .Helpers import clamp, is_item_enabled, get_items_with_value, is_option_enabled
 from worlds.AutoWorld import World
 
@@ -65,17 +65,14 @@ def evaluate_postfix(expr: str, location: str) -> bool:
         raise KeyError("Invalid logic format for location/region {}.".format(location))
     return stack.pop()
 
-def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
+def create_requires_checks(world: "ManualWorld", multiworld: MultiWorld, player: int) -> tuple[Callable, Callable, Callable]:
+    """Return the functions that evaluate requires for the player, each called with (state, area):
+    the one for string requires, the one for dict/list requires and the one that picks between them."""
     # this is only called when the area (think, location or region) has a "requires" field that is a string
     def checkRequireStringForArea(state: CollectionState, area: dict):
         requires_list = area["requires"]
-        # Generate item_counts here so it can be access each time this is called
-        if player not in world.item_counts:
-            real_pool = multiworld.get_items()
-            world.item_counts[player] = {i.name: real_pool.count(i) for i in real_pool if i.player == player}
-
-        # fallback if items_counts[player] not present (will not be accurate to hooks item count)
-        items_counts = world.get_item_counts()
+        # Generate item_counts on first use so it can be accessed each time this is called
+        items_counts = world.get_item_counts(player)
 
         if requires_list == "":
             return True
@@ -226,16 +223,28 @@ def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
         else:  # item access is in dict form
             return checkRequireDictForArea(state, area)
 
+    return checkRequireStringForArea, checkRequireDictForArea, fullLocationOrRegionCheck
+
+def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
+    _, _, fullLocationOrRegionCheck = create_requires_checks(world, multiworld, player)
+
     used_location_names = []
     # Region access rules
     for region in regionMap.keys():
         used_location_names.extend([l.name for l in multiworld.get_region(region, player).locations])
         if region != "Menu":
+            # entrances whose rule checks if another region can be reached need AP to recheck them once that region is reached
+            indirect_regions = get_indirect_condition_regions(multiworld, player, regionMap[region])
+
             for exitRegion in multiworld.get_region(region, player).exits:
                 def fullRegionCheck(state: CollectionState, region=regionMap[region]):
                     return fullLocationOrRegionCheck(state, region)
 
-                set_rule(multiworld.get_entrance(exitRegion.name, player), fullRegionCheck)
+                entrance = multiworld.get_entrance(exitRegion.name, player)
+                set_rule(entrance, fullRegionCheck)
+
+                for indirect_region in indirect_regions:
+                    multiworld.register_indirect_condition(indirect_region, entrance)
 
     # Location access rules
     for location in world.location_table:
@@ -271,6 +280,49 @@ def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
     # Victory requirement
     multiworld.completion_condition[player] = lambda state: state.has("__Victory__", player)
 
+def get_indirect_condition_regions(multiworld: MultiWorld, player: int, area: dict) -> list[Region]:
+    """Return the regions whose reachability the requires of area depend on, through the functions in reachability_functions.
+    Names that don't exist for this player are skipped, the rule itself will complain about them."""
+    requires = area.get("requires") if area else None
+    if not isinstance(requires, str):
+        return []
+
+    regions = []
+    for func_name, func_args in re.findall(r'\{(\w+)\(([^)]*)\)\}', requires):
+        get_region = reachability_functions.get(func_name)
+        if get_region is None or not func_args:
+            continue
+
+        try:
+            region = get_region(multiworld, player, func_args.split(",")[0])
+        except KeyError:
+            continue
+
+        if region is not None and region not in regions:
+            regions.append(region)
+    return regions
+
+# Functions usable in requires that check if a region or location can be reached, with how to get the region they depend on from their first argument.
+# Add your own here if you write one in hooks/Rules.py, so the entrances using it get rechecked when that region becomes reachable.
+reachability_functions: dict[str, Callable[[MultiWorld, int, str], Optional[Region]]] = {
+    "canReachLocation": lambda multiworld, player, name: multiworld.get_location(name, player).parent_region,
+    "canReachRegion": lambda multiworld, player, name: multiworld.get_region(name, player),
+}
+
+def set_forbidden_items_rule(location: Location, forbidden_item_names: frozenset[str], player: int):
+    """Forbid this player's items named in forbidden_item_names from being placed at the location.
+    Keeps any item rule that was already set, as forbid_items_for_player would."""
+    old_rule = location.item_rule
+
+    if old_rule is type(location).item_rule: # still the default, which allows everything
+        def forbidden_items_rule(item: Item) -> bool:
+            return item.name not in forbidden_item_names or item.player != player
+    else:
+        def forbidden_items_rule(item: Item) -> bool:
+            return (item.name not in forbidden_item_names or item.player != player) and old_rule(item)
+
+    location.item_rule = forbidden_items_rule
+
 def YamlEnabled(world: "ManualWorld", multiworld: MultiWorld, state: CollectionState, player: int, param: str) -> bool:
     """Is a yaml option enabled?"""
     return is_option_enabled(multiworld, player, param)
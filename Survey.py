@@ -0,0 +1,235 @@
+######################################################################################
+## Generates many seeds of this manual, alone or alongside other installed worlds,
+## and reports fill failures, per stage timings and sphere depth.
+##
+## Run it from the root of an Archipelago install (everything stays offline):
+##    python -m worlds.manual_warframe_zid.Survey --seeds 100 --jobs 8
+##    python -m worlds.manual_warframe_zid.Survey --seeds 50 --players 2 --with "Clique" --with "Hylics 2"
+######################################################################################
+
+import argparse
+import itertools
+import json
+import logging
+import pkgutil
+import random
+import statistics
+import time
+import traceback
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+from .Game import game_name
+
+# The stages of generation that are timed, in the order Main runs them. "fill" covers pre_fill through post_fill.
+survey_stages = ["generate_early", "create_regions", "create_items", "set_rules", "generate_basic", "fill"]
+
+
+def load_survey_yaml() -> dict:
+    """Return this manual's options section from data/warframe.yaml"""
+    from Utils import parse_yaml
+
+    yaml_data = parse_yaml(pkgutil.get_data(__name__, "data/warframe.yaml").decode("utf-8-sig"))
+    return yaml_data.get(game_name, {})
+
+def build_option_matrix(game_options: dict, max_variants: int = 64) -> list[dict]:
+    """Expand every weighted option of the yaml into one variant per non-zero choice.\n
+    Each variant pins all weighted options to a single choice, and the cartesian product is capped at max_variants.
+    """
+    fixed_options = {}
+    weighted_choices = {}
+
+    for option_name, value in game_options.items():
+        if isinstance(value, dict) and value and all(isinstance(weight, (int, float)) for weight in value.values()):
+            choices = [choice for choice, weight in value.items() if weight]
+            weighted_choices[option_name] = choices or list(value.keys())[:1]
+        else:
+            fixed_options[option_name] = value
+
+    matrix = []
+    names = list(weighted_choices.keys())
+    for combination in itertools.islice(itertools.product(*weighted_choices.values()), max_variants):
+        variant = dict(fixed_options)
+        variant.update({name: choice for name, choice in zip(names, combination)})
+        matrix.append(variant)
+
+    return matrix or [fixed_options]
+
+def _get_options_for_world(world_type, player_options: Optional[dict]) -> dict:
+    options = {}
+    for option_name, option in world_type.options_dataclass.type_hints.items():
+        value = option.default
+        if player_options and option_name in player_options:
+            value = player_options[option_name]
+        options[option_name] = option.from_any(value)
+    return options
+
+def create_survey_multiworld(seed: int, option_variant: Optional[dict], games: list[str]):
+    """Set up a MultiWorld with one slot per game in games, ready for its generation stages to be called.\n
+    Slots of this manual get the options in option_variant, everything else uses default options.
+    """
+    from BaseClasses import MultiWorld, CollectionState
+    from Options import PlandoOptions
+    from settings import get_settings
+    from worlds.AutoWorld import AutoWorldRegister
+
+    # the same setup as Main.py, in the same order
+    multiworld = MultiWorld(len(games))
+    multiworld.set_seed(seed)
+    multiworld.plando_options = PlandoOptions.from_option_string(get_settings().generator.plando_options)
+    multiworld.game = {player: game for player, game in enumerate(games, 1)}
+    multiworld.player_name = {player: f"Survey{player}" for player in multiworld.player_ids}
+
+    args = Namespace()
+    for player, game in multiworld.game.items():
+        world_type = AutoWorldRegister.world_types[game]
+        player_options = option_variant if game == game_name else None
+        for option_name, option in _get_options_for_world(world_type, player_options).items():
+            option_values = getattr(args, option_name, {})
+            option_values[player] = option
+            setattr(args, option_name, option_values)
+    multiworld.set_options(args)
+    multiworld.set_item_links()
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+def generate_survey_seed(seed: int, option_variant: dict, players: int = 1, extra_games: tuple[str, ...] = ()) -> dict:
+    """Generate one multiworld fully in process and return the outcome of that run"""
+    from BaseClasses import CollectionState
+    from Fill import distribute_items_restrictive
+    from worlds.AutoWorld import call_all, call_stage
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    result = {
+        "seed": seed,
+        "options": option_variant,
+        "success": False,
+        "error": None,
+        "timings": {},
+        "spheres": None,
+    }
+
+    games = [game_name] * players + list(extra_games)
+    stage = "setup"
+    start = time.perf_counter()
+    try:
+        multiworld = create_survey_multiworld(seed, option_variant, games)
+        call_stage(multiworld, "assert_generate")
+
+        for stage in survey_stages:
+            stage_start = time.perf_counter()
+            if stage == "fill":
+                call_all(multiworld, "pre_fill")
+                distribute_items_restrictive(multiworld)
+                call_all(multiworld, "post_fill")
+            else:
+                call_all(multiworld, stage)
+            result["timings"][stage] = time.perf_counter() - stage_start
+
+        stage = "beatable"
+        if not multiworld.can_beat_game(CollectionState(multiworld)):
+            raise Exception("Game appears to be unbeatable after fill.")
+
+        result["spheres"] = sum(1 for _ in multiworld.get_spheres())
+        result["success"] = True
+    except Exception as e:
+        result["error"] = f"{stage}: " + "".join(traceback.format_exception_only(type(e), e)).strip()
+
+    result["timings"]["total"] = time.perf_counter() - start
+    return result
+
+def _describe(values: list[float]) -> dict:
+    if not values:
+        return {}
+    values = sorted(values)
+    return {
+        "min": values[0],
+        "median": statistics.median(values),
+        "mean": statistics.fmean(values),
+        "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+        "max": values[-1],
+    }
+
+def summarize_survey(results: list[dict]) -> dict:
+    """Aggregate the per seed results into failure rate, timing and sphere distributions"""
+    failures = [result for result in results if not result["success"]]
+    errors = {}
+    for result in failures:
+        errors.setdefault(result["error"], []).append(result["seed"])
+
+    return {
+        "game": game_name,
+        "runs": len(results),
+        "failures": len(failures),
+        "failure_rate": len(failures) / len(results) if results else 0,
+        "timings": {stage: _describe([result["timings"][stage] for result in results if stage in result["timings"]])
+                    for stage in survey_stages + ["total"]},
+        "spheres": _describe([result["spheres"] for result in results if result["spheres"] is not None]),
+        "errors": [{"error": error, "seeds": seeds} for error, seeds in sorted(errors.items(), key=lambda e: -len(e[1]))],
+    }
+
+def format_survey_summary(summary: dict) -> str:
+    lines = [
+        f"{summary['game']}: {summary['runs']} runs, {summary['failures']} failed ({summary['failure_rate']:.1%})",
+        "",
+        "stage".ljust(16) + "".join(column.rjust(10) for column in ("min", "median", "mean", "p95", "max")),
+    ]
+    for stage, timing in summary["timings"].items():
+        if timing:
+            lines.append(stage.ljust(16) + "".join(f"{timing[column]:10.4f}" for column in ("min", "median", "mean", "p95", "max")))
+
+    if summary["spheres"]:
+        lines.append("")
+        lines.append("spheres: " + ", ".join(f"{column} {value:g}" for column, value in summary["spheres"].items()))
+
+    for error in summary["errors"]:
+        lines.append("")
+        lines.append(f"{len(error['seeds'])}x {error['error']}")
+        lines.append("   seeds: " + ", ".join(str(seed) for seed in error["seeds"][:20]))
+
+    return "\n".join(lines)
+
+def run_survey(seeds: int, jobs: Optional[int] = None, players: int = 1, extra_games: tuple[str, ...] = (),
+               base_seed: Optional[int] = None, max_variants: int = 64) -> tuple[dict, list[dict]]:
+    matrix = build_option_matrix(load_survey_yaml(), max_variants)
+    seed_random = random.Random(base_seed)
+    tasks = [(seed_random.randint(0, 2 ** 63), matrix[index % len(matrix)]) for index in range(seeds)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(generate_survey_seed, seed, variant, players, extra_games) for seed, variant in tasks]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            logging.info(f"[{len(results)}/{seeds}] seed {result['seed']}: {'ok' if result['success'] else result['error']}")
+
+    results.sort(key=lambda result: result["seed"])
+    return summarize_survey(results), results
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=f"Generate many seeds of {game_name} and report how generation went.")
+    parser.add_argument("--seeds", type=int, default=20, help="How many seeds to generate.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes to use, defaults to the cpu count.")
+    parser.add_argument("--players", type=int, default=1, help="Slots of this manual in each multiworld.")
+    parser.add_argument("--with", dest="extra_games", action="append", default=[],
+                        help="Name of another installed game to add one slot of, can be repeated.")
+    parser.add_argument("--base-seed", type=int, default=None, help="Seed used to pick every run's seed, for repeatable surveys.")
+    parser.add_argument("--max-variants", type=int, default=64, help="Cap on yaml option combinations to cycle through.")
+    parser.add_argument("--output", default=f"{game_name}_survey.json", help="Where to write the json report.")
+    parsed = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    summary, results = run_survey(parsed.seeds, parsed.jobs, parsed.players, tuple(parsed.extra_games),
+                                  parsed.base_seed, parsed.max_variants)
+
+    with open(parsed.output, "w") as f:
+        json.dump({"summary": summary, "results": results}, f, indent=2)
+
+    print(format_survey_summary(summary))
+    print(f"\nFull report written to {parsed.output}")
+
+if __name__ == "__main__":
+    main()
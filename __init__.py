@@ -1,38 +1,55 @@
-from base64 import b64encode
 import logging
 import os
-import json
+from collections import Counter
 from typing import Callable, Optional
 
 import Utils
-from worlds.generic.Rules import forbid_items_for_player
 from worlds.LauncherComponents import Component, SuffixIdentifier, components, Type, launch_subprocess
 
-from .Data import item_table, location_table, region_table, category_table, meta_table
+from .Data import item_table, location_table, region_table, category_table, meta_table, get_table_hash
 from .Game import game_name, filler_item_name, starting_items
-from .Meta import world_description, world_webworld, enable_region_diagram
-from .Locations import location_id_to_name, location_name_to_id, location_name_to_location, location_name_groups, victory_names
-from .Items import item_id_to_name, item_name_to_id, item_name_to_item, item_name_groups
+from .Meta import world_description, world_webworld, enable_region_diagram, compress_apmanual, include_logic_summary
+from .Locations import location_id_to_name, location_name_to_id, location_name_to_location, location_name_groups, victory_names, \
+    location_name_to_forbid, location_name_to_placement
+from .Items import item_id_to_name, item_name_to_id, item_name_to_item, item_name_groups, get_item_classification, \
+    get_item_names_in_categories, get_forbidden_item_names, item_name_to_value_keys
 from .DataValidation import runGenerationDataValidation, runPreFillDataValidation
+from .ManualFile import read_apmanual_file, write_apmanual_file
+from .LogicSummary import build_logic_summary
+from .Instrumentation import instrumented_stage
 
-from .Regions import create_regions
-from .Items import ManualItem
-from .Rules import set_rules
+from .Regions import create_regions, regionMap
+from .Items import ManualItem, ManualItemPool
+from .Rules import set_rules, set_forbidden_items_rule
 from .Options import manual_options_data
-from .Helpers import is_option_enabled, is_item_enabled, get_option_value
+from .Helpers import is_option_enabled, is_item_enabled, get_option_value, is_item_name_enabled, \
+    set_enabled_content, clear_enabled_content
 
-from BaseClasses import ItemClassification, Tutorial, Item
+from BaseClasses import ItemClassification, Tutorial, Item, Location, CollectionState, MultiWorld
 from Options import PerGameCommonOptions
 from worlds.AutoWorld import World, WebWorld
 
-from .hooks.World import \
-    before_create_regions, after_create_regions, \
-    before_create_items_starting, before_create_items_filler, after_create_items, \
-    before_create_item, after_create_item, \
-    before_set_rules, after_set_rules, \
-    before_generate_basic, after_generate_basic, \
-    before_fill_slot_data, after_fill_slot_data, before_write_spoiler
-from .hooks.Data import hook_interpret_slot_data
+from .Hooks import Hook, register_hook_module
+from .hooks import World as world_hooks, Data as data_hooks
+
+register_hook_module("World", world_hooks)
+register_hook_module("Data", data_hooks)
+
+before_create_regions = Hook("World", "before_create_regions", "notify")
+after_create_regions = Hook("World", "after_create_regions", "notify")
+before_create_items_starting = Hook("World", "before_create_items_starting", "filter")
+before_create_items_filler = Hook("World", "before_create_items_filler", "filter")
+after_create_items = Hook("World", "after_create_items", "filter")
+before_create_item = Hook("World", "before_create_item", "filter")
+after_create_item = Hook("World", "after_create_item", "filter")
+before_set_rules = Hook("World", "before_set_rules", "notify")
+after_set_rules = Hook("World", "after_set_rules", "notify")
+before_generate_basic = Hook("World", "before_generate_basic", "notify")
+after_generate_basic = Hook("World", "after_generate_basic", "notify")
+before_fill_slot_data = Hook("World", "before_fill_slot_data", "filter")
+after_fill_slot_data = Hook("World", "after_fill_slot_data", "filter")
+before_write_spoiler = Hook("World", "before_write_spoiler", "notify")
+hook_interpret_slot_data = Hook("Data", "hook_interpret_slot_data", "any")
 
 class ManualWorld(World):
     __doc__ = world_description
@@ -53,15 +70,30 @@ class ManualWorld(World):
     item_name_to_item = item_name_to_item
     item_name_groups = item_name_groups
 
-    item_counts = {}
     start_inventory = {}
 
+    # set per player by set_enabled_content once options are known, None until then
+    enabled_categories = None
+    disabled_categories = None
+    enabled_items = None
+    enabled_locations = None
+    # (classification, code) of every item by name, set per player in generate_early so create_item doesn't inspect the item dict each time
+    item_prototypes = None
+
     location_id_to_name = location_id_to_name
     location_name_to_id = location_name_to_id
     location_name_to_location = location_name_to_location
     location_name_groups = location_name_groups
     victory_names = victory_names
 
+    # lets the client know if its installed copy of this manual matches the one a .apmanual was generated with
+    base_table_hash = get_table_hash(item_name_to_item, location_name_to_location, region_table, category_table)
+
+    def __init__(self, multiworld: MultiWorld, player: int):
+        super().__init__(multiworld, player)
+        # the real item counts by player, see get_item_counts. Kept per world so a reset doesn't reach other worlds.
+        self.item_counts: dict[int, dict[str, int]] = {}
+
     def interpret_slot_data(self, slot_data: dict[str, any]):
         #this is called by tools like UT
 
@@ -71,7 +103,10 @@ class ManualWorld(World):
                 getattr(self.options, key).value = value
                 regen = True
 
-        regen = hook_interpret_slot_data(self, self.player, slot_data) or regen
+        if hook_interpret_slot_data:
+            regen = hook_interpret_slot_data(self, self.player, slot_data) or regen
+        if regen:
+            clear_enabled_content(self)
         return regen
 
     @classmethod
@@ -79,6 +114,13 @@ class ManualWorld(World):
         runGenerationDataValidation()
 
 
+    @instrumented_stage
+    def generate_early(self):
+        set_enabled_content(self)
+        # built here rather than at import, so it has the item data as the hooks left it
+        self.item_prototypes = {name: (get_item_classification(item), self.item_name_to_id[name]) for name, item in self.item_name_to_item.items()}
+
+    @instrumented_stage
     def create_regions(self):
         before_create_regions(self, self.multiworld, self.player)
 
@@ -95,6 +137,7 @@ class ManualWorld(World):
 
         after_create_regions(self, self.multiworld, self.player)
 
+    @instrumented_stage
     def create_items(self):
         # Generate item pool
         pool = []
@@ -117,9 +160,7 @@ class ManualWorld(World):
 
             if item_count == 0: continue
 
-            for i in range(item_count):
-                new_item = self.create_item(name)
-                pool.append(new_item)
+            pool.extend(self.create_items_bulk(name, item_count))
 
             if item.get("early"): # only early
                 self.multiworld.early_items[self.player][name] = item_count
@@ -132,28 +173,34 @@ class ManualWorld(World):
         items_started = []
 
         if starting_items:
+            item_pool = ManualItemPool(pool)
+            started_names = set()
+
             for starting_item_block in starting_items:
                 # if there's a condition on having a previous item, check for any of them
                 # if not found in items started, this starting item rule shouldn't execute, and check the next one
                 if "if_previous_item" in starting_item_block:
-                    matching_items = [item for item in items_started if item.name in starting_item_block["if_previous_item"]]
-
-                    if len(matching_items) == 0:
+                    if started_names.isdisjoint(starting_item_block["if_previous_item"]):
                         continue
 
                 # start with the full pool of items
-                items = pool
+                items = None
 
                 # if the setting lists specific item names, limit the items to just those
                 if "items" in starting_item_block:
-                    items = [item for item in pool if item.name in starting_item_block["items"]]
+                    items = item_pool.items_named(starting_item_block["items"])
 
                 # if the setting lists specific item categories, limit the items to ones that have any of those categories
                 if "item_categories" in starting_item_block:
-                    items_in_categories = [item["name"] for item in self.item_name_to_item.values() if "category" in item and len(set(starting_item_block["item_categories"]).intersection(item["category"])) > 0]
-                    items = [item for item in pool if item.name in items_in_categories]
+                    items = item_pool.items_in_categories(starting_item_block["item_categories"])
 
-                self.random.shuffle(items)
+                if items is None:
+                    # the whole pool is shuffled in place, so the pool keeps that order from here on
+                    items = item_pool.to_list()
+                    self.random.shuffle(items)
+                    item_pool = ManualItemPool(items)
+                else:
+                    self.random.shuffle(items)
 
                 # if the setting lists a specific number of random items that should be pulled, only use a subset equal to that number
                 if "random" in starting_item_block:
@@ -161,10 +208,13 @@ class ManualWorld(World):
 
                 for starting_item in items:
                     items_started.append(starting_item)
+                    started_names.add(starting_item.name)
                     self.multiworld.push_precollected(starting_item)
-                    pool.remove(starting_item)
+                    item_pool.remove(starting_item)
 
-        self.start_inventory = {i.name: items_started.count(i) for i in items_started}
+            pool = item_pool.to_list()
+
+        self.start_inventory = dict(Counter(item.name for item in items_started))
 
         pool = before_create_items_filler(pool, self, self.multiworld, self.player)
         pool = self.adjust_filler_items(pool, traps)
@@ -175,30 +225,26 @@ class ManualWorld(World):
         self.multiworld.itempool += pool
 
     def create_item(self, name: str) -> Item:
-        name = before_create_item(name, self, self.multiworld, self.player)
-
-        item = self.item_name_to_item[name]
-        classification = ItemClassification.filler
-
-        if "trap" in item and item["trap"]:
-            classification = ItemClassification.trap
-
-        if "useful" in item and item["useful"]:
-            classification = ItemClassification.useful
+        if before_create_item:
+            name = before_create_item(name, self, self.multiworld, self.player)
 
-        if "progression" in item and item["progression"]:
-            classification = ItemClassification.progression
+        classification, code = self.get_item_prototype(name)
+        item_object = ManualItem(name, classification, code, player=self.player)
 
-        if "progression_skip_balancing" in item and item["progression_skip_balancing"]:
-            classification = ItemClassification.progression_skip_balancing
+        if after_create_item:
+            item_object = after_create_item(item_object, self, self.multiworld, self.player)
 
-        item_object = ManualItem(name, classification,
-                        self.item_name_to_id[name], player=self.player)
+        return item_object
 
-        item_object = after_create_item(item_object, self, self.multiworld, self.player)
+    def create_items_bulk(self, name: str, count: int) -> list[Item]:
+        """Create count copies of an item. Skips the create_item hooks when they're left unmodified."""
+        if before_create_item or after_create_item:
+            return [self.create_item(name) for _ in range(count)]
 
-        return item_object
+        classification, code = self.get_item_prototype(name)
+        return [ManualItem(name, classification, code, player=self.player) for _ in range(count)]
 
+    @instrumented_stage
     def set_rules(self):
         before_set_rules(self, self.multiworld, self.player)
 
@@ -206,90 +252,37 @@ class ManualWorld(World):
 
         after_set_rules(self, self.multiworld, self.player)
 
+    @instrumented_stage
     def generate_basic(self):
         before_generate_basic(self, self.multiworld, self.player)
 
+        locations_with_forbid = []
+        locations_with_placements = []
+        for location in self.multiworld.get_unfilled_locations(player=self.player):
+            if location.name in location_name_to_forbid:
+                locations_with_forbid.append(location)
+            if location.name in location_name_to_placement:
+                locations_with_placements.append(location)
+
         # Handle item forbidding
-        manual_locations_with_forbid = {location['name']: location for location in location_name_to_location.values() if "dont_place_item" in location or "dont_place_item_category" in location}
-        locations_with_forbid = [l for l in self.multiworld.get_unfilled_locations(player=self.player) if l.name in manual_locations_with_forbid.keys()]
         for location in locations_with_forbid:
-            manual_location = manual_locations_with_forbid[location.name]
-            forbidden_item_names = []
+            manual_location = location_name_to_forbid[location.name]
 
-            if "dont_place_item" in manual_location:
-                if len(manual_location["dont_place_item"]) == 0:
-                    continue
-
-                forbidden_item_names.extend([i["name"] for i in item_name_to_item.values() if i["name"] in manual_location["dont_place_item"]])
+            if "dont_place_item" in manual_location and len(manual_location["dont_place_item"]) == 0:
+                continue
 
-            if "dont_place_item_category" in manual_location:
-                if len(manual_location["dont_place_item_category"]) == 0:
-                    continue
+            if "dont_place_item_category" in manual_location and len(manual_location["dont_place_item_category"]) == 0:
+                continue
 
-                forbidden_item_names.extend([i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["dont_place_item_category"])])
+            forbidden_item_names = get_forbidden_item_names(tuple(manual_location.get("dont_place_item", [])),
+                                                            tuple(manual_location.get("dont_place_item_category", [])))
 
             if len(forbidden_item_names) > 0:
-                forbid_items_for_player(location, forbidden_item_names, self.player)
-                forbidden_item_names.clear()
-
-        # Handle specific item placements using fill_restrictive
-        manual_locations_with_placements = {location['name']: location for location in location_name_to_location.values() if "place_item" in location or "place_item_category" in location}
-        locations_with_placements = [l for l in self.multiworld.get_unfilled_locations(player=self.player) if l.name in manual_locations_with_placements.keys()]
-        for location in locations_with_placements:
-            manual_location = manual_locations_with_placements[location.name]
-            eligible_items = []
-
-            if "place_item" in manual_location:
-                if len(manual_location["place_item"]) == 0:
-                    continue
-
-                eligible_items = [item for item in self.multiworld.itempool if item.name in manual_location["place_item"] and item.player == self.player]
-
-                if len(eligible_items) == 0:
-                    raise Exception("Could not find a suitable item to place at %s. No items that match %s." % (manual_location["name"], ", ".join(manual_location["place_item"])))
-
-            if "place_item_category" in manual_location:
-                if len(manual_location["place_item_category"]) == 0:
-                    continue
-
-                eligible_item_names = [i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["place_item_category"])]
-                eligible_items = [item for item in self.multiworld.itempool if item.name in eligible_item_names and item.player == self.player]
-
-                if len(eligible_items) == 0:
-                    raise Exception("Could not find a suitable item to place at %s. No items that match categories %s." % (manual_location["name"], ", ".join(manual_location["place_item_category"])))
-
-            if "dont_place_item" in manual_location:
-                if len(manual_location["dont_place_item"]) == 0:
-                    continue
-
-                eligible_items = [item for item in eligible_items if item.name not in manual_location["dont_place_item"]]
-
-                if len(eligible_items) == 0:
-                    raise Exception("Could not find a suitable item to place at %s. No items that match placed_items(_category) because of forbidden %s." % (manual_location["name"], ", ".join(manual_location["dont_place_item"])))
-
-            if "dont_place_item_category" in manual_location:
-                if len(manual_location["dont_place_item_category"]) == 0:
-                    continue
-
-                forbidden_item_names = [i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["dont_place_item_category"])]
-
-                eligible_items = [item for item in eligible_items if item.name not in forbidden_item_names]
-
-                if len(eligible_items) == 0:
-                    raise Exception("Could not find a suitable item to place at %s. No items that match placed_items(_category) because of forbidden categories %s." % (manual_location["name"], ", ".join(manual_location["dont_place_item_category"])))
-                forbidden_item_names.clear()
-
-
-            # if we made it here and items is empty, then we encountered an unknown issue... but also can't do anything to place, so error
-            if len(eligible_items) == 0:
-                raise Exception("Custom item placement at location %s failed." % (manual_location["name"]))
-
-            item_to_place = self.random.choice(eligible_items)
-            location.place_locked_item(item_to_place)
-
-            # remove the item we're about to place from the pool so it isn't placed twice
-            self.multiworld.itempool.remove(item_to_place)
+                set_forbidden_items_rule(location, forbidden_item_names, self.player)
 
+        # Handle specific item placements
+        if locations_with_placements:
+            self.place_constrained_items(locations_with_placements)
 
         after_generate_basic(self, self.multiworld, self.player)
 
@@ -298,10 +291,12 @@ class ManualWorld(World):
             from Utils import visualize_regions
             visualize_regions(self.multiworld.get_region("Menu", self.player), f"{self.game}_{self.player}.puml")
 
+    @instrumented_stage
     def pre_fill(self):
         # DataValidation after all the hooks are done but before fill
         runPreFillDataValidation(self, self.multiworld)
 
+    @instrumented_stage
     def fill_slot_data(self):
         slot_data = before_fill_slot_data({}, self, self.multiworld, self.player)
 
@@ -316,11 +311,28 @@ class ManualWorld(World):
 
         return slot_data
 
+    @instrumented_stage
     def generate_output(self, output_directory: str):
         data = self.client_data()
         filename = f"{self.multiworld.get_out_file_name_base(self.player)}.apmanual"
-        with open(os.path.join(output_directory, filename), 'wb') as f:
-            f.write(b64encode(bytes(json.dumps(data), 'utf-8')))
+        write_apmanual_file(os.path.join(output_directory, filename), data, compress_apmanual)
+
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        change = super().collect(state, item)
+        if change and item.name in item_name_to_value_keys:
+            # keep the total of each value on the state itself, so ItemValue is a single lookup and copies along with the state
+            player_items = state.prog_items[item.player]
+            for value_key, amount in item_name_to_value_keys[item.name]:
+                player_items[value_key] += amount
+        return change
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        change = super().remove(state, item)
+        if change and item.name in item_name_to_value_keys:
+            player_items = state.prog_items[item.player]
+            for value_key, amount in item_name_to_value_keys[item.name]:
+                player_items[value_key] -= amount
+        return change
 
     def write_spoiler(self, spoiler_handle):
         before_write_spoiler(self, self.multiworld, spoiler_handle)
@@ -334,7 +346,10 @@ class ManualWorld(World):
         return self.adjust_filler_items(item_pool, traps)
 
     def adjust_filler_items(self, item_pool, traps):
-        extras = len(self.multiworld.get_unfilled_locations(player=self.player)) - len(item_pool)
+        # counted now, so the locations hooks already filled are left out, only going through this player's regions
+        location_count = sum(1 for region in self.multiworld.get_regions(self.player) for location in region.locations if location.item is None)
+
+        extras = location_count - len(item_pool)
 
         if extras > 0:
             trap_percent = get_option_value(self.multiworld, self.player, "filler_traps")
@@ -348,9 +363,7 @@ class ManualWorld(World):
                 extra_item = self.create_item(self.random.choice(traps))
                 item_pool.append(extra_item)
 
-            for _ in range(0, filler_count):
-                extra_item = self.create_item(filler_item_name)
-                item_pool.append(extra_item)
+            item_pool.extend(self.create_items_bulk(filler_item_name, filler_count))
         elif extras < 0:
             logging.warning(f"{self.game} has more items than locations. {abs(extras)} non-progression items will be removed at random.")
             fillers = [item for item in item_pool if item.classification == ItemClassification.filler]
@@ -359,41 +372,160 @@ class ManualWorld(World):
             self.random.shuffle(fillers)
             self.random.shuffle(traps)
             self.random.shuffle(useful)
-            for _ in range(0, abs(extras)):
-                popped = None
-                if fillers:
-                    popped = fillers.pop()
-                elif traps:
-                    popped = traps.pop()
-                elif useful:
-                    popped = useful.pop()
-                else:
-                    logging.warning("Could not remove enough non-progression items from the pool.")
-                    break
-                item_pool.remove(popped)
+
+            # pick the removed items from the end of each shuffled list, fillers first, then traps, then useful
+            removed_ids = set()
+            remaining = abs(extras)
+            for candidates in (fillers, traps, useful):
+                taken = candidates[len(candidates) - min(remaining, len(candidates)):]
+                removed_ids.update(id(item) for item in taken)
+                remaining -= len(taken)
+
+            if remaining > 0:
+                logging.warning("Could not remove enough non-progression items from the pool.")
+
+            # then rebuild the pool once, without the picked items themselves
+            item_pool[:] = [item for item in item_pool if id(item) not in removed_ids]
 
         return item_pool
 
+    def place_constrained_items(self, locations: list[Location]):
+        """Place an eligible item from this player's pool at each location with place_item(_category),
+        then remove every placed item from the multiworld item pool at once."""
+        # index this player's pool items by name, keeping their position in the item pool so choices follow pool order
+        pool_index: dict[str, list[tuple[int, Item]]] = {}
+        for index, item in enumerate(self.multiworld.itempool):
+            if item.player == self.player:
+                pool_index.setdefault(item.name, []).append((index, item))
+
+        placed_items = set()
+
+        for location in locations:
+            manual_location = location_name_to_placement[location.name]
+            eligible_item_names = set()
+
+            if "place_item" in manual_location:
+                if len(manual_location["place_item"]) == 0:
+                    continue
+
+                eligible_item_names = {name for name in manual_location["place_item"] if pool_index.get(name)}
+
+                if len(eligible_item_names) == 0:
+                    raise Exception("Could not find a suitable item to place at %s. No items that match %s." % (manual_location["name"], ", ".join(manual_location["place_item"])))
+
+            if "place_item_category" in manual_location:
+                if len(manual_location["place_item_category"]) == 0:
+                    continue
+
+                eligible_item_names = {name for name in get_item_names_in_categories(tuple(manual_location["place_item_category"])) if pool_index.get(name)}
+
+                if len(eligible_item_names) == 0:
+                    raise Exception("Could not find a suitable item to place at %s. No items that match categories %s." % (manual_location["name"], ", ".join(manual_location["place_item_category"])))
+
+            if "dont_place_item" in manual_location:
+                if len(manual_location["dont_place_item"]) == 0:
+                    continue
+
+                eligible_item_names.difference_update(manual_location["dont_place_item"])
+
+                if len(eligible_item_names) == 0:
+                    raise Exception("Could not find a suitable item to place at %s. No items that match placed_items(_category) because of forbidden %s." % (manual_location["name"], ", ".join(manual_location["dont_place_item"])))
+
+            if "dont_place_item_category" in manual_location:
+                if len(manual_location["dont_place_item_category"]) == 0:
+                    continue
+
+                eligible_item_names.difference_update(get_item_names_in_categories(tuple(manual_location["dont_place_item_category"])))
+
+                if len(eligible_item_names) == 0:
+                    raise Exception("Could not find a suitable item to place at %s. No items that match placed_items(_category) because of forbidden categories %s." % (manual_location["name"], ", ".join(manual_location["dont_place_item_category"])))
+
+            eligible_items = sorted((entry for name in eligible_item_names for entry in pool_index[name]), key=lambda entry: entry[0])
+
+            # if we made it here and items is empty, then we encountered an unknown issue... but also can't do anything to place, so error
+            if len(eligible_items) == 0:
+                raise Exception("Custom item placement at location %s failed." % (manual_location["name"]))
+
+            entry_to_place = self.random.choice(eligible_items)
+            item_to_place = entry_to_place[1]
+            location.place_locked_item(item_to_place)
+
+            # take the item out of the index so it isn't placed twice
+            pool_index[item_to_place.name].remove(entry_to_place)
+            placed_items.add(id(item_to_place))
+
+        # remove every placed item from the pool in a single pass
+        if placed_items:
+            self.multiworld.itempool[:] = [item for item in self.multiworld.itempool if id(item) not in placed_items]
+
+    def get_item_prototype(self, name: str) -> tuple[ItemClassification, Optional[int]]:
+        """returns the (classification, code) an item named 'name' is created with"""
+        prototype = self.item_prototypes.get(name) if self.item_prototypes is not None else None
+        if prototype is None:
+            prototype = (get_item_classification(self.item_name_to_item[name]), self.item_name_to_id[name])
+        return prototype
+
     def get_item_counts(self, player: Optional[int] = None, reset: bool = False) -> dict[str, int]:
         """returns the player real item count"""
         if player is None:
             player = self.player
         if not self.item_counts.get(player, {}) or reset:
-            real_pool = self.multiworld.get_items()
-            self.item_counts[player] = {i.name: real_pool.count(i) for i in real_pool if i.player == player}
+            self.item_counts[player] = dict(Counter(i.name for i in self.multiworld.get_items() if i.player == player))
         return self.item_counts.get(player)
 
     def client_data(self):
-        return {
+        """Build the .apmanual content from this player's actual regions and locations.
+        Disabled locations and unused goals are left out, along with the fields the client never reads.
+        Requires, item counts and values are kept so the client can tell what's in logic by itself."""
+        regions = {}
+        locations = {}
+        for region in self.multiworld.get_regions(self.player):
+            regions[region.name] = {
+                "connects_to": [exit.connected_region.name for exit in region.exits if exit.connected_region]
+            }
+            if "requires" in regionMap.get(region.name, {}):
+                regions[region.name]["requires"] = regionMap[region.name]["requires"]
+
+            for location in region.locations:
+                manual_location = self.location_name_to_location.get(location.name, {})
+                locations[location.name] = {
+                    "name": location.name,
+                    "id": location.address,
+                    "region": region.name,
+                    "category": manual_location.get("category", [])
+                }
+                if "requires" in manual_location:
+                    locations[location.name]["requires"] = manual_location["requires"]
+
+        items = {}
+        item_counts = self.get_item_counts()
+        for name, item in self.item_name_to_item.items():
+            if name == filler_item_name or is_item_name_enabled(self.multiworld, self.player, name):
+                items[name] = {
+                    "name": name,
+                    "id": item.get("id"),
+                    "category": item.get("category", []),
+                    "count": item_counts.get(name, 0)
+                }
+                if item.get("value"):
+                    items[name]["value"] = item["value"]
+
+        used_categories = {category for data in [*items.values(), *locations.values()] for category in data["category"]}
+
+        data = {
             "game": self.game,
             'player_name': self.multiworld.get_player_name(self.player),
             'player_id': self.player,
-            'items': self.item_name_to_item,
-            'locations': self.location_name_to_location,
-            # todo: extract connections out of multiworld.get_regions() instead, in case hooks have modified the regions.
-            'regions': region_table,
-            'categories': category_table
+            'base_hash': self.base_table_hash,
+            'items': items,
+            'locations': locations,
+            'regions': regions,
+            'categories': {name: category for name, category in category_table.items() if name in used_categories}
         }
+        if include_logic_summary:
+            # what each location needs, for clients and trackers that can't run the requires themselves
+            data["logic_summary"] = build_logic_summary(self)
+        return data
 
 ###
 # Non-world client methods
@@ -408,7 +540,22 @@ class VersionedComponent(Component):
         super().__init__(display_name=display_name, script_name=script_name, func=func, component_type=Type.CLIENT, file_identifier=file_identifier)
         self.version = version
 
+def is_own_apmanual_file(path: str) -> bool:
+    """Is path a .apmanual file of this game, which Manual clients older than this apworld's can't read"""
+    if not path.endswith(".apmanual"):
+        return False
+    try:
+        return read_apmanual_file(path).get("game") == game_name
+    except Exception:
+        return False
+
 def add_client_to_launcher() -> None:
+    # this game's own .apmanual files open with this apworld's client, ahead of the shared Manual Client which keeps the other manuals' files
+    own_client = Component(f"Manual Client ({game_name})", func=launch_client, component_type=getattr(Type, "HIDDEN", Type.CLIENT),
+                           file_identifier=is_own_apmanual_file)
+    shared_client_index = next((index for index, c in enumerate(components) if c.display_name == "Manual Client"), len(components))
+    components.insert(shared_client_index, own_client)
+
     version = 2024_07_09 # YYYYMMDD
     found = False
     for c in components:
@@ -0,0 +1,218 @@
+######################################################################################
+## Generates multiworlds of 1 to 200 slots of this world, each in a new process, to see how
+## every stage scales with the number of slots. Reports wall time, how many times locations
+## and entrances were checked for reachability (which is what calls their rules) and the peak
+## resident memory after each stage, and flags the stages whose cost per slot keeps growing
+## with the slot count.
+##
+## --memory also traces allocations with tracemalloc to report what each stage allocated,
+## which slows every stage down, so its timings are only comparable with other --memory runs.
+##    python -m worlds.manual_warframe_zid.benchmarks.MultiSlot
+##    python -m worlds.manual_warframe_zid.benchmarks.MultiSlot --slots 1 --slots 20 --scale 2 --no-fill --memory
+######################################################################################
+
+import argparse
+import importlib
+import json
+import logging
+import math
+import multiprocessing
+import sys
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+from . import SyntheticData
+
+default_slot_counts = [1, 10, 50, 100, 200]
+# a stage is flagged when its time grows faster than slots ** superlinear_exponent
+superlinear_exponent = 1.15
+
+
+def get_peak_rss() -> Optional[int]:
+    """Peak resident memory of this process in bytes, or None where it can't be read"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset
+        except (ImportError, AttributeError):
+            return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _count_rule_calls(location_type: type, rule_calls: dict) -> Callable[[], None]:
+    """Count every can_reach of location_type and of entrances in rule_calls["count"], from before any rule is set.
+    Returns the function that puts them back."""
+    from BaseClasses import Entrance
+
+    originals = []
+    for cls in (location_type, Entrance):
+        def counted_can_reach(self, state, can_reach=cls.can_reach):
+            rule_calls["count"] += 1
+            return can_reach(self, state)
+
+        originals.append((cls, cls.__dict__.get("can_reach")))
+        cls.can_reach = counted_can_reach
+
+    def restore():
+        for cls, can_reach in originals:
+            if can_reach is None:
+                del cls.can_reach
+            else:
+                cls.can_reach = can_reach
+    return restore
+
+def run_slots(slots: int, scale: Optional[int] = None, seed: int = 0, fill: bool = True, memory: bool = False) -> dict:
+    """Generate one multiworld of slots copies of this world (or of synthetic data at scale) and measure every stage,
+    with the memory each stage allocated and peaked at traced by tracemalloc if memory is set"""
+    from Fill import distribute_items_restrictive
+    from worlds.AutoWorld import call_all, call_stage
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if scale is None:
+        module = importlib.import_module(__package__.rpartition(".")[0])
+    else:
+        module = SyntheticData.load_synthetic_world(scale, seed)
+    survey = importlib.import_module(f"{module.__name__}.Survey")
+    game = module.ManualWorld.game
+
+    result = {"slots": slots, "stages": {}, "error": None}
+    rule_calls = {"count": 0}
+    stages = survey.survey_stages if fill else survey.survey_stages[:-1]
+    restore_rules = _count_rule_calls(importlib.import_module(f"{module.__name__}.Locations").ManualLocation, rule_calls)
+    if memory:
+        tracemalloc.start()
+    try:
+        multiworld = survey.create_survey_multiworld(seed, {}, [game] * slots)
+        call_stage(multiworld, "assert_generate")
+
+        for stage in stages:
+            rule_calls["count"] = 0
+            if memory:
+                memory_before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            if stage == "fill":
+                call_all(multiworld, "pre_fill")
+                distribute_items_restrictive(multiworld)
+                call_all(multiworld, "post_fill")
+            else:
+                call_all(multiworld, stage)
+            measurement = {"seconds": time.perf_counter() - start, "rule_calls": rule_calls["count"], "peak_rss": get_peak_rss()}
+            if memory:
+                memory_after, memory_peak = tracemalloc.get_traced_memory()
+                measurement["memory_allocated"] = memory_after - memory_before
+                measurement["memory_peak"] = memory_peak - memory_before
+            result["stages"][stage] = measurement
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        restore_rules()
+
+    if memory:
+        tracemalloc.stop()
+    result["peak_rss"] = get_peak_rss()
+    if scale is not None:
+        SyntheticData.unload_synthetic_worlds()
+    return result
+
+def find_superlinear_stages(results: list[dict]) -> dict[str, float]:
+    """Return the stages whose time grows faster than linearly with the slot count, with the fitted exponent"""
+    flagged = {}
+    stages = {stage for result in results for stage in result["stages"]}
+    for stage in stages:
+        points = [(math.log(result["slots"]), math.log(result["stages"][stage]["seconds"]))
+                  for result in results if stage in result["stages"] and result["stages"][stage]["seconds"] > 0]
+        if len(points) < 2 or len({x for x, _ in points}) < 2:
+            continue
+
+        # least squares slope of log(time) over log(slots)
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / sum((x - mean_x) ** 2 for x, _ in points)
+        if exponent > superlinear_exponent:
+            flagged[stage] = exponent
+    return flagged
+
+def format_results(results: list[dict], flagged: dict[str, float]) -> str:
+    stages = []
+    for result in results:
+        stages.extend(stage for stage in result["stages"] if stage not in stages)
+
+    lines = ["slots".rjust(6) + "".join(stage.rjust(16) for stage in stages)]
+    for result in results:
+        line = str(result["slots"]).rjust(6)
+        for stage in stages:
+            timing = result["stages"].get(stage)
+            line += f"{timing['seconds']:9.3f}s/{timing['rule_calls']:<6}" if timing else "-".rjust(16)
+        lines.append(line)
+        if result["error"]:
+            lines.append(f"       failed: {result['error']}")
+
+    lines.append("")
+    lines.append("(seconds/reachability checks per stage)")
+
+    if any(timing.get("peak_rss") for result in results for timing in result["stages"].values()):
+        lines.append("")
+        lines.append("slots".rjust(6) + "".join(stage.rjust(16) for stage in stages))
+        for result in results:
+            line = str(result["slots"]).rjust(6)
+            for stage in stages:
+                timing = result["stages"].get(stage)
+                line += f"{timing['peak_rss'] / 2 ** 20:16.0f}" if timing and timing.get("peak_rss") else "-".rjust(16)
+            lines.append(line)
+        lines.append("")
+        lines.append("(MiB of peak RSS after each stage)")
+
+    if any("memory_peak" in timing for result in results for timing in result["stages"].values()):
+        lines.append("")
+        lines.append("slots".rjust(6) + "".join(stage.rjust(16) for stage in stages))
+        for result in results:
+            line = str(result["slots"]).rjust(6)
+            for stage in stages:
+                timing = result["stages"].get(stage)
+                line += f"{timing['memory_allocated'] / 2 ** 20:8.1f}/{timing['memory_peak'] / 2 ** 20:<7.1f}" if timing and "memory_peak" in timing else "-".rjust(16)
+            lines.append(line)
+        lines.append("")
+        lines.append("(MiB allocated/peak above the start of each stage, traced by tracemalloc)")
+
+    for stage, exponent in sorted(flagged.items(), key=lambda flag: -flag[1]):
+        lines.append(f"superlinear: {stage} grows like slots^{exponent:.2f}")
+    return "\n".join(lines)
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Measure how generation of this world scales with the number of slots.")
+    parser.add_argument("--slots", type=int, action="append", help=f"Slot counts to generate, can be repeated. Defaults to {default_slot_counts}.")
+    parser.add_argument("--scale", type=int, default=None, help="Use synthetic data of this scale instead of this world's data.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the multiworlds (and synthetic data).")
+    parser.add_argument("--no-fill", dest="fill", action="store_false", help="Stop after generate_basic.")
+    parser.add_argument("--memory", action="store_true", help="Trace the memory of each stage with tracemalloc, which slows generation down.")
+    parser.add_argument("--output", default=None, help="Write the results as json to this file.")
+    parsed = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for slots in parsed.slots or default_slot_counts:
+        # a new process per run, so peak memory is that run's alone
+        with context.Pool(1, maxtasksperchild=1) as pool:
+            result = pool.apply(run_slots, (slots, parsed.scale, parsed.seed, parsed.fill, parsed.memory))
+        results.append(result)
+        logging.info(f"{slots} slot(s): {sum(stage['seconds'] for stage in result['stages'].values()):.2f}s" +
+                     (f", failed: {result['error']}" if result["error"] else ""))
+
+    flagged = find_superlinear_stages([result for result in results if not result["error"]])
+
+    if parsed.output:
+        with open(parsed.output, "w") as f:
+            json.dump({"results": results, "superlinear": flagged}, f, indent=2)
+
+    print(format_results(results, flagged))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+######################################################################################
+## Checks other ways of evaluating requires against the one generation uses, and how fast
+## each of them is.
+##
+## Every requires string and list of the data files, plus randomly generated ones (item and
+## category counts, all/half/%, nested parentheses, AND/OR and {Function()} calls, some of
+## them returning requires of their own), are evaluated against random CollectionStates by
+## every engine. "current" is the oracle, any engine that disagrees with it (or raises where
+## it didn't) is reported.
+##    python -m worlds.manual_warframe_zid.benchmarks.RuleFuzzer --expressions 2000 --states 32
+##    python -m worlds.manual_warframe_zid.benchmarks.RuleFuzzer --scale 10 --engine mymodule:create_engine
+######################################################################################
+
+import argparse
+import importlib
+import json
+import logging
+import random
+import time
+from types import ModuleType
+from typing import Callable, Optional
+
+from . import SyntheticData
+from .Generation import prepare_world, build_random_states
+
+# name -> function taking the prepared world and returning an evaluate(state, area) -> bool
+rule_engines: dict[str, Callable] = {}
+
+
+def register_rule_engine(name: str, create_engine: Callable):
+    """Add an engine to compare against the current one. create_engine(world) must return a function taking (state, area)."""
+    rule_engines[name] = create_engine
+
+def _create_current_engine(world):
+    rules = importlib.import_module(f"{type(world).__module__}.Rules")
+    return rules.create_requires_checks(world, world.multiworld, world.player)[2]
+
+register_rule_engine("current", _create_current_engine)
+
+def _create_client_engine(world):
+    client_logic = importlib.import_module(f"{type(world).__module__}.ClientLogic").ClientLogic.from_world(world)
+
+    def evaluate(state, area):
+        counts = state.prog_items[world.player]
+        if client_logic.counts is not counts:
+            client_logic.set_counts(counts, compare=False)
+        # functions get the real world and state, so this checks the client's own parsing and counting
+        client_logic.function_context = (world, world.multiworld, state, world.player)
+        return client_logic.check_requires(area)
+    return evaluate
+
+register_rule_engine("client", _create_client_engine)
+
+
+class ExpressionGenerator:
+    """Random requires strings and lists built from the items, categories and values of a world"""
+
+    def __init__(self, world, rng: random.Random):
+        self.rng = rng
+        self.item_names = sorted(world.item_name_to_item.keys())
+        self.categories = sorted({category for item in world.item_name_to_item.values() for category in item.get("category", [])})
+        items = importlib.import_module(f"{type(world).__module__}.Items")
+        self.value_names = list(items.item_value_names)
+        self.option_names = [name for name in world.options_dataclass.type_hints.keys()]
+
+    def _count(self) -> str:
+        return str(self.rng.choice([1, 1, 1, 2, 3, self.rng.randint(0, 10)]))
+
+    def leaf(self) -> str:
+        rng = self.rng
+        kind = rng.random()
+        if kind < 0.45 or not self.categories:
+            item_name = rng.choice(self.item_names)
+            return f"|{item_name}|" if rng.random() < 0.5 else f"|{item_name}:{self._count()}|"
+        if kind < 0.8:
+            count = rng.choice(["all", "half", f"{rng.randint(1, 100)}%", self._count()])
+            return f"|@{rng.choice(self.categories)}:{count}|"
+        if kind < 0.88 and self.value_names:
+            return f"{{ItemValue({rng.choice(self.value_names)}:{rng.randint(0, 20)})}}"
+        if kind < 0.94 and self.option_names:
+            return f"{{{rng.choice(['YamlEnabled', 'YamlDisabled'])}({rng.choice(self.option_names)})}}"
+        if kind < 0.97:
+            return f"{{OptOne(|{rng.choice(self.item_names)}:{self._count()}|)}}"
+        # the string OptAll returns is read as part of the requires around it, with its AND/OR
+        operator = rng.choice(["AND", "OR"])
+        return f"{{OptAll(|{rng.choice(self.item_names)}:{self._count()}| {operator} |{rng.choice(self.item_names)}|)}}"
+
+    def expression(self, depth: int = 0) -> str:
+        if depth >= 4 or self.rng.random() < 0.35:
+            return self.leaf()
+
+        operator = self.rng.choice(["AND", "OR", "and", "or"])
+        parts = [self.expression(depth + 1) for _ in range(self.rng.randint(2, 3))]
+        joined = f" {operator} ".join(parts)
+        return f"({joined})" if depth and self.rng.random() < 0.7 else joined
+
+    def requires_list(self) -> list:
+        requires = []
+        for _ in range(self.rng.randint(1, 3)):
+            if self.rng.random() < 0.3:
+                requires.append({"or": [f"{self.rng.choice(self.item_names)}:{self._count()}" for _ in range(self.rng.randint(1, 3))]})
+            else:
+                requires.append(f"{self.rng.choice(self.item_names)}:{self._count()}")
+        return requires
+
+def collect_data_requires(module: ModuleType) -> list[dict]:
+    """Every location and region of the world's data that has requires, as areas to evaluate"""
+    areas = [dict(location) for location in module.location_table if location.get("requires")]
+    areas += [{"name": name, **region} for name, region in module.region_table.items() if region.get("requires")]
+    return areas
+
+def _evaluate(evaluate: Callable, state, area: dict):
+    try:
+        return bool(evaluate(state, area))
+    except Exception as e:
+        return f"raised {type(e).__name__}"
+
+def run_fuzzer(module: ModuleType, expressions: int = 1000, states: int = 16, seed: int = 0, engines: Optional[list[str]] = None) -> dict:
+    """Evaluate the data's requires and generated ones with every engine and compare them to the current engine"""
+    rng = random.Random(seed)
+    world = prepare_world(module, seed, "generate_basic")
+
+    generator = ExpressionGenerator(world, rng)
+    areas = collect_data_requires(module)
+    for index in range(expressions):
+        requires = generator.requires_list() if rng.random() < 0.1 else generator.expression()
+        areas.append({"name": f"Fuzzed {index}", "requires": requires})
+
+    collection_states = build_random_states(world, states, seed)
+
+    engine_names = ["current"] + [name for name in (engines or rule_engines.keys()) if name != "current"]
+    results = {}
+    report = {"game": world.game, "areas": len(areas), "states": len(collection_states), "engines": {}}
+    for name in engine_names:
+        evaluate = rule_engines[name](world)
+        start = time.perf_counter()
+        results[name] = [[_evaluate(evaluate, state, area) for state in collection_states] for area in areas]
+        seconds = time.perf_counter() - start
+
+        evaluations = len(areas) * len(collection_states)
+        report["engines"][name] = {"seconds": seconds, "per_second": evaluations / seconds if seconds else None, "disagreements": []}
+
+    oracle = results["current"]
+    for name in engine_names[1:]:
+        disagreements = report["engines"][name]["disagreements"]
+        for area, expected_row, row in zip(areas, oracle, results[name]):
+            for state_index, (expected, result) in enumerate(zip(expected_row, row)):
+                if expected != result:
+                    disagreements.append({"area": area["name"], "requires": area["requires"], "state": state_index,
+                                          "expected": expected, "result": result})
+    return report
+
+def format_report(report: dict, max_disagreements: int = 20) -> str:
+    lines = [f"{report['game']}: {report['areas']} requires against {report['states']} states", ""]
+    for name, engine in report["engines"].items():
+        per_second = f"{engine['per_second']:,.0f} evaluations/s" if engine["per_second"] else "-"
+        status = "oracle" if name == "current" else f"{len(engine['disagreements'])} disagreement(s)"
+        lines.append(f"{name.ljust(16)} {engine['seconds']:9.3f}s  {per_second.rjust(24)}  {status}")
+
+    for name, engine in report["engines"].items():
+        for disagreement in engine["disagreements"][:max_disagreements]:
+            lines.append("")
+            lines.append(f"{name} on {disagreement['area']} (state {disagreement['state']}): "
+                         f"expected {disagreement['expected']}, got {disagreement['result']}")
+            lines.append(f"   requires: {json.dumps(disagreement['requires'])}")
+    return "\n".join(lines)
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Compare requires evaluation engines against the current one.")
+    parser.add_argument("--expressions", type=int, default=1000, help="How many random requires to generate.")
+    parser.add_argument("--states", type=int, default=16, help="How many random states to evaluate them against.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scale", type=int, default=None, help="Use synthetic data of this scale instead of this world's data.")
+    parser.add_argument("--engine", action="append", default=[],
+                        help="Only run these engines, by registered name or as module:function returning an engine from the world.")
+    parser.add_argument("--output", default=None, help="Write the full report as json to this file.")
+    parsed = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    engines = []
+    for engine in parsed.engine:
+        if ":" in engine:
+            module_name, function_name = engine.split(":", 1)
+            register_rule_engine(engine, getattr(importlib.import_module(module_name), function_name))
+        engines.append(engine)
+
+    if parsed.scale is None:
+        module = importlib.import_module(__package__.rpartition(".")[0])
+    else:
+        module = SyntheticData.load_synthetic_world(parsed.scale, parsed.seed)
+
+    try:
+        report = run_fuzzer(module, parsed.expressions, parsed.states, parsed.seed, engines or None)
+    finally:
+        SyntheticData.unload_synthetic_worlds()
+
+    if parsed.output:
+        with open(parsed.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    print(format_report(report))
+
+if __name__ == "__main__":
+    main()
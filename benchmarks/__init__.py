@@ -0,0 +1,7 @@
+######################################################################################
+## Benchmarks of this world against synthetic data, see SyntheticData.py.
+## Run them from the root of an Archipelago source install, with this world unzipped in worlds/:
+##    python -m worlds.manual_warframe_zid.benchmarks.Generation --scale 1 --scale 10 --scale 100
+##    python -m worlds.manual_warframe_zid.benchmarks.MultiSlot --slots 1 --slots 50 --slots 200
+##    python -m worlds.manual_warframe_zid.benchmarks.RuleFuzzer --expressions 2000
+######################################################################################
@@ -0,0 +1,76 @@
+import random
+from collections import Counter
+from unittest import TestCase
+
+from test.TestBase import WorldTestBase
+from .ClientLogic import ClientLogic
+from .Game import game_name
+from .benchmarks.Generation import build_random_states
+from .benchmarks.RuleFuzzer import ExpressionGenerator, rule_engines
+
+
+class ClientLogicParityTest(WorldTestBase):
+    """ClientLogic has to agree with Rules.py on every requires, like the client engine of the RuleFuzzer"""
+    game = game_name
+
+    def test_requires(self):
+        world = self.multiworld.worlds[self.player]
+        rng = random.Random(0)
+        generator = ExpressionGenerator(world, rng)
+        areas = [location for location in world.location_name_to_location.values() if location.get("requires")]
+        areas += [{"name": f"Generated {index}", "requires": generator.requires_list() if index % 10 == 0 else generator.expression()}
+                  for index in range(300)]
+
+        expected_engine, client_engine = rule_engines["current"](world), rule_engines["client"](world)
+        for state in build_random_states(world, 8, 0):
+            for area in areas:
+                with self.subTest(requires=area["requires"]):
+                    try:
+                        expected = expected_engine(state, area)
+                    except Exception as e:
+                        self.assertRaises(type(e), client_engine, state, area)
+                        continue
+                    self.assertEqual(client_engine(state, area), expected)
+
+    def test_reachable_locations(self):
+        world = self.multiworld.worlds[self.player]
+        logic = ClientLogic.from_world(world)
+        for state in build_random_states(world, 8, 0):
+            counts = Counter({name: count for name, count in state.prog_items[self.player].items() if name in world.item_name_to_item})
+            logic.set_counts(counts)
+            expected = {location.name for location in self.multiworld.get_locations(self.player) if location.can_reach(state)}
+            self.assertEqual(set(logic.get_reachable_locations(location.name for location in self.multiworld.get_locations(self.player))), expected)
+
+
+class ClientLogicOptionsTest(TestCase):
+    items = {"A": {"name": "A", "count": 1}}
+    locations = {
+        "Needs Option": {"name": "Needs Option", "region": "Manual", "requires": "{YamlEnabled(test_option)} or |A|"},
+        "Needs A": {"name": "Needs A", "region": "Manual", "requires": "|A|"},
+        "Free": {"name": "Free", "region": "Manual", "requires": ""},
+        "In Gated Region": {"name": "In Gated Region", "region": "Gated", "requires": ""},
+    }
+    regions = {
+        "Menu": {"connects_to": ["Manual"]},
+        "Manual": {"connects_to": ["Gated"]},
+        "Gated": {"requires": "{YamlDisabled(other_option)}"},
+    }
+
+    def test_unknown_options(self):
+        logic = ClientLogic(self.items, self.locations, self.regions, {})
+        logic.set_counts(Counter({"A": 1}))
+        self.assertEqual(logic.get_reachable_locations(), ["Needs A", "Free"])
+        self.assertEqual(logic.unknown_locations, {"Needs Option", "In Gated Region"})
+        self.assertEqual(logic.unknown_regions, {"Gated"})
+
+    def test_known_options(self):
+        logic = ClientLogic(self.items, self.locations, self.regions, {"test_option": 1, "other_option": 0})
+        self.assertEqual(logic.get_reachable_locations(), ["Needs Option", "Free", "In Gated Region"])
+        self.assertEqual(logic.unknown_locations, set())
+
+    def test_options_the_game_doesnt_have(self):
+        # like in generation, they're off
+        logic = ClientLogic(self.items, self.locations, self.regions, {}, option_names=["test_option"])
+        logic.set_counts(Counter({"A": 1}))
+        self.assertEqual(logic.get_reachable_locations(), ["Needs A", "Free", "In Gated Region"])
+        self.assertEqual(logic.unknown_locations, {"Needs Option"})
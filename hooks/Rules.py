@@ -1,6 +1,7 @@
 from typing import Optional
 from worlds.AutoWorld import World
-from ..Helpers import clamp, get_items_with_value
+from ..Helpers import clamp
+from ..Items import get_item_value_key
 from BaseClasses import MultiWorld, CollectionState
 
 import re
@@ -37,30 +38,9 @@ def ItemValue(world: World, multiworld: MultiWorld, state: CollectionState, play
     args_list = args.split(":")
     if not len(args_list) == 2 or not args_list[1].isnumeric():
         raise Exception(f"ItemValue needs a number after : so it looks something like 'ItemValue({args_list[0]}:12)'")
-    args_list[0] = args_list[0].lower().strip()
-    args_list[1] = int(args_list[1].strip())
-
-    if not hasattr(world, 'item_values_cache'): #Cache made for optimization purposes
-        world.item_values_cache = {}
-
-    if not world.item_values_cache.get(player, {}):
-        world.item_values_cache[player] = {
-            'state': {},
-            'count': {},
-            }
-
-    if (args_list[0] not in world.item_values_cache[player].get('count', {}).keys()
-            or world.item_values_cache[player].get('state') != dict(state.prog_items[player])):
-        #Run First Time or if state changed since last check
-        existing_item_values = get_items_with_value(world, multiworld, args_list[0])
-        total_Count = 0
-        for name, value in existing_item_values.items():
-            count = state.count(name, player)
-            if count > 0:
-                total_Count += count * value
-        world.item_values_cache[player]['count'][args_list[0]] = total_Count
-        world.item_values_cache[player]['state'] = dict(state.prog_items[player]) #save the current gotten items to check later if its the same
-    return world.item_values_cache[player]['count'][args_list[0]] >= args_list[1]
+
+    # the running total of each value is kept up to date by ManualWorld.collect and remove
+    return state.prog_items[player][get_item_value_key(args_list[0])] >= int(args_list[1].strip())
 
 
 # Two useful functions to make require work if an item is disabled instead of making it inaccessible
@@ -135,3 +115,10 @@ def canReachLocation(world: World, multiworld: MultiWorld, state: CollectionStat
     if state.can_reach_location(location, player):
         return True
     return False
+
+# Rule to expose the can_reach_region core function
+def canReachRegion(world: World, multiworld: MultiWorld, state: CollectionState, player: int, region: str):
+    """Can the player reach the given region?"""
+    if state.can_reach_region(region, player):
+        return True
+    return False
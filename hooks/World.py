@@ -27,6 +27,9 @@ import logging
 ##
 ## The create_item method is used by plando and start_inventory settings to create an item from an item name.
 ## The fill_slot_data method will be used to send data to the Manual client for later use, like deathlink.
+##
+## Hooks left as they are here (only returning what they were given, or nothing) are skipped during generation.
+## To skip one that still has other code in it, decorate it with @noop_hook from ..Hooks.
 ########################################################################################
 
 
@@ -0,0 +1,99 @@
+from types import ModuleType
+from unittest import TestCase
+
+from .Hooks import Hook, hook_modules, is_noop_hook, noop_hook, register_hook_module
+
+
+def returns_first(value, world, player):
+    return value
+
+def returns_none(world, player):
+    pass
+
+def returns_false(world, player):
+    return False
+
+def returns_true(world, player):
+    return True
+
+def appends(value, world, player):
+    return value + [world]
+
+@noop_hook
+def logs(world, player):
+    print(world, player)
+
+def _module(name: str, **functions) -> ModuleType:
+    module = ModuleType(name)
+    module.__dict__.update(functions)
+    return module
+
+
+class IsNoopHookTest(TestCase):
+    def test_kinds(self):
+        expected = {
+            "filter": {returns_first: True, returns_none: False, returns_false: False, returns_true: False},
+            "first": {returns_first: False, returns_none: True, returns_false: False, returns_true: False},
+            "any": {returns_first: False, returns_none: True, returns_false: True, returns_true: False},
+            "notify": {returns_first: True, returns_none: True, returns_false: True, returns_true: False},
+        }
+        for kind, functions in expected.items():
+            for func, noop in functions.items():
+                with self.subTest(kind=kind, func=func.__name__):
+                    self.assertEqual(is_noop_hook(func, kind), noop)
+
+    def test_not_noop(self):
+        self.assertFalse(is_noop_hook(appends, "filter"))
+        self.assertFalse(is_noop_hook(print, "notify"))
+
+    def test_marked(self):
+        for kind in ("filter", "first", "any", "notify"):
+            self.assertTrue(is_noop_hook(logs, kind))
+
+
+class HookTest(TestCase):
+    def tearDown(self):
+        hook_modules.pop("Test", None)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            Hook("Test", "anything", "all")
+
+    def test_noop_hooks_are_falsy(self):
+        register_hook_module("Test", _module("hooks.Test", filter_items=returns_first))
+        hook = Hook("Test", "filter_items", "filter")
+        self.assertFalse(hook)
+        self.assertEqual(hook([1], "world", 1), [1])
+
+    def test_filter(self):
+        register_hook_module("Test", _module("hooks.Test", filter_items=appends))
+        register_hook_module("Test", _module("hooks.Other", filter_items=appends))
+        hook = Hook("Test", "filter_items", "filter")
+        self.assertTrue(hook)
+        self.assertEqual(hook([], "world", 1), ["world", "world"])
+
+    def test_first(self):
+        register_hook_module("Test", _module("hooks.Test", get_item=returns_none))
+        register_hook_module("Test", _module("hooks.Other", get_item=lambda world, player: world))
+        register_hook_module("Test", _module("hooks.Last", get_item=lambda world, player: player))
+        self.assertEqual(Hook("Test", "get_item", "first")("world", 1), "world")
+
+    def test_any(self):
+        calls = []
+        register_hook_module("Test", _module("hooks.Test", check=lambda world, player: calls.append(1) or True))
+        register_hook_module("Test", _module("hooks.Other", check=lambda world, player: calls.append(2)))
+        self.assertTrue(Hook("Test", "check", "any")("world", 1))
+        self.assertEqual(calls, [1, 2])
+
+    def test_notify(self):
+        calls = []
+        register_hook_module("Test", _module("hooks.Test", after=lambda world, player: calls.append(world) or True))
+        self.assertIsNone(Hook("Test", "after", "notify")("world", 1))
+        self.assertEqual(calls, ["world"])
+
+    def test_registered_after_the_hook(self):
+        hook = Hook("Test", "filter_items", "filter")
+        self.assertFalse(hook)
+        register_hook_module("Test", _module("hooks.Test", filter_items=appends))
+        self.assertTrue(hook)
+        self.assertEqual(hook([], "world", 1), ["world"])
@@ -0,0 +1,60 @@
+import json
+from collections import Counter
+from unittest import mock
+
+from test.TestBase import WorldTestBase
+from . import LogicSummary as LogicSummaryModule
+from .Game import game_name
+from .LogicSummary import LogicSummary, LogicSummaryBuilder, Unsummarizable, build_logic_summary, max_clauses
+from .benchmarks.Generation import build_random_states
+
+
+class LogicSummaryTest(WorldTestBase):
+    game = game_name
+
+    def _item_names(self, count: int) -> list[str]:
+        names = sorted({item.name for item in self.multiworld.itempool if item.player == self.player})
+        if len(names) < count:
+            self.skipTest(f"needs {count} different items in the pool")
+        return names[:count]
+
+    def _any_of(self, names: list[str]) -> str:
+        return "(" + " or ".join(f"|{name}|" for name in names) + ")"
+
+    def test_matches_reachability(self):
+        world = self.multiworld.worlds[self.player]
+        summary = LogicSummary(json.loads(json.dumps(build_logic_summary(world))))
+        self.assertTrue(summary.locations)
+
+        for state in build_random_states(world, 8, 0):
+            summary.set_counts(Counter({world.item_name_to_id[name]: count for name, count in state.prog_items[self.player].items()
+                                        if name in world.item_name_to_id}))
+            for location in self.multiworld.get_locations(self.player):
+                in_logic = summary.is_location_in_logic(location.address) if location.address is not None else None
+                if in_logic is not None:
+                    self.assertEqual(in_logic, location.can_reach(state), location.name)
+
+    def test_at_the_cap(self):
+        builder = LogicSummaryBuilder(self.multiworld.worlds[self.player])
+        names = self._item_names(32)
+        requires = f"{self._any_of(names[:16])} and {self._any_of(names[16:])}"
+        self.assertEqual(len(builder.summarize_requires({"requires": requires})), max_clauses)
+
+    def test_over_the_cap(self):
+        builder = LogicSummaryBuilder(self.multiworld.worlds[self.player])
+        names = self._item_names(60)
+        requires = " and ".join(self._any_of(names[index:index + 20]) for index in range(0, 60, 20))
+        with self.assertRaises(Unsummarizable):
+            builder.summarize_requires({"requires": requires})
+
+    def test_build_leaves_out_what_is_over_the_cap(self):
+        world = self.multiworld.worlds[self.player]
+        full = build_logic_summary(world)
+        with mock.patch.object(LogicSummaryModule, "max_clauses", 0):
+            capped = build_logic_summary(world)
+
+        # only the locations that can never be in logic have no clauses
+        self.assertLess(len(capped["locations"]), len(full["locations"]))
+        for location_id, clauses in capped["locations"].items():
+            self.assertEqual(clauses, [])
+            self.assertEqual(full["locations"][location_id], [])
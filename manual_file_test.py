@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+from base64 import b64decode, b64encode
+from unittest import TestCase
+
+from .ManualFile import apmanual_magic, apmanual_version, apmanual_flag_compressed, read_apmanual_file, write_apmanual_file, _chunk_size
+
+
+class ManualFileTest(TestCase):
+    data = {
+        "game": "Manual_Test_Tester",
+        "items": {str(i): {"name": f"Item {i}", "category": ["Test"], "count": i % 3 + 1} for i in range(2000)},
+        "slot_data": {"text": "ünïcödé ✓", "empty": [], "nested": {"a": [1, 2.5, None, True]}},
+    }
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".apmanual")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        for compress in (True, False):
+            with self.subTest(compress=compress):
+                write_apmanual_file(self.path, self.data, compress)
+                self.assertEqual(read_apmanual_file(self.path), self.data)
+
+    def test_header(self):
+        for compress in (True, False):
+            with self.subTest(compress=compress):
+                write_apmanual_file(self.path, self.data, compress)
+                with open(self.path, "rb") as f:
+                    header = b64decode(f.read(16))
+                self.assertEqual(header[:len(apmanual_magic)], apmanual_magic)
+                self.assertEqual(header[len(apmanual_magic)], apmanual_version)
+                self.assertEqual(header[len(apmanual_magic) + 1], apmanual_flag_compressed if compress else 0)
+
+    def test_larger_than_a_chunk(self):
+        data = {"text": "x" * (_chunk_size * 2 + 7)}
+        for compress in (True, False):
+            with self.subTest(compress=compress):
+                write_apmanual_file(self.path, data, compress)
+                self.assertEqual(read_apmanual_file(self.path), data)
+
+    def test_read_version_1(self):
+        with open(self.path, "wb") as f:
+            f.write(b64encode(json.dumps(self.data).encode("utf-8")))
+        self.assertEqual(read_apmanual_file(self.path), self.data)
+
+    def test_read_with_line_breaks(self):
+        write_apmanual_file(self.path, self.data)
+        with open(self.path, "rb") as f:
+            encoded = f.read()
+        with open(self.path, "wb") as f:
+            f.write(b"\r\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76)))
+        self.assertEqual(read_apmanual_file(self.path), self.data)
+
+    def test_newer_version(self):
+        with open(self.path, "wb") as f:
+            f.write(b64encode(apmanual_magic + bytes([apmanual_version + 1, 0]) + b"{}"))
+        with self.assertRaises(Exception):
+            read_apmanual_file(self.path)
@@ -0,0 +1,147 @@
+from collections import Counter
+from typing import Callable, Collection, Iterable, Optional
+
+######################################################################################
+## Data behind the Manual client's tracker, kept apart from the widgets showing it.
+##
+## Received items are counted as they arrive, so each ReceivedItems entry costs the same
+## no matter how many items came before it. Missing locations are listed per category once,
+## instead of as a widget per category they're in. The view asks what changed since it last
+## looked and only touches those widgets.
+######################################################################################
+
+no_category = "(No Category)"
+hinted_category = "(Hinted)"
+
+
+class TrackerModel:
+    """Counts of the received items, per item and per category.\n
+    get_item_categories(item_id) returns the categories of an item, items without any are put in no_category.
+    """
+
+    def __init__(self, get_item_categories: Callable[[int], Iterable[str]]):
+        self.get_item_categories = get_item_categories
+        self.reset()
+
+    def reset(self):
+        self.item_counts: Counter = Counter()
+        # only the items received as progression, the ones CollectionState.prog_items counts
+        self.progression_counts: Counter = Counter()
+        self.category_counts: Counter = Counter()
+        # item ids of each category, in the order they were first received
+        self.category_items: dict[str, list[int]] = {}
+        self.received_count = 0
+        self.changed_items: set[int] = set()
+        self.changed_categories: set[str] = set()
+        self._categories: dict[int, tuple[str, ...]] = {}
+        self._source: Optional[list] = None
+
+    def categories_of(self, item_id: int) -> tuple[str, ...]:
+        categories = self._categories.get(item_id)
+        if categories is None:
+            categories = tuple(self.get_item_categories(item_id)) or (no_category,)
+            self._categories[item_id] = categories
+        return categories
+
+    def update(self, items_received: list) -> bool:
+        """Count the entries of items_received that weren't counted yet, returns True if anything changed.\n
+        A new or shorter list (like after a reconnect) is counted again from the start."""
+        if items_received is not self._source or len(items_received) < self.received_count:
+            # what was counted before is changed too, now that it's back to 0
+            previous_items, previous_categories = set(self.item_counts.keys()), set(self.category_items.keys())
+            self.reset()
+            self._source = items_received
+            self.changed_items.update(previous_items)
+            self.changed_categories.update(previous_categories)
+
+        for network_item in items_received[self.received_count:]:
+            self.add_item(network_item.item, progression=bool(network_item.flags & 0b001))
+        self.received_count = len(items_received)
+
+        return bool(self.changed_items or self.changed_categories)
+
+    def add_item(self, item_id: int, count: int = 1, progression: bool = True):
+        self.item_counts[item_id] += count
+        if progression:
+            self.progression_counts[item_id] += count
+        self.changed_items.add(item_id)
+
+        for category in self.categories_of(item_id):
+            if self.item_counts[item_id] == count:
+                self.category_items.setdefault(category, []).append(item_id)
+            self.category_counts[category] += count
+            self.changed_categories.add(category)
+
+    def unique_count(self, category: str) -> int:
+        """How many different items of the category were received"""
+        return len(self.category_items.get(category, []))
+
+    def mark_all_changed(self):
+        """Flag every counted item and category as changed, eg. after the view was rebuilt"""
+        self.changed_items.update(self.item_counts.keys())
+        self.changed_categories.update(self.category_items.keys())
+
+    def pop_changes(self) -> tuple[set[int], set[str]]:
+        """Return the items and categories changed since the last call, and forget them"""
+        changes = self.changed_items, self.changed_categories
+        self.changed_items, self.changed_categories = set(), set()
+        return changes
+
+
+class LocationModel:
+    """The missing locations listed under each category, in the order they were added.\n
+    get_location_categories(location_id) returns the categories of a location, is_category_hidden(category) whether to leave one out.
+    Locations without any category are put in no_category, ones whose categories are all hidden aren't listed.
+    """
+
+    def __init__(self, get_location_categories: Callable[[int], Iterable[str]], is_category_hidden: Callable[[str], bool]):
+        self.get_location_categories = get_location_categories
+        self.is_category_hidden = is_category_hidden
+        self.reset()
+
+    def reset(self, location_ids: Iterable[int] = ()):
+        # dicts as ordered sets, so removing a location doesn't go through the whole category
+        self.category_locations: dict[str, dict[int, None]] = {}
+        self.location_categories: dict[int, list[str]] = {}
+        self.changed_categories: set[str] = set()
+        for location_id in location_ids:
+            self.add(location_id)
+
+    def add(self, location_id: int):
+        categories = list(self.get_location_categories(location_id)) or [no_category]
+        for category in categories:
+            if not self.is_category_hidden(category):
+                self.add_to_category(location_id, category)
+
+    def add_to_category(self, location_id: int, category: str) -> bool:
+        """List a location under one more category, returns False if it already was"""
+        locations = self.category_locations.setdefault(category, {})
+        if location_id in locations:
+            return False
+
+        locations[location_id] = None
+        self.location_categories.setdefault(location_id, []).append(category)
+        self.changed_categories.add(category)
+        return True
+
+    def remove(self, location_id: int):
+        for category in self.location_categories.pop(location_id, []):
+            del self.category_locations[category][location_id]
+            self.changed_categories.add(category)
+
+    def retain(self, location_ids: Collection[int]):
+        """Remove every listed location that isn't in location_ids"""
+        for location_id in [location_id for location_id in self.location_categories if location_id not in location_ids]:
+            self.remove(location_id)
+
+    def locations_of(self, category: str) -> Iterable[int]:
+        return self.category_locations.get(category, {}).keys()
+
+    def mark_all_changed(self):
+        self.changed_categories.update(self.category_locations.keys())
+
+    def pop_changes(self) -> set[str]:
+        """Return the categories changed since the last call, and forget them"""
+        changes = self.changed_categories
+        self.changed_categories = set()
+        return changes
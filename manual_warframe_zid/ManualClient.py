@@ -1,704 +1,837 @@
-from __future__ import annotations
-import time
-from typing import Any
-import typing
-from worlds import AutoWorldRegister, network_data_package
-import json
-
-import asyncio, re
-
-import ModuleUpdate
-ModuleUpdate.update()
-
-import Utils
-from kivy.metrics import dp
-
-if __name__ == "__main__":
-    Utils.init_logging("ManualClient", exception_logger="Client")
-
-from NetUtils import ClientStatus
-from CommonClient import gui_enabled, logger, get_base_parser, ClientCommandProcessor, server_loop
-
-tracker_loaded = False
-try:
-    from worlds.tracker.TrackerClient import TrackerGameContext as SuperContext, TrackerCommandProcessor
-    ClientCommandProcessor = TrackerCommandProcessor
-    tracker_loaded = True
-except ModuleNotFoundError:
-    from CommonClient import CommonContext as SuperContext
-
-class ManualClientCommandProcessor(ClientCommandProcessor):
-    def _cmd_resync(self):
-        """Manually trigger a resync."""
-        self.output(f"Syncing items.")
-        self.ctx.syncing = True
-
-
-class ManualContext(SuperContext):
-    command_processor: int = ManualClientCommandProcessor
-    game = "not set"  # this is changed in server_auth below based on user input
-    items_handling = 0b111  # full remote
-    tags = {"AP"}
-
-    location_table = {}
-    item_table = {}
-    region_table = {}
-    category_table = {}
-
-    tracker_reachable_locations = []
-    tracker_reachable_events = []
-
-    set_deathlink = False
-    last_death_link = 0
-    deathlink_out = False
-
-    def __init__(self, server_address, password, game, player_name) -> None:
-        super(ManualContext, self).__init__(server_address, password)
-
-        if tracker_loaded:
-            super().set_callback(self.on_tracker_updated) # Universal Tracker takes this func and calls it when updateTracker is called
-            if hasattr(self, "set_events_callback"):
-                super().set_events_callback(self.on_tracker_events) # Universal Tracker takes this func and calls it when events are calculated
-
-        self.send_index: int = 0
-        self.syncing = False
-        self.game = game
-        self.username = player_name
-
-    async def server_auth(self, password_requested: bool = False):
-        if password_requested and not self.password:
-            await super(ManualContext, self).server_auth(password_requested)
-
-        if "Manual_" not in self.ui.game_bar_text.text:
-            raise Exception("The Manual client can only be used for Manual games.")
-
-        self.game = self.ui.game_bar_text.text
-
-        world = AutoWorldRegister.world_types.get(self.game)
-        if not self.location_table and not self.item_table and world is None:
-            raise Exception(f"Cannot load {self.game}, please add the apworld to lib/worlds/")
-
-        data_package = network_data_package["games"].get(self.game, {})
-
-        self.update_ids(data_package)
-
-        if world is not None and hasattr(world, "victory_names"):
-            self.victory_names = world.victory_names
-            self.goal_location = self.get_location_by_name(world.victory_names[0])
-        else:
-            self.victory_names = ["__Manual Game Complete__"]
-            self.goal_location = self.get_location_by_name("__Manual Game Complete__")
-
-        await self.get_username()
-        await self.send_connect()
-
-    async def connection_closed(self):
-        await super(ManualContext, self).connection_closed()
-
-    @property
-    def suggested_game(self) -> str:
-        if self.game:
-            return self.game
-        from .Game import game_name  # This will at least give us the name of a manual they've installed
-        return Utils.persistent_load().get("client", {}).get("last_manual_game", game_name)
-
-    def get_location_by_name(self, name) -> dict[str, Any]:
-        location = self.location_table.get(name)
-        if not location:
-            # It is absolutely possible to pull categories from the data_package via self.update_game. I have not done this yet.
-            location = AutoWorldRegister.world_types[self.game].location_name_to_location.get(name, {"name": name})
-        return location
-
-    def get_location_by_id(self, id) -> dict[str, Any]:
-        name = self.location_names[id]
-        return self.get_location_by_name(name)
-
-    def get_item_by_name(self, name):
-        item = self.item_table.get(name)
-        if not item:
-            item = AutoWorldRegister.world_types[self.game].item_name_to_item.get(name, {"name": name})
-        return item
-
-    def get_item_by_id(self, id):
-        name = self.item_names[id]
-        return self.get_item_by_name(name)
-
-    def update_ids(self, data_package) -> None:
-        self.location_names_to_id = data_package['location_name_to_id']
-        self.item_names_to_id = data_package['item_name_to_id']
-
-    def update_data_package(self, data_package: dict):
-        super().update_data_package(data_package)
-        for game, game_data in data_package["games"].items():
-            if game == self.game:
-                self.update_ids(game_data)
-
-    @property
-    def endpoints(self):
-        if self.server:
-            return [self.server]
-        else:
-            return []
-
-    async def shutdown(self):
-        await super(ManualContext, self).shutdown()
-
-    def on_package(self, cmd: str, args: dict):
-        super().on_package(cmd, args)
-
-        if cmd in {"Connected", "DataPackage"}:
-            if cmd == "Connected":
-                Utils.persistent_store("client", "last_manual_game", self.game)
-                goal = args["slot_data"].get("goal")
-                if goal and goal < len(self.victory_names):
-                    self.goal_location = self.get_location_by_name(self.victory_names[goal])
-                if args['slot_data'].get('death_link'):
-                    self.ui.enable_death_link()
-                    self.set_deathlink = True
-                    self.last_death_link = 0
-                logger.info(f"Slot data: {args['slot_data']}")
-
-            self.ui.build_tracker_and_locations_table()
-            self.ui.update_tracker_and_locations_table(update_highlights=True)
-        elif cmd in {"ReceivedItems"}:
-            self.ui.update_tracker_and_locations_table(update_highlights=True)
-        elif cmd in {"RoomUpdate"}:
-            self.ui.update_tracker_and_locations_table(update_highlights=False)
-
-    def on_deathlink(self, data: typing.Dict[str, typing.Any]) -> None:
-        super().on_deathlink(data)
-        self.ui.death_link_button.text = f"Death Link: {data['source']}"
-        self.ui.death_link_button.background_color = [1, 0, 0, 1]
-        
-        
-    def on_tracker_updated(self, reachable_locations: list[str]):
-        self.tracker_reachable_locations = reachable_locations
-        self.ui.update_tracker_and_locations_table(update_highlights=True)
-
-    def on_tracker_events(self, events: list[str]):
-        self.tracker_reachable_events = events
-        if events:
-            self.ui.update_tracker_and_locations_table(update_highlights=True)
-
-    def run_gui(self):
-        """Import kivy UI system and start running it as self.ui_task."""
-        from kvui import GameManager
-
-        from kivy.uix.button import Button
-        from kivy.uix.label import Label
-        from kivy.uix.layout import Layout
-        from kivy.uix.boxlayout import BoxLayout
-        from kivy.uix.gridlayout import GridLayout
-        from kivy.uix.scrollview import ScrollView
-        from kivy.uix.textinput import TextInput
-        from kivy.uix.tabbedpanel import TabbedPanelItem
-        from kivy.uix.treeview import TreeView, TreeViewNode, TreeViewLabel
-        from kivy.clock import Clock
-        from kivy.core.window import Window
-
-        class TrackerAndLocationsLayout(GridLayout):
-            pass
-
-        class TrackerLayoutScrollable(ScrollView):
-            pass
-
-        class LocationsLayoutScrollable(ScrollView):
-            pass
-
-        class TreeViewButton(Button, TreeViewNode):
-            victory: bool = False
-            id: int = None
-
-        class TreeViewScrollView(ScrollView, TreeViewNode):
-            pass
-
-        class ManualManager(GameManager):
-            logging_pairs = [
-                ("Client", "Archipelago"),
-                ("Manual", "Manual"),
-            ]
-            base_title = "Archipelago Manual Client"
-            listed_items = {"(No Category)": []}
-            item_categories = ["(No Category)"]
-            listed_locations = {"(No Category)": []}
-            location_categories = ["(No Category)"]
-
-            active_item_accordion = 0
-            active_location_accordion = 0
-
-            ctx: ManualContext
-
-            def __init__(self, ctx):
-                super().__init__(ctx)
-
-            def build(self) -> Layout:
-                super().build()
-
-                self.manual_game_layout = BoxLayout(orientation="horizontal", size_hint_y=None, height=dp(30))
-
-                game_bar_label = Label(text="Manual Game ID", size=(dp(150), dp(30)), size_hint_y=None, size_hint_x=None)
-                self.manual_game_layout.add_widget(game_bar_label)
-                self.game_bar_text = TextInput(text=self.ctx.suggested_game,
-                                                size_hint_y=None, height=dp(30), multiline=False, write_tab=False)
-                self.manual_game_layout.add_widget(self.game_bar_text)
-
-                self.grid.add_widget(self.manual_game_layout, 3)
-
-                for child in self.tabs.tab_list:
-                    if child.text == "Manual":
-                        panel = child # instead of creating a new TabbedPanelItem, use the one we use above to make the tabs show
-
-                self.tracker_and_locations_panel = panel.content = TrackerAndLocationsLayout(cols = 2)
-
-                self.build_tracker_and_locations_table()
-
-                if tracker_loaded:
-                    self.ctx.build_gui(self)
-
-                return self.container
-
-            def clear_lists(self):
-                self.listed_items = {"(No Category)": []}
-                self.item_categories = ["(No Category)"]
-                self.listed_locations = {"(No Category)": [], "(Hinted)": []}
-                self.location_categories = ["(No Category)", "(Hinted)"]
-
-            def set_active_item_accordion(self, instance):
-                index = 0
-
-                for widget in self.children:
-                    if widget == instance:
-                        self.active_item_accordion = index
-                        return
-
-                    index += 1
-
-            def set_active_location_accordion(self, instance):
-                index = 0
-
-                for widget in self.children:
-                    if widget == instance:
-                        self.active_item_accordion = index
-                        return
-
-                    index += 1
-
-            def enable_death_link(self):
-                if not hasattr(self, "death_link_button"):
-                    self.death_link_button = Button(text="Death Link: Primed",
-                                                size_hint_x=None, width=150)
-                    self.connect_layout.add_widget(self.death_link_button)
-                    self.death_link_button.bind(on_press=self.send_death_link)
-
-            def send_death_link(self, *args):
-                if self.ctx.last_death_link:
-                    self.ctx.last_death_link = 0
-                    self.death_link_button.text = "Death Link: Primed"
-                    self.death_link_button.background_color = [1, 1, 1, 1]
-                else:
-                    self.ctx.deathlink_out = True
-                    self.death_link_button.text = "Death Link: Sent"
-                    self.death_link_button.background_color = [0, 1, 0, 1]
-
-            def update_hints(self):
-                super().update_hints()
-                rebuild = False
-                for hint in self.ctx.stored_data.get(f"_read_hints_{self.ctx.team}_{self.ctx.slot}", []):
-                    if hint["finding_player"] == self.ctx.slot:
-                        if hint["location"] in self.ctx.missing_locations:
-                            location = self.ctx.get_location_by_id(hint["location"])
-                            location["category"] = location.get("category", [])
-                            if "(Hinted)" not in location["category"]:
-                                location["category"].append("(Hinted)")
-                                rebuild = True
-
-                if rebuild:
-                    self.build_tracker_and_locations_table()
-                self.update_tracker_and_locations_table()
-
-            def build_tracker_and_locations_table(self):
-                self.tracker_and_locations_panel.clear_widgets()
-
-                if not self.ctx.server or not self.ctx.auth:
-                    self.tracker_and_locations_panel.add_widget(
-                                Label(text="Waiting for connection...", size_hint_y=None, height=50, outline_width=1))
-                    return
-
-                self.clear_lists()
-
-                # seed all category names to start
-                for item in self.ctx.item_table.values() or AutoWorldRegister.world_types[self.ctx.game].item_name_to_item.values():
-                    if "category" in item and len(item["category"]) > 0:
-                        for category in item["category"]:
-                            category_settings = self.ctx.category_table.get(category) or getattr(AutoWorldRegister.world_types[self.ctx.game], "category_table", {}).get(category, {})
-                            if "hidden" in category_settings and category_settings["hidden"]:
-                                continue
-                            if category not in self.item_categories:
-                                self.item_categories.append(category)
-
-                            if category not in self.listed_items:
-                                self.listed_items[category] = []
-
-
-                # Items are not received on connect, so don't bother attempting to work with received items here
-
-                if not self.ctx.location_table and not hasattr(AutoWorldRegister.world_types[self.ctx.game], 'location_name_to_location'):
-                    raise Exception("The apworld for %s is too outdated for this client. Please update it." % (self.ctx.game))
-
-                for location_id in self.ctx.missing_locations:
-                    # holy nesting, wow
-                    location_name = self.ctx.location_names[location_id]
-                    location = self.ctx.get_location_by_name(location_name)
-
-                    if not location:
-                        continue
-
-                    if "category" in location and len(location["category"]) > 0:
-                        for category in location["category"]:
-                            category_settings = self.ctx.category_table.get(category) or getattr(AutoWorldRegister.world_types[self.ctx.game], "category_table", {}).get(category, {})
-                            if "hidden" in category_settings and category_settings["hidden"]:
-                                continue
-                            if category not in self.location_categories:
-                                self.location_categories.append(category)
-
-                            if category not in self.listed_locations:
-                                self.listed_locations[category] = []
-
-                            self.listed_locations[category].append(location_id)
-                    else: # leave it in the generic category
-                        self.listed_locations["(No Category)"].append(location_id)
-
-                victory_location =  self.ctx.goal_location
-                victory_categories = set()
-
-                if "category" in victory_location and len(victory_location["category"]) > 0:
-                    for category in victory_location["category"]:
-                        if category not in self.location_categories:
-                            self.location_categories.append(category)
-
-                        if category not in self.listed_locations:
-                            self.listed_locations[category] = []
-                            victory_categories.add(category)
-
-                if not victory_categories:
-                    victory_categories.add("(No Category)")
-
-                items_length = len(self.ctx.items_received)
-                tracker_panel_scrollable = TrackerLayoutScrollable(do_scroll=(False, True), bar_width=10)
-                tracker_panel = TreeView(root_options=dict(text="Items Received (%d)" % (items_length)), size_hint_y=None)
-                tracker_panel.bind(minimum_height=tracker_panel.setter('height'))
-
-                # Since items_received is not available on connect, don't bother building item labels here
-                for item_category in sorted(self.listed_items.keys()):
-                    category_tree = tracker_panel.add_node(
-                        TreeViewLabel(text = "%s (%s)" % (item_category, len(self.listed_items[item_category])))
-                    )
-
-                    category_scroll = tracker_panel.add_node(TreeViewScrollView(size_hint=(1, None), size=(Window.width / 2, 250)), category_tree)
-                    category_layout = GridLayout(cols=1, size_hint_y=None)
-                    category_layout.bind(minimum_height = category_layout.setter('height'))
-                    category_scroll.add_widget(category_layout)
-
-                locations_length = len(self.ctx.missing_locations)
-                locations_panel_scrollable = LocationsLayoutScrollable(do_scroll=(False, True), bar_width=10)
-                locations_panel = TreeView(root_options=dict(text="Remaining Locations (%d)" % (locations_length + 1)), size_hint_y=None)
-                locations_panel.bind(minimum_height=locations_panel.setter('height'))
-
-                # This seems like a redundant copy of the same check above?
-                if not self.ctx.location_table and not hasattr(AutoWorldRegister.world_types[self.ctx.game], 'location_name_to_location'):
-                    raise Exception("The apworld for %s is too outdated for this client. Please update it." % (self.ctx.game))
-
-                for location_category in sorted(self.listed_locations.keys()):
-                    locations_in_category = len(self.listed_locations[location_category])
-
-                    if ("category" in victory_location and location_category in victory_location["category"]) or \
-                        ("category" not in victory_location and location_category == "(No Category)"):
-                        locations_in_category += 1
-
-                    category_tree = locations_panel.add_node(
-                        TreeViewLabel(text = "%s (%s)" % (location_category, locations_in_category))
-                    )
-
-                    category_scroll = locations_panel.add_node(TreeViewScrollView(size_hint=(1, None), size=(Window.width / 2, 250)), category_tree)
-                    category_layout = GridLayout(cols=1, size_hint_y=None)
-                    category_layout.bind(minimum_height = category_layout.setter('height'))
-                    category_scroll.add_widget(category_layout)
-
-                    for location_id in self.listed_locations[location_category]:
-                        location_button = TreeViewButton(text=self.ctx.location_names[location_id], size_hint=(None, None), height=30, width=400)
-                        location_button.bind(on_press=lambda *args, loc_id=location_id: self.location_button_callback(loc_id, *args))
-                        location_button.id = location_id
-                        category_layout.add_widget(location_button)
-
-                    # if this is the category that Victory is in, display the Victory button
-                    # if ("category" in victory_location_data and location_category in victory_location_data["category"]) or \
-                    #     ("category" not in victory_location_data and location_category == "(No Category)"):
-                    if location_category in victory_categories:
-                        # Add the Victory location to be marked at any point, which is why locations length has 1 added to it above
-                        victory_text = "VICTORY! (seed finished)" if victory_location["name"] == "__Manual Game Complete__" else "GOAL: " + victory_location["name"]
-                        location_button = TreeViewButton(text=victory_text, size_hint=(None, None), height=30, width=400)
-                        location_button.victory = True
-                        location_button.bind(on_press=self.victory_button_callback)
-                        category_layout.add_widget(location_button)
-
-                tracker_panel_scrollable.add_widget(tracker_panel)
-                locations_panel_scrollable.add_widget(locations_panel)
-                self.tracker_and_locations_panel.add_widget(tracker_panel_scrollable)
-                self.tracker_and_locations_panel.add_widget(locations_panel_scrollable)
-
-            def update_tracker_and_locations_table(self, update_highlights=False):
-                items_length = len(self.ctx.items_received)
-                locations_length = len(self.ctx.missing_locations)
-
-                for _, child in enumerate(self.tracker_and_locations_panel.children):
-                    #
-                    # Structure of items:
-                    # TrackerLayoutScrollable -> TreeView -> TreeViewLabel, TreeViewScrollView -> GridLayout -> Label
-                    #        item tracker     -> category -> category label, category scroll   -> label col  -> item
-                    #
-                    if type(child) is TrackerLayoutScrollable:
-                        treeview = child.children[0] # TreeView
-                        treeview_nodes = treeview.iterate_all_nodes()
-
-                        items_received_label = next(treeview_nodes) # always the first node
-                        items_received_label.text = "Items Received (%s)" % (items_length)
-
-                        # loop for each category in listed items and get the label + scrollview
-                        for x in range(0, len(self.item_categories)):
-                            category_label = next(treeview_nodes) # TreeViewLabel for category
-                            category_scrollview = next(treeview_nodes) # TreeViewScrollView for housing category's grid layout
-
-                            old_category_text = category_label.text
-
-                            if type(category_label) is TreeViewLabel and type(category_scrollview) is TreeViewScrollView:
-                                category_grid = category_scrollview.children[0] # GridLayout
-
-                                category_name = re.sub(r"\s\(\d+\)$", "", category_label.text)
-                                category_count = 0
-                                category_unique_name_count = 0
-
-                                # Label (for existing item listings)
-                                for item in category_grid.children:
-                                     if type(item) is Label:
-                                        # Get the item name from the item Label, minus quantity, then do a lookup for count
-                                        old_item_text = item.text
-                                        item_name = re.sub(r"\s\(\d+\)$", "", item.text)
-                                        item_id = self.ctx.item_names_to_id[item_name]
-                                        item_count = len(list(i for i in self.ctx.items_received if i.item == item_id))
-
-                                        # Update the label quantity
-                                        item.text="%s (%s)" % (item_name, item_count)
-
-                                        if update_highlights:
-                                            item.bold = True if old_item_text != item.text else False
-
-                                        if item_count > 0:
-                                            category_count += item_count
-                                            category_unique_name_count += 1
-
-                                # Label (for new item listings)
-                                for network_item in self.ctx.items_received:
-                                    item_name = self.ctx.item_names[network_item.item]
-                                    item_data = self.ctx.get_item_by_name(item_name)
-
-                                    if "category" not in item_data or not item_data["category"]:
-                                        item_data["category"] = ["(No Category)"]
-
-                                    if category_name in item_data["category"] and network_item.item not in self.listed_items[category_name]:
-                                        item_count = len(list(i for i in self.ctx.items_received if i.item == network_item.item))
-                                        item_text = Label(text="%s (%s)" % (item_name, item_count),
-                                                    size_hint=(None, None), height=30, width=400, bold=True)
-
-                                        category_grid.add_widget(item_text)
-                                        self.listed_items[category_name].append(network_item.item)
-
-                                        category_count += item_count
-                                        category_unique_name_count += 1
-
-                            scrollview_height = 30 * category_unique_name_count
-
-                            if scrollview_height > 250:
-                                scrollview_height = 250
-
-                            if scrollview_height < 10:
-                                scrollview_height = 50
-
-                            category_name = re.sub(r"\s\(\d+\)$", "", category_label.text)
-                            category_label.text = "%s (%s)" % (category_name, category_count)
-
-                            if update_highlights:
-                                category_label.bold = True if old_category_text != category_label.text else False
-
-                            category_scrollview.size=(Window.width / 2, scrollview_height)
-
-                    #
-                    # Structure of locations:
-                    # LocationsLayoutScrollable -> TreeView -> TreeViewLabel, TreeViewScrollView -> GridLayout -> Button
-                    #      location tracker     -> category -> category label, category scroll   -> label col  -> location
-                    #
-                    if type(child) is LocationsLayoutScrollable:
-                        treeview = child.children[0] # TreeView
-                        treeview_nodes = treeview.iterate_all_nodes()
-
-                        locations_remaining_label = next(treeview_nodes) # always the first node
-                        locations_remaining_label.text = "Remaining Locations (%d)" % (locations_length)
-
-                        # loop for each category in listed items and get the label + scrollview
-                        for x in range(0, len(self.location_categories)):
-                            category_label = next(treeview_nodes) # TreeViewLabel for category
-                            category_scrollview = next(treeview_nodes) # TreeViewScrollView for housing category's grid layout
-
-                            if type(category_label) is TreeViewLabel and type(category_scrollview) is TreeViewScrollView:
-                                category_grid = category_scrollview.children[0] # GridLayout
-
-                                category_name = re.sub(r"\s\(\d+\/?(\d+)?\)$", "", category_label.text)
-                                category_count = 0
-                                reachable_count = 0
-
-                                buttons_to_remove = []
-
-                                # Label (for existing item listings)
-                                for location_button in category_grid.children:
-                                    if type(location_button) is TreeViewButton:
-                                        # should only be true for the victory location button, which has different text
-                                        if location_button.text not in (self.ctx.location_table or AutoWorldRegister.world_types[self.ctx.game].location_name_to_location):
-                                            category_count += 1
-                                            if location_button.victory and "__Victory__" in self.ctx.tracker_reachable_events:
-                                                location_button.background_color=[2/255, 242/255, 42/255, 1]
-                                                reachable_count += 1
-                                            continue
-
-                                        if location_button.id and location_button.id not in self.ctx.missing_locations:
-                                            import logging
-
-                                            logging.info("location button being removed: " + location_button.text)
-                                            buttons_to_remove.append(location_button)
-                                            continue
-
-                                        if location_button.text in self.ctx.tracker_reachable_locations:
-                                            location_button.background_color=[2/255, 242/255, 42/255, 1]
-                                            reachable_count += 1
-                                        else:
-                                            location_button.background_color=[219/255, 218/255, 213/255, 1]
-
-                                        category_count += 1
-
-                                for location_button in buttons_to_remove:
-                                    location_button.parent.remove_widget(location_button)
-
-                                scrollview_height = 30 * category_count
-
-                                if scrollview_height > 250:
-                                    scrollview_height = 250
-
-                                if scrollview_height < 10:
-                                    scrollview_height = 50
-
-                                count_text = category_count
-
-                                if tracker_loaded:
-                                    count_text = "{}/{}".format(reachable_count, category_count)
-
-                                category_name = re.sub(r"\s\(\d+\/?(\d+)?\)$", "", category_label.text)
-                                category_label.text = "%s (%s)" % (category_name, count_text)
-                                category_scrollview.size=(Window.width / 2, scrollview_height)
-
-            def location_button_callback(self, location_id, button):
-                if button.text not in self.ctx.location_names_to_id:
-                    raise Exception("Locations were not loaded correctly. Please reconnect your client.")
-
-                if location_id:
-                    self.ctx.locations_checked.append(location_id)
-                    self.ctx.syncing = True
-                    button.parent.remove_widget(button)
-
-                    # message = [{"cmd": 'LocationChecks', "locations": [location_id]}]
-                    # self.ctx.send_msgs(message)
-
-            def victory_button_callback(self, button):
-                self.ctx.items_received.append("__Victory__")
-                self.ctx.syncing = True
-
-        self.ui = ManualManager(self)
-
-        if tracker_loaded:
-            self.load_kv()
-
-        self.ui_task = asyncio.create_task(self.ui.async_run(), name="UI")
-
-async def game_watcher_manual(ctx: ManualContext):
-    while not ctx.exit_event.is_set():
-        if ctx.syncing == True:
-            sync_msg = [{'cmd': 'Sync'}]
-            if ctx.locations_checked:
-                sync_msg.append({"cmd": "LocationChecks", "locations": list(ctx.locations_checked)})
-            await ctx.send_msgs(sync_msg)
-            ctx.syncing = False
-
-        if ctx.set_deathlink:
-            ctx.set_deathlink = False
-            await ctx.update_death_link(True)
-
-        if ctx.deathlink_out:
-            ctx.deathlink_out = False
-            await ctx.send_death()
-
-        sending = []
-        victory = ("__Victory__" in ctx.items_received)
-        ctx.locations_checked = sending
-        message = [{"cmd": 'LocationChecks', "locations": sending}]
-        await ctx.send_msgs(message)
-        if not ctx.finished_game and victory:
-            await ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
-            ctx.finished_game = True
-        await asyncio.sleep(0.1)
-
-
-def read_apmanual_file(apmanual_file):
-    from base64 import b64decode
-
-    with open(apmanual_file, 'r') as f:
-        return json.loads(b64decode(f.read()))
-
-
-async def main(args):
-    config_file = {}
-    if args.apmanual_file:
-        config_file = read_apmanual_file(args.apmanual_file)
-    ctx = ManualContext(args.connect, args.password, config_file.get("game"), config_file.get("player_name"))
-    ctx.server_task = asyncio.create_task(server_loop(ctx), name="server loop")
-
-    ctx.item_table = config_file.get("items", {})
-    ctx.location_table = config_file.get("locations", {})
-    ctx.region_table = config_file.get("regions", {})
-    ctx.category_table = config_file.get("categories", {})
-
-    if tracker_loaded:
-        ctx.run_generator()
-    if gui_enabled:
-        ctx.run_gui()
-    ctx.run_cli()
-    progression_watcher = asyncio.create_task(
-        game_watcher_manual(ctx), name="ManualProgressionWatcher")
-
-    await ctx.exit_event.wait()
-    ctx.server_address = None
-
-    await progression_watcher
-
-    await ctx.shutdown()
-
-def launch() -> None:
-    import colorama
-
-    parser = get_base_parser(description="Manual Client, for operating a Manual game in Archipelago.")
-    parser.add_argument('apmanual_file', default="", type=str, nargs="?",
-                        help='Path to an APMANUAL file')
-
-    args, rest = parser.parse_known_args()
-    colorama.init()
-    asyncio.run(main(args))
-    colorama.deinit()
-
-if __name__ == '__main__':
-    launch()
+from __future__ import annotations
+import time
+from collections import Counter
+from typing import Any, Optional
+import typing
+from worlds import AutoWorldRegister, network_data_package
+import json
+
+import asyncio
+
+import ModuleUpdate
+ModuleUpdate.update()
+
+import Utils
+from kivy.metrics import dp
+
+if __name__ == "__main__":
+    Utils.init_logging("ManualClient", exception_logger="Client")
+
+from NetUtils import ClientStatus
+from .ManualFile import read_apmanual_file
+from .ClientModel import TrackerModel, LocationModel, no_category, hinted_category
+from .ClientLogic import ClientLogic, UnknownOption
+from .LogicSummary import LogicSummary
+from CommonClient import gui_enabled, logger, get_base_parser, ClientCommandProcessor, server_loop
+
+tracker_loaded = False
+try:
+    from worlds.tracker.TrackerClient import TrackerGameContext as SuperContext, TrackerCommandProcessor
+    ClientCommandProcessor = TrackerCommandProcessor
+    tracker_loaded = True
+except ModuleNotFoundError:
+    from CommonClient import CommonContext as SuperContext
+
+reachable_color = [2/255, 242/255, 42/255, 1]
+unreachable_color = [219/255, 218/255, 213/255, 1]
+
+class ManualClientCommandProcessor(ClientCommandProcessor):
+    def _cmd_resync(self):
+        """Manually trigger a resync."""
+        self.output(f"Syncing items.")
+        self.ctx.syncing = True
+        self.ctx.wake_watcher()
+
+
+class ManualContext(SuperContext):
+    command_processor: int = ManualClientCommandProcessor
+    game = "not set"  # this is changed in server_auth below based on user input
+    items_handling = 0b111  # full remote
+    tags = {"AP"}
+
+    location_table = {}
+    item_table = {}
+    region_table = {}
+    category_table = {}
+    base_hash = None
+
+    tracker_reachable_locations = []
+    tracker_reachable_events = []
+    # works out tracker_reachable_locations and events when Universal Tracker isn't installed
+    client_logic: Optional[ClientLogic] = None
+    # what each location needs, from the .apmanual file, checked before client_logic
+    logic_summary_data: Optional[dict] = None
+    # the slot the .apmanual file was generated for, its logic summary is only right for that one
+    apmanual_player_id: Optional[int] = None
+    logic_summary: Optional[LogicSummary] = None
+    # how many locations client_logic couldn't tell about, last time it was asked
+    unknown_location_count = 0
+
+    set_deathlink = False
+    last_death_link = 0
+    deathlink_out = False
+
+    # seconds to wait after a location click for more, so they're all sent in one LocationChecks
+    location_check_delay = 0.25
+
+    def __init__(self, server_address, password, game, player_name) -> None:
+        super(ManualContext, self).__init__(server_address, password)
+
+        if tracker_loaded:
+            super().set_callback(self.on_tracker_updated) # Universal Tracker takes this func and calls it when updateTracker is called
+            if hasattr(self, "set_events_callback"):
+                super().set_events_callback(self.on_tracker_events) # Universal Tracker takes this func and calls it when events are calculated
+
+        self.send_index: int = 0
+        self.syncing = False
+        self.victory_reached = False
+        self.location_checks_to_send: set[int] = set()
+        self.watcher_event = asyncio.Event()
+        self.tracker_model = TrackerModel(self.get_item_categories_by_id)
+        self.location_model = LocationModel(self.get_location_categories_by_id, self.is_category_hidden)
+        self.game = game
+        self.username = player_name
+
+    def wake_watcher(self):
+        """Let game_watcher_manual know there is something to send"""
+        self.watcher_event.set()
+
+    def queue_location_check(self, location_id: int):
+        """Mark a location as checked, it will be sent with any other checks made right after it.\n
+        Checks stay in locations_checked, which CommonContext sends again on every Connected,
+        so ones the server never got are retried after a reconnect."""
+        self.locations_checked.add(location_id)
+        self.location_checks_to_send.add(location_id)
+        self.wake_watcher()
+
+    async def server_auth(self, password_requested: bool = False):
+        if password_requested and not self.password:
+            await super(ManualContext, self).server_auth(password_requested)
+
+        if "Manual_" not in self.ui.game_bar_text.text:
+            raise Exception("The Manual client can only be used for Manual games.")
+
+        self.game = self.ui.game_bar_text.text
+
+        world = AutoWorldRegister.world_types.get(self.game)
+        if not self.location_table and not self.item_table and world is None:
+            raise Exception(f"Cannot load {self.game}, please add the apworld to lib/worlds/")
+
+        if world is not None and self.base_hash and getattr(world, "base_table_hash", None) != self.base_hash:
+            logger.warning(f"The installed apworld for {self.game} doesn't match the one this .apmanual was generated with, only the .apmanual's data will be used.")
+
+        data_package = network_data_package["games"].get(self.game, {})
+
+        self.update_ids(data_package)
+
+        if world is not None and hasattr(world, "victory_names"):
+            self.victory_names = world.victory_names
+            self.goal_location = self.get_location_by_name(world.victory_names[0])
+        else:
+            self.victory_names = ["__Manual Game Complete__"]
+            self.goal_location = self.get_location_by_name("__Manual Game Complete__")
+
+        await self.get_username()
+        await self.send_connect()
+
+    async def connection_closed(self):
+        await super(ManualContext, self).connection_closed()
+
+    @property
+    def suggested_game(self) -> str:
+        if self.game:
+            return self.game
+        from .Game import game_name  # This will at least give us the name of a manual they've installed
+        return Utils.persistent_load().get("client", {}).get("last_manual_game", game_name)
+
+    def get_installed_world(self):
+        """Returns the installed world of this game, unless it differs from the one the .apmanual file was generated with"""
+        world = AutoWorldRegister.world_types.get(self.game)
+        if world is not None and self.base_hash and getattr(world, "base_table_hash", None) != self.base_hash:
+            return None
+        return world
+
+    def get_location_by_name(self, name) -> dict[str, Any]:
+        location = self.location_table.get(name)
+        if not location:
+            # It is absolutely possible to pull categories from the data_package via self.update_game. I have not done this yet.
+            world = self.get_installed_world()
+            location = world.location_name_to_location.get(name, {"name": name}) if world else {"name": name}
+        return location
+
+    def get_location_by_id(self, id) -> dict[str, Any]:
+        name = self.location_names[id]
+        return self.get_location_by_name(name)
+
+    def get_location_categories_by_id(self, id) -> list[str]:
+        return self.get_location_by_id(id).get("category", [])
+
+    def is_category_hidden(self, category) -> bool:
+        world = AutoWorldRegister.world_types.get(self.game)
+        category_settings = self.category_table.get(category) or getattr(world, "category_table", {}).get(category, {})
+        return bool(category_settings.get("hidden"))
+
+    @property
+    def logic_loaded(self) -> bool:
+        """Does anything tell which locations are in logic, Universal Tracker or the built-in logic"""
+        return tracker_loaded or self.client_logic is not None or self.logic_summary is not None
+
+    def load_client_logic(self, slot_data: dict):
+        """Set up the built-in logic from the logic summary of the .apmanual file, and for what it leaves out,
+        from the requires in the .apmanual file or else the installed apworld's.
+        Universal Tracker does this itself when it's installed."""
+        if tracker_loaded:
+            return
+
+        self.client_logic = None
+        self.logic_summary = None
+        if self.logic_summary_data and self.apmanual_player_id in (None, self.slot):
+            self.logic_summary = LogicSummary(self.logic_summary_data)
+        if self.logic_summary is not None and self.logic_summary.goal is not None \
+                and all(location_id in self.logic_summary.locations for location_id in self.missing_locations | self.checked_locations):
+            # the summary has every location, no need for the requires
+            self.update_client_logic(force=True)
+            return
+
+        try:
+            if any("count" in item for item in self.item_table.values()):
+                world = self.get_installed_world()
+                option_names = world.options_dataclass.type_hints.keys() if world is not None else None
+                self.client_logic = ClientLogic(self.item_table, self.location_table, self.region_table, slot_data, self.slot,
+                                                option_names=option_names)
+            elif self.get_installed_world() is not None:
+                self.client_logic = ClientLogic.from_world_type(self.get_installed_world(), slot_data, self.slot)
+        except Exception as e:
+            if self.logic_summary is None:
+                logger.warning(f"Couldn't load the requires of {self.game}, locations in logic won't be shown: {e}")
+                return
+            logger.warning(f"Couldn't load the requires of {self.game}, only the locations of the logic summary will be shown in logic: {e}")
+
+        if self.client_logic is None and self.logic_summary is None:
+            logger.info("This .apmanual file has no requires and the apworld isn't installed, locations in logic won't be shown.")
+            return
+        self.update_client_logic(force=True)
+
+    def update_client_logic(self, force: bool = False):
+        """Work out the locations in logic with the built-in logic, if the received items changed since it last did"""
+        if self.client_logic is None and self.logic_summary is None:
+            return
+
+        self.tracker_model.update(self.items_received)
+        changed = force
+        if self.logic_summary is not None:
+            changed = self.logic_summary.set_counts(Counter(self.tracker_model.progression_counts)) or changed
+        if self.client_logic is not None:
+            counts = Counter({self.item_names[item_id]: count for item_id, count in self.tracker_model.progression_counts.items()})
+            changed = self.client_logic.set_counts(counts) or changed
+        if not changed:
+            return
+
+        try:
+            reachable_locations = []
+            # the locations the summary leaves out, for client_logic
+            unsummarized_names = []
+            for location_id in self.missing_locations:
+                in_logic = self.logic_summary.is_location_in_logic(location_id) if self.logic_summary is not None else None
+                if in_logic is None:
+                    unsummarized_names.append(self.location_names[location_id])
+                elif in_logic:
+                    reachable_locations.append(self.location_names[location_id])
+            if unsummarized_names and self.client_logic is not None:
+                reachable_locations += self.client_logic.get_reachable_locations(unsummarized_names)
+                unknown_count = len(self.client_logic.unknown_locations)
+                if unknown_count and unknown_count != self.unknown_location_count:
+                    logger.info(f"{unknown_count} locations need options that aren't in the slot data, they won't be shown in logic.")
+                self.unknown_location_count = unknown_count
+            self.tracker_reachable_locations = reachable_locations
+
+            goal_name = self.goal_location.get("name")
+            goal_in_logic = self.logic_summary.is_goal_in_logic() if self.logic_summary is not None else None
+            if goal_in_logic is None and goal_name and self.client_logic is not None:
+                try:
+                    goal_in_logic = self.client_logic.can_reach_location(goal_name)
+                except UnknownOption:
+                    goal_in_logic = False
+            self.tracker_reachable_events = ["__Victory__"] if goal_in_logic else []
+        except Exception as e:
+            logger.warning(f"The requires of {self.game} couldn't be evaluated, locations in logic won't be shown anymore: {e}")
+            self.client_logic = None
+            self.logic_summary = None
+            self.tracker_reachable_locations = []
+            self.tracker_reachable_events = []
+
+    def get_item_by_name(self, name):
+        item = self.item_table.get(name)
+        if not item:
+            world = self.get_installed_world()
+            item = world.item_name_to_item.get(name, {"name": name}) if world else {"name": name}
+        return item
+
+    def get_item_by_id(self, id):
+        name = self.item_names[id]
+        return self.get_item_by_name(name)
+
+    def get_item_categories_by_id(self, id) -> list[str]:
+        return self.get_item_by_id(id).get("category", [])
+
+    def update_ids(self, data_package) -> None:
+        self.location_names_to_id = data_package['location_name_to_id']
+        self.item_names_to_id = data_package['item_name_to_id']
+
+    def update_data_package(self, data_package: dict):
+        super().update_data_package(data_package)
+        for game, game_data in data_package["games"].items():
+            if game == self.game:
+                self.update_ids(game_data)
+
+    @property
+    def endpoints(self):
+        if self.server:
+            return [self.server]
+        else:
+            return []
+
+    async def shutdown(self):
+        await super(ManualContext, self).shutdown()
+
+    def on_package(self, cmd: str, args: dict):
+        super().on_package(cmd, args)
+
+        if cmd in {"Connected", "DataPackage"}:
+            if cmd == "Connected":
+                Utils.persistent_store("client", "last_manual_game", self.game)
+                goal = args["slot_data"].get("goal")
+                if goal and goal < len(self.victory_names):
+                    self.goal_location = self.get_location_by_name(self.victory_names[goal])
+                if args['slot_data'].get('death_link'):
+                    self.ui.enable_death_link()
+                    self.set_deathlink = True
+                    self.last_death_link = 0
+                self.wake_watcher() # anything that couldn't be sent while disconnected goes out now
+                self.load_client_logic(args["slot_data"])
+                logger.info(f"Slot data: {args['slot_data']}")
+
+            if cmd == "Connected":
+                self.ui.refresh_tracker_and_locations_table()
+            else:
+                self.ui.build_tracker_and_locations_table()
+            self.ui.request_tracker_update(update_highlights=True)
+        elif cmd in {"ReceivedItems"}:
+            self.ui.request_tracker_update(update_highlights=True)
+        elif cmd in {"RoomUpdate"}:
+            self.ui.request_tracker_update(update_highlights=False)
+
+    def on_deathlink(self, data: typing.Dict[str, typing.Any]) -> None:
+        super().on_deathlink(data)
+        self.ui.death_link_button.text = f"Death Link: {data['source']}"
+        self.ui.death_link_button.background_color = [1, 0, 0, 1]
+        
+        
+    def on_tracker_updated(self, reachable_locations: list[str]):
+        self.tracker_reachable_locations = reachable_locations
+        self.ui.request_tracker_update(update_highlights=True)
+
+    def on_tracker_events(self, events: list[str]):
+        self.tracker_reachable_events = events
+        if events:
+            self.ui.request_tracker_update(update_highlights=True)
+
+    def run_gui(self):
+        """Import kivy UI system and start running it as self.ui_task."""
+        from kvui import GameManager
+
+        from kivy.app import App
+        from kivy.uix.button import Button
+        from kivy.uix.label import Label
+        from kivy.uix.layout import Layout
+        from kivy.uix.boxlayout import BoxLayout
+        from kivy.uix.gridlayout import GridLayout
+        from kivy.uix.scrollview import ScrollView
+        from kivy.uix.textinput import TextInput
+        from kivy.uix.tabbedpanel import TabbedPanelItem
+        from kivy.uix.treeview import TreeView, TreeViewNode, TreeViewLabel
+        from kivy.uix.recycleview import RecycleView
+        from kivy.uix.recycleview.views import RecycleDataViewBehavior
+        from kivy.uix.recycleboxlayout import RecycleBoxLayout
+        from kivy.clock import Clock
+        from kivy.core.window import Window
+
+        class TrackerAndLocationsLayout(GridLayout):
+            pass
+
+        class TrackerLayoutScrollable(ScrollView):
+            pass
+
+        class LocationsLayoutScrollable(ScrollView):
+            pass
+
+        class TreeViewCategoryLabel(TreeViewLabel):
+            category: str = None
+
+        class TreeViewRecycleView(RecycleView, TreeViewNode):
+            """The rows of a category, only the ones scrolled into view get a widget"""
+            def __init__(self, viewclass, **kwargs):
+                super().__init__(**kwargs)
+                self.viewclass = viewclass
+                layout = RecycleBoxLayout(orientation="vertical", size_hint_y=None,
+                                          default_size=(400, 30), default_size_hint=(None, None))
+                layout.bind(minimum_height=layout.setter('height'))
+                self.add_widget(layout)
+
+        class ItemRow(RecycleDataViewBehavior, Label):
+            pass
+
+        class LocationRow(RecycleDataViewBehavior, Button):
+            location_id: int = None
+            victory: bool = False
+
+            def on_press(self):
+                App.get_running_app().location_row_callback(self)
+
+        class ManualManager(GameManager):
+            logging_pairs = [
+                ("Client", "Archipelago"),
+                ("Manual", "Manual"),
+            ]
+            base_title = "Archipelago Manual Client"
+            item_categories = [no_category]
+
+            active_item_accordion = 0
+            active_location_accordion = 0
+
+            # the TreeViewCategoryLabel of each category, and its TreeViewRecycleView once it was expanded
+            item_category_nodes = {}
+            item_category_views = {}
+            highlighted_items = set()
+            items_received_label = None
+            location_category_nodes = {}
+            location_category_views = {}
+            locations_remaining_label = None
+            victory_categories = {no_category}
+            reachable_locations = frozenset()
+            # game, seed, team and slot the tables were built for, a reconnect to the same one keeps them
+            built_for = None
+
+            # requested updates wait for the next frame, so a burst of them is one update
+            update_scheduled = False
+            scheduled_highlights = False
+            requested_updates = 0
+            coalesced_updates = 0
+
+            ctx: ManualContext
+
+            def __init__(self, ctx):
+                super().__init__(ctx)
+
+            def build(self) -> Layout:
+                super().build()
+
+                self.manual_game_layout = BoxLayout(orientation="horizontal", size_hint_y=None, height=dp(30))
+
+                game_bar_label = Label(text="Manual Game ID", size=(dp(150), dp(30)), size_hint_y=None, size_hint_x=None)
+                self.manual_game_layout.add_widget(game_bar_label)
+                self.game_bar_text = TextInput(text=self.ctx.suggested_game,
+                                                size_hint_y=None, height=dp(30), multiline=False, write_tab=False)
+                self.manual_game_layout.add_widget(self.game_bar_text)
+
+                self.grid.add_widget(self.manual_game_layout, 3)
+
+                for child in self.tabs.tab_list:
+                    if child.text == "Manual":
+                        panel = child # instead of creating a new TabbedPanelItem, use the one we use above to make the tabs show
+
+                self.tracker_and_locations_panel = panel.content = TrackerAndLocationsLayout(cols = 2)
+
+                self.build_tracker_and_locations_table()
+
+                if tracker_loaded:
+                    self.ctx.build_gui(self)
+
+                return self.container
+
+            def clear_lists(self):
+                self.item_categories = [no_category]
+                self.item_category_nodes = {}
+                self.item_category_views = {}
+                self.highlighted_items = set()
+                self.items_received_label = None
+                self.location_category_nodes = {}
+                self.location_category_views = {}
+                self.locations_remaining_label = None
+                self.victory_categories = {no_category}
+                self.reachable_locations = frozenset()
+
+            def set_active_item_accordion(self, instance):
+                index = 0
+
+                for widget in self.children:
+                    if widget == instance:
+                        self.active_item_accordion = index
+                        return
+
+                    index += 1
+
+            def set_active_location_accordion(self, instance):
+                index = 0
+
+                for widget in self.children:
+                    if widget == instance:
+                        self.active_item_accordion = index
+                        return
+
+                    index += 1
+
+            def enable_death_link(self):
+                if not hasattr(self, "death_link_button"):
+                    self.death_link_button = Button(text="Death Link: Primed",
+                                                size_hint_x=None, width=150)
+                    self.connect_layout.add_widget(self.death_link_button)
+                    self.death_link_button.bind(on_press=self.send_death_link)
+
+            def send_death_link(self, *args):
+                if self.ctx.last_death_link:
+                    self.ctx.last_death_link = 0
+                    self.death_link_button.text = "Death Link: Primed"
+                    self.death_link_button.background_color = [1, 1, 1, 1]
+                else:
+                    self.ctx.deathlink_out = True
+                    self.ctx.wake_watcher()
+                    self.death_link_button.text = "Death Link: Sent"
+                    self.death_link_button.background_color = [0, 1, 0, 1]
+
+            def update_hints(self):
+                super().update_hints()
+                if self.add_hinted_locations():
+                    self.request_tracker_update()
+
+            def add_hinted_locations(self) -> bool:
+                """List the hinted missing locations under the (Hinted) category, returns True if any weren't already"""
+                added = False
+                for hint in self.ctx.stored_data.get(f"_read_hints_{self.ctx.team}_{self.ctx.slot}", []):
+                    if hint["finding_player"] == self.ctx.slot and hint["location"] in self.ctx.missing_locations:
+                        added |= self.ctx.location_model.add_to_category(hint["location"], hinted_category)
+                return added
+
+            def get_slot_key(self):
+                return self.ctx.game, self.ctx.seed_name, self.ctx.team, self.ctx.slot
+
+            def refresh_tracker_and_locations_table(self):
+                """Build the tables, unless they were already built for this slot (on a reconnect),
+                then they keep their widgets and expanded categories and are only updated"""
+                if self.built_for is None or self.built_for != self.get_slot_key():
+                    self.build_tracker_and_locations_table()
+                    return
+
+                self.ctx.location_model.retain(self.ctx.missing_locations)
+                self.add_hinted_locations()
+
+            def build_tracker_and_locations_table(self):
+                self.tracker_and_locations_panel.clear_widgets()
+                self.built_for = None
+
+                if not self.ctx.server or not self.ctx.auth:
+                    self.tracker_and_locations_panel.add_widget(
+                                Label(text="Waiting for connection...", size_hint_y=None, height=50, outline_width=1))
+                    return
+
+                self.clear_lists()
+
+                # seed all category names to start
+                for item in self.ctx.item_table.values() or AutoWorldRegister.world_types[self.ctx.game].item_name_to_item.values():
+                    for category in item.get("category", []):
+                        if self.ctx.is_category_hidden(category):
+                            continue
+                        if category not in self.item_categories:
+                            self.item_categories.append(category)
+
+                if not self.ctx.location_table and not hasattr(AutoWorldRegister.world_types[self.ctx.game], 'location_name_to_location'):
+                    raise Exception("The apworld for %s is too outdated for this client. Please update it." % (self.ctx.game))
+
+                # Only the categories are built here, their rows are made when they're first expanded
+                self.ctx.location_model.reset(sorted(self.ctx.missing_locations))
+                self.add_hinted_locations()
+
+                victory_location = self.ctx.goal_location
+                self.victory_categories = set(victory_location.get("category", [])) or {no_category}
+
+                items_length = len(self.ctx.items_received)
+                tracker_panel_scrollable = TrackerLayoutScrollable(do_scroll=(False, True), bar_width=10)
+                tracker_panel = TreeView(root_options=dict(text="Items Received (%d)" % (items_length)), size_hint_y=None,
+                                         load_func=self.load_item_category)
+                tracker_panel.bind(minimum_height=tracker_panel.setter('height'))
+                self.items_received_label = tracker_panel.root
+
+                for item_category in sorted(self.item_categories):
+                    self.item_category_nodes[item_category] = tracker_panel.add_node(self.create_category_node(item_category))
+                self.ctx.tracker_model.mark_all_changed()
+
+                locations_length = len(self.ctx.missing_locations)
+                locations_panel_scrollable = LocationsLayoutScrollable(do_scroll=(False, True), bar_width=10)
+                locations_panel = TreeView(root_options=dict(text="Remaining Locations (%d)" % (locations_length + 1)), size_hint_y=None,
+                                           load_func=self.load_location_category)
+                locations_panel.bind(minimum_height=locations_panel.setter('height'))
+                self.locations_remaining_label = locations_panel.root
+
+                for location_category in sorted(set(self.ctx.location_model.category_locations.keys()) | self.victory_categories | {hinted_category}):
+                    self.location_category_nodes[location_category] = locations_panel.add_node(self.create_category_node(location_category))
+                self.ctx.location_model.mark_all_changed()
+
+                tracker_panel_scrollable.add_widget(tracker_panel)
+                locations_panel_scrollable.add_widget(locations_panel)
+                self.tracker_and_locations_panel.add_widget(tracker_panel_scrollable)
+                self.tracker_and_locations_panel.add_widget(locations_panel_scrollable)
+                self.built_for = self.get_slot_key()
+
+            def create_category_node(self, category):
+                node = TreeViewCategoryLabel(text="%s (%s)" % (category, 0), is_leaf=False) # not a leaf, so it can be expanded before it has rows
+                node.category = category
+                return node
+
+            def load_item_category(self, treeview, node):
+                """load_func of the item tracker, makes the rows of a category the first time it's expanded"""
+                view = TreeViewRecycleView(ItemRow, size_hint=(1, None), size=(Window.width / 2, 50))
+                self.item_category_views[node.category] = view
+                self.refresh_item_category(node.category)
+                return [view]
+
+            def load_location_category(self, treeview, node):
+                """load_func of the locations list, makes the rows of a category the first time it's expanded"""
+                view = TreeViewRecycleView(LocationRow, size_hint=(1, None), size=(Window.width / 2, 50))
+                self.location_category_views[node.category] = view
+                self.refresh_location_category(node.category)
+                return [view]
+
+            def set_category_view_height(self, view, rows):
+                scrollview_height = 30 * rows
+
+                if scrollview_height > 250:
+                    scrollview_height = 250
+
+                if scrollview_height < 10:
+                    scrollview_height = 50
+
+                view.size = (Window.width / 2, scrollview_height)
+
+            def refresh_item_category(self, category, update_highlights=False):
+                """Update the label of an item category, and its rows if it was expanded.
+                With update_highlights the label is bold if its count changed."""
+                model = self.ctx.tracker_model
+                node = self.item_category_nodes[category]
+                text = "%s (%s)" % (category, model.category_counts[category])
+                if update_highlights:
+                    node.bold = node.text != text
+                node.text = text
+
+                view = self.item_category_views.get(category)
+                if view is not None:
+                    item_ids = model.category_items.get(category, [])
+                    view.data = [{"text": "%s (%s)" % (self.ctx.item_names[item_id], model.item_counts[item_id]),
+                                  "bold": item_id in self.highlighted_items}
+                                 for item_id in item_ids]
+                    self.set_category_view_height(view, len(item_ids))
+
+            def refresh_location_category(self, category):
+                """Update the label of a location category, and its rows if it was expanded"""
+                location_ids = self.ctx.location_model.locations_of(category)
+                reachable_count = sum(1 for location_id in location_ids if location_id in self.reachable_locations)
+                category_count = len(location_ids)
+
+                victory = category in self.victory_categories
+                victory_reachable = victory and "__Victory__" in self.ctx.tracker_reachable_events
+                if victory:
+                    # the goal can be marked at any point, which is why it's counted in every category it's in
+                    category_count += 1
+                    reachable_count += victory_reachable
+
+                count_text = category_count
+                if self.ctx.logic_loaded:
+                    count_text = "{}/{}".format(reachable_count, category_count)
+                self.location_category_nodes[category].text = "%s (%s)" % (category, count_text)
+
+                view = self.location_category_views.get(category)
+                if view is not None:
+                    rows = [self.location_row_data(location_id, location_id in self.reachable_locations) for location_id in location_ids]
+                    if victory:
+                        victory_location = self.ctx.goal_location
+                        victory_text = "VICTORY! (seed finished)" if victory_location["name"] == "__Manual Game Complete__" else "GOAL: " + victory_location["name"]
+                        rows.append({"text": victory_text, "location_id": None, "victory": True,
+                                     "background_color": reachable_color if victory_reachable else unreachable_color})
+                    view.data = rows
+                    self.set_category_view_height(view, category_count)
+
+            def location_row_data(self, location_id, reachable):
+                return {"text": self.ctx.location_names[location_id], "location_id": location_id, "victory": False,
+                        "background_color": reachable_color if reachable else unreachable_color}
+
+            def update_tracker_items(self, update_highlights=False):
+                """Bring the item tracker up to date with the tracker model, touching only the categories that changed"""
+                model = self.ctx.tracker_model
+                model.update(self.ctx.items_received)
+                changed_items, changed_categories = model.pop_changes()
+
+                if self.items_received_label is not None:
+                    self.items_received_label.text = "Items Received (%s)" % (len(self.ctx.items_received))
+
+                if update_highlights:
+                    # the previous highlights lose their bold, so their categories (and the labels of them that were bold) change too
+                    for item_id in self.highlighted_items:
+                        changed_categories.update(model.categories_of(item_id))
+                    self.highlighted_items = changed_items
+
+                for category in changed_categories:
+                    if category in self.item_category_nodes: # hidden categories have none
+                        self.refresh_item_category(category, update_highlights)
+
+            def update_locations(self):
+                """Bring the locations list up to date with the missing locations and the tracker, touching only the categories that changed"""
+                model = self.ctx.location_model
+                model.retain(self.ctx.missing_locations)
+
+                if self.locations_remaining_label is not None:
+                    self.locations_remaining_label.text = "Remaining Locations (%d)" % (len(self.ctx.missing_locations))
+
+                reachable_locations = frozenset(self.ctx.location_names_to_id[name] for name in self.ctx.tracker_reachable_locations
+                                                if name in self.ctx.location_names_to_id)
+                if reachable_locations != self.reachable_locations:
+                    self.reachable_locations = reachable_locations
+                    model.mark_all_changed()
+                changed_categories = model.pop_changes()
+                if self.ctx.logic_loaded:
+                    changed_categories.update(self.victory_categories) # "__Victory__" is an event, it can't be compared like locations
+
+                for category in changed_categories:
+                    if category in self.location_category_nodes:
+                        self.refresh_location_category(category)
+
+            def update_tracker_and_locations_table(self, update_highlights=False):
+                self.ctx.update_client_logic()
+                self.update_tracker_items(update_highlights)
+                self.update_locations()
+
+            def request_tracker_update(self, update_highlights=False):
+                """Update the tracker on the next frame, along with any other update requested before then"""
+                self.requested_updates += 1
+                self.scheduled_highlights |= update_highlights
+                if self.update_scheduled:
+                    self.coalesced_updates += 1
+                    return
+
+                self.update_scheduled = True
+                Clock.schedule_once(self.run_scheduled_update)
+
+            def run_scheduled_update(self, dt):
+                update_highlights = self.scheduled_highlights
+                self.update_scheduled = self.scheduled_highlights = False
+                self.update_tracker_and_locations_table(update_highlights)
+                logger.debug(f"Tracker updated, {self.coalesced_updates} of {self.requested_updates} requested updates coalesced so far.")
+
+            def location_row_callback(self, row):
+                if row.victory:
+                    self.victory_button_callback(row)
+                else:
+                    self.location_button_callback(row.location_id, row)
+
+            def location_button_callback(self, location_id, button):
+                if button.text not in self.ctx.location_names_to_id:
+                    raise Exception("Locations were not loaded correctly. Please reconnect your client.")
+
+                if location_id:
+                    self.ctx.queue_location_check(location_id)
+                    self.ctx.location_model.remove(location_id)
+                    self.update_locations()
+
+                    # message = [{"cmd": 'LocationChecks', "locations": [location_id]}]
+                    # self.ctx.send_msgs(message)
+
+            def victory_button_callback(self, button):
+                self.ctx.victory_reached = True
+                self.ctx.wake_watcher()
+
+        self.ui = ManualManager(self)
+
+        if tracker_loaded:
+            self.load_kv()
+
+        self.ui_task = asyncio.create_task(self.ui.async_run(), name="UI")
+
+async def game_watcher_manual(ctx: ManualContext):
+    # sleeps until something calls ctx.wake_watcher(), so an idle client sends nothing
+    while not ctx.exit_event.is_set():
+        await ctx.watcher_event.wait()
+        ctx.watcher_event.clear()
+
+        # only /resync asks for a full Sync, CommonContext already sends one when received items have a gap
+        if ctx.syncing == True:
+            sync_msg = [{'cmd': 'Sync'}]
+            if ctx.locations_checked:
+                sync_msg.append({"cmd": "LocationChecks", "locations": list(ctx.locations_checked)})
+            await ctx.send_msgs(sync_msg)
+            ctx.syncing = False
+            ctx.location_checks_to_send.clear()
+
+        if ctx.location_checks_to_send:
+            await asyncio.sleep(ctx.location_check_delay)
+            locations = ctx.location_checks_to_send - ctx.checked_locations
+            ctx.location_checks_to_send = set()
+            if locations:
+                await ctx.send_msgs([{"cmd": "LocationChecks", "locations": list(locations)}])
+
+        if ctx.set_deathlink:
+            ctx.set_deathlink = False
+            await ctx.update_death_link(True)
+
+        if ctx.deathlink_out:
+            ctx.deathlink_out = False
+            await ctx.send_death()
+
+        # the slot is only set once Connected came back, Connected wakes this up again to send a goal reached before that
+        if not ctx.finished_game and ctx.victory_reached and ctx.server and ctx.auth and ctx.slot is not None:
+            await ctx.send_msgs([{"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL}])
+            ctx.finished_game = True
+
+
+async def main(args):
+    config_file = {}
+    if args.apmanual_file:
+        config_file = read_apmanual_file(args.apmanual_file)
+    ctx = ManualContext(args.connect, args.password, config_file.get("game"), config_file.get("player_name"))
+    ctx.server_task = asyncio.create_task(server_loop(ctx), name="server loop")
+
+    ctx.item_table = config_file.get("items", {})
+    ctx.location_table = config_file.get("locations", {})
+    ctx.region_table = config_file.get("regions", {})
+    ctx.category_table = config_file.get("categories", {})
+    ctx.base_hash = config_file.get("base_hash")
+    ctx.logic_summary_data = config_file.get("logic_summary")
+    ctx.apmanual_player_id = config_file.get("player_id")
+
+    if tracker_loaded:
+        ctx.run_generator()
+    if gui_enabled:
+        ctx.run_gui()
+    ctx.run_cli()
+    progression_watcher = asyncio.create_task(
+        game_watcher_manual(ctx), name="ManualProgressionWatcher")
+
+    await ctx.exit_event.wait()
+    ctx.server_address = None
+
+    ctx.wake_watcher()
+    await progression_watcher
+
+    await ctx.shutdown()
+
+def launch() -> None:
+    import colorama
+
+    parser = get_base_parser(description="Manual Client, for operating a Manual game in Archipelago.")
+    parser.add_argument('apmanual_file', default="", type=str, nargs="?",
+                        help='Path to an APMANUAL file')
+
+    args, rest = parser.parse_known_args()
+    colorama.init()
+    asyncio.run(main(args))
+    colorama.deinit()
+
+if __name__ == '__main__':
+    launch()
@@ -1,280 +1,332 @@
-from typing import TYPE_CHECKING, Optional
-from worlds.generic.Rules import set_rule
-from .Regions import regionMap
-from .hooks import Rules
-from BaseClasses import MultiWorld, CollectionState
-from .Helpers import clamp, is_item_enabled, get_items_with_value, is_option_enabled
-from worlds.AutoWorld import World
-
-import re
-import math
-
-if TYPE_CHECKING:
-    from . import ManualWorld
-
-def infix_to_postfix(expr, location):
-    prec = {"&": 2, "|": 2, "!": 3}
-
-    stack = []
-    postfix = ""
-
-    try:
-        for c in expr:
-            if c.isnumeric():
-                postfix += c
-            elif c in prec:
-                while stack and stack[-1] != "(" and prec[c] <= prec[stack[-1]]:
-                    postfix += stack.pop()
-                stack.append(c)
-            elif c == "(":
-                stack.append(c)
-            elif c == ")":
-                while stack and stack[-1] != "(":
-                    postfix += stack.pop()
-                stack.pop()
-        while stack:
-            postfix += stack.pop()
-    except Exception:
-        raise KeyError("Invalid logic format for location/region {}.".format(location))
-    return postfix
-
-
-def evaluate_postfix(expr: str, location: str) -> bool:
-    stack = []
-    try:
-        for c in expr:
-            if c == "0":
-                stack.append(False)
-            elif c == "1":
-                stack.append(True)
-            elif c == "&":
-                op2 = stack.pop()
-                op1 = stack.pop()
-                stack.append(op1 and op2)
-            elif c == "|":
-                op2 = stack.pop()
-                op1 = stack.pop()
-                stack.append(op1 or op2)
-            elif c == "!":
-                op = stack.pop()
-                stack.append(not op)
-    except Exception:
-        raise KeyError("Invalid logic format for location/region {}.".format(location))
-
-    if len(stack) != 1:
-        raise KeyError("Invalid logic format for location/region {}.".format(location))
-    return stack.pop()
-
-def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
-    # this is only called when the area (think, location or region) has a "requires" field that is a string
-    def checkRequireStringForArea(state: CollectionState, area: dict):
-        requires_list = area["requires"]
-        # Generate item_counts here so it can be access each time this is called
-        if player not in world.item_counts:
-            real_pool = multiworld.get_items()
-            world.item_counts[player] = {i.name: real_pool.count(i) for i in real_pool if i.player == player}
-
-        # fallback if items_counts[player] not present (will not be accurate to hooks item count)
-        items_counts = world.get_item_counts()
-
-        if requires_list == "":
-            return True
-
-        for item in re.findall(r'\{(\w+)\(([^)]*)\)\}', requires_list):
-            func_name = item[0]
-            func_args = item[1].split(",")
-            if func_args == ['']:
-                func_args.pop()
-
-            func = globals().get(func_name)
-
-            if func is None:
-                func = getattr(Rules, func_name, None)
-
-            if not callable(func):
-                raise ValueError(f"Invalid function `{func_name}` in {area}.")
-
-            result = func(world, multiworld, state, player, *func_args)
-            if isinstance(result, bool):
-                requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", "1" if result else "0")
-            else:
-                requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", str(result))
-
-
-        # parse user written statement into list of each item
-        for item in re.findall(r'\|[^|]+\|', requires_list):
-            require_type = 'item'
-
-            if '|@' in item:
-                require_type = 'category'
-
-            item_base = item
-            item = item.lstrip('|@$').rstrip('|')
-
-            item_parts = item.split(":")  # type: list[str]
-            item_name = item
-            item_count = "1"
-
-
-            if len(item_parts) > 1:
-                item_name = item_parts[0].strip()
-                item_count = item_parts[1].strip()
-
-            total = 0
-
-            if require_type == 'category':
-                category_items = [item for item in world.item_name_to_item.values() if "category" in item and item_name in item["category"]]
-                category_items_counts = sum([items_counts.get(category_item["name"], 0) for category_item in category_items])
-                if item_count.lower() == 'all':
-                    item_count = category_items_counts
-                elif item_count.lower() == 'half':
-                    item_count = int(category_items_counts / 2)
-                elif item_count.endswith('%') and len(item_count) > 1:
-                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
-                    item_count = math.ceil(category_items_counts * percent)
-                else:
-                    try:
-                        item_count = int(item_count)
-                    except ValueError as e:
-                        raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
-
-                for category_item in category_items:
-                    total += state.count(category_item["name"], player)
-
-                    if total >= item_count:
-                        requires_list = requires_list.replace(item_base, "1")
-            elif require_type == 'item':
-                item_current_count = items_counts.get(item_name, 0)
-                if item_count.lower() == 'all':
-                    item_count = item_current_count
-                elif item_count.lower() == 'half':
-                    item_count = int(item_current_count / 2)
-                elif item_count.endswith('%') and len(item_count) > 1:
-                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
-                    item_count = math.ceil(item_current_count * percent)
-                else:
-                    item_count = int(item_count)
-
-                total = state.count(item_name, player)
-
-                if total >= item_count:
-                    requires_list = requires_list.replace(item_base, "1")
-
-            if total <= item_count:
-                requires_list = requires_list.replace(item_base, "0")
-
-        requires_list = re.sub(r'\s?\bAND\b\s?', '&', requires_list, 0, re.IGNORECASE)
-        requires_list = re.sub(r'\s?\bOR\b\s?', '|', requires_list, 0, re.IGNORECASE)
-
-        requires_string = infix_to_postfix("".join(requires_list), area)
-        return (evaluate_postfix(requires_string, area))
-
-    # this is only called when the area (think, location or region) has a "requires" field that is a dict
-    def checkRequireDictForArea(state: CollectionState, area: dict):
-        canAccess = True
-
-        for item in area["requires"]:
-            # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
-            if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
-                canAccessOr = True
-                or_items = item
-
-                if isinstance(item, dict):
-                    or_items = item["or"]
-
-                for or_item in or_items:
-                    or_item_parts = or_item.split(":")
-                    or_item_name = or_item
-                    or_item_count = 1
-
-                    if len(or_item_parts) > 1:
-                        or_item_name = or_item_parts[0]
-                        or_item_count = int(or_item_parts[1])
-
-                    if not state.has(or_item_name, player, or_item_count):
-                        canAccessOr = False
-
-                if canAccessOr:
-                    canAccess = True
-                    break
-            else:
-                item_parts = item.split(":")
-                item_name = item
-                item_count = 1
-
-                if len(item_parts) > 1:
-                    item_name = item_parts[0]
-                    item_count = int(item_parts[1])
-
-                if not state.has(item_name, player, item_count):
-                    canAccess = False
-
-        return canAccess
-
-    # handle any type of checking needed, then ferry the check off to a dedicated method for that check
-    def fullLocationOrRegionCheck(state: CollectionState, area: dict):
-        # if it's not a usable object of some sort, default to true
-        if not area:
-            return True
-
-        # don't require the "requires" key for locations and regions if they don't need to use it
-        if "requires" not in area.keys():
-            return True
-
-        if isinstance(area["requires"], str):
-            return checkRequireStringForArea(state, area)
-        else:  # item access is in dict form
-            return checkRequireDictForArea(state, area)
-
-    used_location_names = []
-    # Region access rules
-    for region in regionMap.keys():
-        used_location_names.extend([l.name for l in multiworld.get_region(region, player).locations])
-        if region != "Menu":
-            for exitRegion in multiworld.get_region(region, player).exits:
-                def fullRegionCheck(state: CollectionState, region=regionMap[region]):
-                    return fullLocationOrRegionCheck(state, region)
-
-                set_rule(multiworld.get_entrance(exitRegion.name, player), fullRegionCheck)
-
-    # Location access rules
-    for location in world.location_table:
-        if location["name"] not in used_location_names:
-            continue
-
-        locFromWorld = multiworld.get_location(location["name"], player)
-
-        locationRegion = regionMap[location["region"]] if "region" in location else None
-
-        if "requires" in location: # Location has requires, check them alongside the region requires
-            def checkBothLocationAndRegion(state: CollectionState, location=location, region=locationRegion):
-                locationCheck = fullLocationOrRegionCheck(state, location)
-                regionCheck = True # default to true unless there's a region with requires
-
-                if region:
-                    regionCheck = fullLocationOrRegionCheck(state, region)
-
-                return locationCheck and regionCheck
-
-            set_rule(locFromWorld, checkBothLocationAndRegion)
-        elif "region" in location: # Only region access required, check the location's region's requires
-            def fullRegionCheck(state, region=locationRegion):
-                return fullLocationOrRegionCheck(state, region)
-
-            set_rule(locFromWorld, fullRegionCheck)
-        else: # No location region and no location requires? It's accessible.
-            def allRegionsAccessible(state):
-                return True
-
-            set_rule(locFromWorld, allRegionsAccessible)
-
-    # Victory requirement
-    multiworld.completion_condition[player] = lambda state: state.has("__Victory__", player)
-
-def YamlEnabled(world: "ManualWorld", multiworld: MultiWorld, state: CollectionState, player: int, param: str) -> bool:
-    """Is a yaml option enabled?"""
-    return is_option_enabled(multiworld, player, param)
-
-def YamlDisabled(world: "ManualWorld", multiworld: MultiWorld, state: CollectionState, player: int, param: str) -> bool:
-    """Is a yaml option disabled?"""
-    return not is_option_enabled(multiworld, player, param)
+from typing import TYPE_CHECKING, Callable, Optional
+from worlds.generic.Rules import set_rule
+from .Regions import regionMap
+from .hooks import Rules
+from BaseClasses import MultiWorld, CollectionState, Item, Location, Region
+from .Helpers import clamp, is_item_enabled, get_items_with_value, is_option_enabled
+from worlds.AutoWorld import World
+
+import re
+import math
+
+if TYPE_CHECKING:
+    from . import ManualWorld
+
+def infix_to_postfix(expr, location):
+    prec = {"&": 2, "|": 2, "!": 3}
+
+    stack = []
+    postfix = ""
+
+    try:
+        for c in expr:
+            if c.isnumeric():
+                postfix += c
+            elif c in prec:
+                while stack and stack[-1] != "(" and prec[c] <= prec[stack[-1]]:
+                    postfix += stack.pop()
+                stack.append(c)
+            elif c == "(":
+                stack.append(c)
+            elif c == ")":
+                while stack and stack[-1] != "(":
+                    postfix += stack.pop()
+                stack.pop()
+        while stack:
+            postfix += stack.pop()
+    except Exception:
+        raise KeyError("Invalid logic format for location/region {}.".format(location))
+    return postfix
+
+
+def evaluate_postfix(expr: str, location: str) -> bool:
+    stack = []
+    try:
+        for c in expr:
+            if c == "0":
+                stack.append(False)
+            elif c == "1":
+                stack.append(True)
+            elif c == "&":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                stack.append(op1 and op2)
+            elif c == "|":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                stack.append(op1 or op2)
+            elif c == "!":
+                op = stack.pop()
+                stack.append(not op)
+    except Exception:
+        raise KeyError("Invalid logic format for location/region {}.".format(location))
+
+    if len(stack) != 1:
+        raise KeyError("Invalid logic format for location/region {}.".format(location))
+    return stack.pop()
+
+def create_requires_checks(world: "ManualWorld", multiworld: MultiWorld, player: int) -> tuple[Callable, Callable, Callable]:
+    """Return the functions that evaluate requires for the player, each called with (state, area):
+    the one for string requires, the one for dict/list requires and the one that picks between them."""
+    # this is only called when the area (think, location or region) has a "requires" field that is a string
+    def checkRequireStringForArea(state: CollectionState, area: dict):
+        requires_list = area["requires"]
+        # Generate item_counts on first use so it can be accessed each time this is called
+        items_counts = world.get_item_counts(player)
+
+        if requires_list == "":
+            return True
+
+        for item in re.findall(r'\{(\w+)\(([^)]*)\)\}', requires_list):
+            func_name = item[0]
+            func_args = item[1].split(",")
+            if func_args == ['']:
+                func_args.pop()
+
+            func = globals().get(func_name)
+
+            if func is None:
+                func = getattr(Rules, func_name, None)
+
+            if not callable(func):
+                raise ValueError(f"Invalid function `{func_name}` in {area}.")
+
+            result = func(world, multiworld, state, player, *func_args)
+            if isinstance(result, bool):
+                requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", "1" if result else "0")
+            else:
+                requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", str(result))
+
+
+        # parse user written statement into list of each item
+        for item in re.findall(r'\|[^|]+\|', requires_list):
+            require_type = 'item'
+
+            if '|@' in item:
+                require_type = 'category'
+
+            item_base = item
+            item = item.lstrip('|@$').rstrip('|')
+
+            item_parts = item.split(":")  # type: list[str]
+            item_name = item
+            item_count = "1"
+
+
+            if len(item_parts) > 1:
+                item_name = item_parts[0].strip()
+                item_count = item_parts[1].strip()
+
+            total = 0
+
+            if require_type == 'category':
+                category_items = [item for item in world.item_name_to_item.values() if "category" in item and item_name in item["category"]]
+                category_items_counts = sum([items_counts.get(category_item["name"], 0) for category_item in category_items])
+                if item_count.lower() == 'all':
+                    item_count = category_items_counts
+                elif item_count.lower() == 'half':
+                    item_count = int(category_items_counts / 2)
+                elif item_count.endswith('%') and len(item_count) > 1:
+                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
+                    item_count = math.ceil(category_items_counts * percent)
+                else:
+                    try:
+                        item_count = int(item_count)
+                    except ValueError as e:
+                        raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
+
+                for category_item in category_items:
+                    total += state.count(category_item["name"], player)
+
+                    if total >= item_count:
+                        requires_list = requires_list.replace(item_base, "1")
+            elif require_type == 'item':
+                item_current_count = items_counts.get(item_name, 0)
+                if item_count.lower() == 'all':
+                    item_count = item_current_count
+                elif item_count.lower() == 'half':
+                    item_count = int(item_current_count / 2)
+                elif item_count.endswith('%') and len(item_count) > 1:
+                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
+                    item_count = math.ceil(item_current_count * percent)
+                else:
+                    item_count = int(item_count)
+
+                total = state.count(item_name, player)
+
+                if total >= item_count:
+                    requires_list = requires_list.replace(item_base, "1")
+
+            if total <= item_count:
+                requires_list = requires_list.replace(item_base, "0")
+
+        requires_list = re.sub(r'\s?\bAND\b\s?', '&', requires_list, 0, re.IGNORECASE)
+        requires_list = re.sub(r'\s?\bOR\b\s?', '|', requires_list, 0, re.IGNORECASE)
+
+        requires_string = infix_to_postfix("".join(requires_list), area)
+        return (evaluate_postfix(requires_string, area))
+
+    # this is only called when the area (think, location or region) has a "requires" field that is a dict
+    def checkRequireDictForArea(state: CollectionState, area: dict):
+        canAccess = True
+
+        for item in area["requires"]:
+            # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
+            if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
+                canAccessOr = True
+                or_items = item
+
+                if isinstance(item, dict):
+                    or_items = item["or"]
+
+                for or_item in or_items:
+                    or_item_parts = or_item.split(":")
+                    or_item_name = or_item
+                    or_item_count = 1
+
+                    if len(or_item_parts) > 1:
+                        or_item_name = or_item_parts[0]
+                        or_item_count = int(or_item_parts[1])
+
+                    if not state.has(or_item_name, player, or_item_count):
+                        canAccessOr = False
+
+                if canAccessOr:
+                    canAccess = True
+                    break
+            else:
+                item_parts = item.split(":")
+                item_name = item
+                item_count = 1
+
+                if len(item_parts) > 1:
+                    item_name = item_parts[0]
+                    item_count = int(item_parts[1])
+
+                if not state.has(item_name, player, item_count):
+                    canAccess = False
+
+        return canAccess
+
+    # handle any type of checking needed, then ferry the check off to a dedicated method for that check
+    def fullLocationOrRegionCheck(state: CollectionState, area: dict):
+        # if it's not a usable object of some sort, default to true
+        if not area:
+            return True
+
+        # don't require the "requires" key for locations and regions if they don't need to use it
+        if "requires" not in area.keys():
+            return True
+
+        if isinstance(area["requires"], str):
+            return checkRequireStringForArea(state, area)
+        else:  # item access is in dict form
+            return checkRequireDictForArea(state, area)
+
+    return checkRequireStringForArea, checkRequireDictForArea, fullLocationOrRegionCheck
+
+def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
+    _, _, fullLocationOrRegionCheck = create_requires_checks(world, multiworld, player)
+
+    used_location_names = []
+    # Region access rules
+    for region in regionMap.keys():
+        used_location_names.extend([l.name for l in multiworld.get_region(region, player).locations])
+        if region != "Menu":
+            # entrances whose rule checks if another region can be reached need AP to recheck them once that region is reached
+            indirect_regions = get_indirect_condition_regions(multiworld, player, regionMap[region])
+
+            for exitRegion in multiworld.get_region(region, player).exits:
+                def fullRegionCheck(state: CollectionState, region=regionMap[region]):
+                    return fullLocationOrRegionCheck(state, region)
+
+                entrance = multiworld.get_entrance(exitRegion.name, player)
+                set_rule(entrance, fullRegionCheck)
+
+                for indirect_region in indirect_regions:
+                    multiworld.register_indirect_condition(indirect_region, entrance)
+
+    # Location access rules
+    for location in world.location_table:
+        if location["name"] not in used_location_names:
+            continue
+
+        locFromWorld = multiworld.get_location(location["name"], player)
+
+        locationRegion = regionMap[location["region"]] if "region" in location else None
+
+        if "requires" in location: # Location has requires, check them alongside the region requires
+            def checkBothLocationAndRegion(state: CollectionState, location=location, region=locationRegion):
+                locationCheck = fullLocationOrRegionCheck(state, location)
+                regionCheck = True # default to true unless there's a region with requires
+
+                if region:
+                    regionCheck = fullLocationOrRegionCheck(state, region)
+
+                return locationCheck and regionCheck
+
+            set_rule(locFromWorld, checkBothLocationAndRegion)
+        elif "region" in location: # Only region access required, check the location's region's requires
+            def fullRegionCheck(state, region=locationRegion):
+                return fullLocationOrRegionCheck(state, region)
+
+            set_rule(locFromWorld, fullRegionCheck)
+        else: # No location region and no location requires? It's accessible.
+            def allRegionsAccessible(state):
+                return True
+
+            set_rule(locFromWorld, allRegionsAccessible)
+
+    # Victory requirement
+    multiworld.completion_condition[player] = lambda state: state.has("__Victory__", player)
+
+def get_indirect_condition_regions(multiworld: MultiWorld, player: int, area: dict) -> list[Region]:
+    """Return the regions whose reachability the requires of area depend on, through the functions in reachability_functions.
+    Names that don't exist for this player are skipped, the rule itself will complain about them."""
+    requires = area.get("requires") if area else None
+    if not isinstance(requires, str):
+        return []
+
+    regions = []
+    for func_name, func_args in re.findall(r'\{(\w+)\(([^)]*)\)\}', requires):
+        get_region = reachability_functions.get(func_name)
+        if get_region is None or not func_args:
+            continue
+
+        try:
+            region = get_region(multiworld, player, func_args.split(",")[0])
+        except KeyError:
+            continue
+
+        if region is not None and region not in regions:
+            regions.append(region)
+    return regions
+
+# Functions usable in requires that check if a region or location can be reached, with how to get the region they depend on from their first argument.
+# Add your own here if you write one in hooks/Rules.py, so the entrances using it get rechecked when that region becomes reachable.
+reachability_functions: dict[str, Callable[[MultiWorld, int, str], Optional[Region]]] = {
+    "canReachLocation": lambda multiworld, player, name: multiworld.get_location(name, player).parent_region,
+    "canReachRegion": lambda multiworld, player, name: multiworld.get_region(name, player),
+}
+
+def set_forbidden_items_rule(location: Location, forbidden_item_names: frozenset[str], player: int):
+    """Forbid this player's items named in forbidden_item_names from being placed at the location.
+    Keeps any item rule that was already set, as forbid_items_for_player would."""
+    old_rule = location.item_rule
+
+    if old_rule is type(location).item_rule: # still the default, which allows everything
+        def forbidden_items_rule(item: Item) -> bool:
+            return item.name not in forbidden_item_names or item.player != player
+    else:
+        def forbidden_items_rule(item: Item) -> bool:
+            return (item.name not in forbidden_item_names or item.player != player) and old_rule(item)
+
+    location.item_rule = forbidden_items_rule
+
+def YamlEnabled(world: "ManualWorld", multiworld: MultiWorld, state: CollectionState, player: int, param: str) -> bool:
+    """Is a yaml option enabled?"""
+    return is_option_enabled(multiworld, player, param)
+
+def YamlDisabled(world: "ManualWorld", multiworld: MultiWorld, state: CollectionState, player: int, param: str) -> bool:
+    """Is a yaml option disabled?"""
+    return not is_option_enabled(multiworld, player, param)
@@ -0,0 +1,179 @@
+######################################################################################
+## Times each part of this world's generation against synthetic data of a given scale.
+##
+## Every benchmark runs --repeat times on freshly prepared state and reports the minimum
+## (the least disturbed run, and the most stable number to compare between commits) and
+## the median. Import is timed in a new process each time, since a world can only be
+## registered once per process.
+##    python -m worlds.manual_warframe_zid.benchmarks.Generation --scale 10 --output before.json
+##    python -m worlds.manual_warframe_zid.benchmarks.Generation --scale 10 --compare before.json
+######################################################################################
+
+import argparse
+import gc
+import importlib
+import json
+import logging
+import multiprocessing
+import random
+import statistics
+import sys
+import time
+from types import ModuleType
+from typing import Callable, Optional
+
+from . import SyntheticData
+
+# the stages each benchmark needs to have run first, in order
+stage_order = ["generate_early", "create_regions", "create_items", "set_rules", "generate_basic"]
+benchmark_names = ["import", "validation", "create_regions", "create_items", "set_rules", "rule_evaluation", "client_data"]
+
+rule_evaluation_states = 8
+
+
+def time_min(run: Callable, setup: Optional[Callable] = None, repeat: int = 5) -> dict:
+    """Time run(setup()) repeat times, with setup and garbage collection left out of the timing"""
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(argument)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return {"min": min(timings), "median": statistics.median(timings)}
+
+def prepare_world(module: ModuleType, seed: int, until_stage: str):
+    """Return the world of a new single slot multiworld of the synthetic game, with every stage before until_stage run"""
+    from worlds.AutoWorld import call_all
+
+    survey = importlib.import_module(f"{module.__name__}.Survey")
+    multiworld = survey.create_survey_multiworld(seed, {}, [module.ManualWorld.game])
+    for stage in stage_order[:stage_order.index(until_stage)]:
+        call_all(multiworld, stage)
+    return multiworld.worlds[1]
+
+def build_random_states(world, count: int, seed: int) -> list:
+    """Return count CollectionStates holding from none to almost all of the world's items, picked at random"""
+    from BaseClasses import CollectionState
+
+    rng = random.Random(seed)
+    pool = [item for item in world.multiworld.itempool if item.player == world.player]
+    states = []
+    for index in range(count):
+        state = CollectionState(world.multiworld)
+        for item in rng.sample(pool, len(pool) * index // count):
+            state.collect(item, True)
+        states.append(state)
+    return states
+
+def _evaluate_rules(prepared) -> None:
+    rules, states = prepared
+    for state in states:
+        for rule in rules:
+            rule(state)
+
+def _time_import(directory: str, package_name: str) -> float:
+    import worlds # loads every other installed world first, so only this one is timed
+
+    start = time.perf_counter()
+    SyntheticData.import_synthetic_package(directory, package_name)
+    return time.perf_counter() - start
+
+def run_benchmarks(scale: int, seed: int = 0, repeat: int = 5) -> dict:
+    """Run every benchmark against synthetic data of the given scale and return the results"""
+    module = SyntheticData.load_synthetic_world(scale, seed)
+    world_type = module.ManualWorld
+    results = {}
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        package_name = module.__name__.rpartition(".")[2]
+        timings = [pool.apply(_time_import, (SyntheticData._synthetic_directory, package_name)) for _ in range(repeat)]
+    results["import"] = {"min": min(timings), "median": statistics.median(timings)}
+
+    results["validation"] = time_min(lambda _: world_type.stage_assert_generate(None), repeat=repeat)
+
+    for stage in ("create_regions", "create_items", "set_rules"):
+        results[stage] = time_min(lambda world: getattr(world, stage)(), lambda: prepare_world(module, seed, stage), repeat)
+
+    # every location and entrance rule of the slot, against a spread of states
+    def prepare_rules():
+        world = prepare_world(module, seed, "generate_basic")
+        rules = [location.access_rule for location in world.multiworld.get_locations(world.player)]
+        rules += [entrance.access_rule for region in world.multiworld.get_regions(world.player) for entrance in region.exits]
+        return rules, build_random_states(world, rule_evaluation_states, seed)
+
+    rule_count = len(prepare_rules()[0]) * rule_evaluation_states
+    results["rule_evaluation"] = time_min(_evaluate_rules, prepare_rules, repeat)
+    results["rule_evaluation"]["evaluations"] = rule_count
+    results["rule_evaluation"]["per_second"] = rule_count / results["rule_evaluation"]["min"]
+
+    def prepare_client_data():
+        world = prepare_world(module, seed, "generate_basic")
+        world.generate_basic()
+        return world
+    results["client_data"] = time_min(lambda world: world.client_data(), prepare_client_data, repeat)
+
+    return {
+        "game": world_type.game,
+        "scale": scale,
+        "seed": seed,
+        "repeat": repeat,
+        "python": sys.version.split()[0],
+        "size": {"items": len(module.item_table), "locations": len(module.location_table), "regions": len(module.region_table)},
+        "benchmarks": results,
+    }
+
+def format_results(runs: list[dict], previous_runs: Optional[list[dict]] = None) -> str:
+    previous = {run["scale"]: run["benchmarks"] for run in previous_runs or []}
+    lines = []
+    for run in runs:
+        size = run["size"]
+        lines.append(f"{run['game']} (scale {run['scale']}: {size['items']} items, {size['locations']} locations, {size['regions']} regions)")
+        lines.append("benchmark".ljust(18) + "min".rjust(12) + "median".rjust(12) + ("vs previous".rjust(14) if previous else ""))
+        for name, timing in run["benchmarks"].items():
+            line = name.ljust(18) + f"{timing['min']:12.5f}{timing['median']:12.5f}"
+            previous_timing = previous.get(run["scale"], {}).get(name)
+            if previous_timing:
+                line += f"{timing['min'] / previous_timing['min']:13.2f}x"
+            if "per_second" in timing:
+                line += f"   {timing['per_second']:,.0f} evaluations/s"
+            lines.append(line)
+        lines.append("")
+    return "\n".join(lines)
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark this world's generation against synthetic data.")
+    parser.add_argument("--scale", type=int, action="append", help="Size of the synthetic data relative to the real data, can be repeated. Defaults to 10.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data and of the generated multiworlds.")
+    parser.add_argument("--repeat", type=int, default=5, help="How many times to run each benchmark.")
+    parser.add_argument("--output", default=None, help="Write the results as json to this file.")
+    parser.add_argument("--compare", default=None, help="Json file of an earlier run to compare against.")
+    parsed = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    runs = []
+    try:
+        for scale in parsed.scale or [10]:
+            runs.append(run_benchmarks(scale, parsed.seed, parsed.repeat))
+    finally:
+        SyntheticData.unload_synthetic_worlds()
+
+    previous_runs = None
+    if parsed.compare:
+        with open(parsed.compare) as f:
+            previous_runs = json.load(f)
+
+    if parsed.output:
+        with open(parsed.output, "w") as f:
+            json.dump(runs, f, indent=2)
+
+    print(format_results(runs, previous_runs))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import importlib
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+from types import ModuleType
+from typing import Optional
+
+######################################################################################
+## Synthetic manual data shaped like this world's Warframe data, at any scale.
+##
+## Scale 1 is about as big as the real data (30 planets, ~400 locations). Every planet is a
+## region gated by its Junction Key, with missions split over categories, a boss location
+## needing 3 copies of its Boss Key, Dark Sector missions and, every few planets, quest and
+## ItemValue gated missions. A handful of locations use dict requires and category counts.
+######################################################################################
+
+planets_per_scale = 30
+missions_per_planet = 10
+
+mission_types = ["Exterminate", "Capture", "Spy", "Rescue", "Sabotage", "Mobile Defense", "Defense", "Survival", "Interception", "Excavation"]
+factions = ["Grineer", "Corpus", "Infested", "Corrupted"]
+credit_value = "Credits"
+
+
+def _planet(index: int) -> str:
+    return f"Planet {index}"
+
+def generate_synthetic_data(scale: int = 1, seed: int = 0) -> dict[str, object]:
+    """Return the game, items, locations, regions and categories tables of a synthetic manual about scale times as big as the real data"""
+    rng = random.Random(seed)
+    planet_count = max(2, planets_per_scale * scale)
+    quest_count = max(1, planet_count // 6)
+
+    items = []
+    locations = []
+    regions = {}
+    categories = {mission_type: {} for mission_type in mission_types}
+    categories.update({faction: {} for faction in factions})
+
+    quests = [f"Quest {index}" for index in range(quest_count)]
+    for quest in quests:
+        items.append({"count": 1, "name": quest, "category": ["Quest Unlock"], "progression": True})
+
+    credit_total = 0
+    for index in range(planet_count // 3):
+        amount = rng.randint(1, 5)
+        items.append({"count": "2", "name": f"Credit Cache {index}", "category": ["Credits"], "progression": True, "value": {credit_value: amount}})
+        credit_total += 2 * amount
+
+    items.append({"count": str(planet_count), "name": "Dark Sector Key", "category": ["Dark Sector Key"], "progression": True})
+
+    for index in range(planet_count):
+        planet = _planet(index)
+        junction_key = f"{planet} Junction Key"
+        boss_key = f"Boss {index} Key"
+
+        items.append({"count": 1, "name": junction_key, "category": ["Junction Key"], "progression_skip_balancing": True})
+        items.append({"count": "3", "name": boss_key, "category": ["Boss Key"], "progression": True})
+        items.append({"count": 1, "name": f"Arsenal {index}", "category": ["Arsenal"], "useful": True})
+
+        # a tree of planets, each unlocked from one of the few planets before it
+        region = {"connects_to": [], "requires": []}
+        if index == 0:
+            region["starting"] = True
+        else:
+            regions[_planet(max(0, index - 1 - rng.randint(0, 2)))]["connects_to"].append(planet)
+            region["requires"] = f"|{junction_key}|"
+            if index % 5 == 0:
+                region["requires"] += f" AND |{quests[rng.randrange(quest_count)]}|"
+        regions[planet] = region
+
+        for mission in range(missions_per_planet):
+            mission_type = rng.choice(mission_types)
+            locations.append({
+                "name": f"{planet} {mission_type} {mission}",
+                "region": planet,
+                "category": [planet, "Endless" if mission_type in ("Defense", "Survival", "Interception", "Excavation") else "Single", mission_type, rng.choice(factions)],
+                "requires": [] if mission % 2 else "",
+            })
+
+        locations.append({"name": f"{planet} Boss", "region": planet, "category": [planet, "Single", "Boss", rng.choice(factions)],
+                          "requires": f"|{boss_key}:3|"})
+        locations.append({"name": f"{planet} Dark Sector", "region": planet, "category": [planet, "Endless", "Dark Sector", "Infested"],
+                          "requires": "|Dark Sector Key|"})
+
+        if index % 4 == 1:
+            locations.append({"name": f"{planet} Syndicate", "region": planet, "category": [planet, "Syndicate"],
+                              "requires": f"{{ItemValue({credit_value}:{rng.randint(1, max(1, credit_total // 4))})}}"})
+        if index % 7 == 2:
+            locations.append({"name": f"{planet} Quest", "region": planet, "category": [planet, "Quest"],
+                              "requires": f"(|{quests[rng.randrange(quest_count)]}| OR |@Boss Key:{rng.choice(['half', '10%', '3'])}|) AND |@Junction Key:2|"})
+        if index % 9 == 3:
+            locations.append({"name": f"{planet} Relay", "region": planet, "category": [planet, "Relay"],
+                              "requires": [f"{planet} Junction Key", {"or": [f"Boss {index} Key:2", "Dark Sector Key:3"]}]})
+
+    items.append({"count": 1, "name": "Post-Final Quest", "category": ["Quest Unlock"], "progression": True})
+    final_planet = _planet(planet_count - 1)
+    locations.append({"name": "Victory", "region": final_planet, "victory": True, "category": [final_planet, "Boss"],
+                      "requires": "|Post-Final Quest| AND |@Boss Key:25%|"})
+
+    return {
+        "game": {"game": f"Benchmark{scale}x", "creator": f"Seed{seed}", "filler_item_name": "Endo", "starting_items": []},
+        "items": items,
+        "locations": locations,
+        "regions": regions,
+        "categories": categories,
+    }
+
+def create_synthetic_package(directory: str, scale: int = 1, seed: int = 0) -> str:
+    """Copy this world into directory under a name of its own, with synthetic data of the given scale, and return the package name"""
+    source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if not os.path.isdir(source):
+        raise Exception("Benchmarks need this world unzipped in the worlds folder, they can't run from an .apworld.")
+
+    package_name = f"manual_benchmark{scale}x_{seed}"
+    package_path = os.path.join(directory, package_name)
+    shutil.copytree(source, package_path, ignore=shutil.ignore_patterns("data", "benchmarks", "__pycache__", "*.apworld"))
+
+    os.makedirs(os.path.join(package_path, "data"))
+    for table_name, table in generate_synthetic_data(scale, seed).items():
+        with open(os.path.join(package_path, "data", f"{table_name}.json"), "w") as f:
+            json.dump(table, f)
+
+    return package_name
+
+def import_synthetic_package(directory: str, package_name: str) -> ModuleType:
+    """Import a package made by create_synthetic_package as worlds.<package_name>, which registers its world"""
+    import worlds
+
+    if directory not in worlds.__path__:
+        worlds.__path__.append(directory)
+    return importlib.import_module(f"worlds.{package_name}")
+
+_loaded_worlds: dict[tuple[int, int], ModuleType] = {}
+_synthetic_directory: Optional[str] = None
+
+def load_synthetic_world(scale: int = 1, seed: int = 0) -> ModuleType:
+    """Create and import a synthetic copy of this world once per scale and seed, for this process"""
+    global _synthetic_directory
+
+    if (scale, seed) not in _loaded_worlds:
+        if _synthetic_directory is None:
+            _synthetic_directory = tempfile.mkdtemp(prefix="manual_benchmark_")
+        package_name = create_synthetic_package(_synthetic_directory, scale, seed)
+        _loaded_worlds[(scale, seed)] = import_synthetic_package(_synthetic_directory, package_name)
+    return _loaded_worlds[(scale, seed)]
+
+def unload_synthetic_worlds():
+    """Forget the synthetic worlds imported so far and delete their files"""
+    global _synthetic_directory
+    from worlds.AutoWorld import AutoWorldRegister
+
+    for module in _loaded_worlds.values():
+        AutoWorldRegister.world_types.pop(module.ManualWorld.game, None)
+        for name in [name for name in sys.modules if name == module.__name__ or name.startswith(module.__name__ + ".")]:
+            del sys.modules[name]
+    _loaded_worlds.clear()
+
+    if _synthetic_directory is not None:
+        shutil.rmtree(_synthetic_directory, ignore_errors=True)
+        _synthetic_directory = None
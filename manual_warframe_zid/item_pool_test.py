@@ -0,0 +1,63 @@
+import random
+from unittest import TestCase
+
+from BaseClasses import Item, ItemClassification
+from .Items import ManualItemPool
+
+
+def _item(name: str, code: int, player: int = 1) -> Item:
+    return Item(name, ItemClassification.filler, code, player)
+
+
+class ManualItemPoolTest(TestCase):
+    def test_pool_order(self):
+        items = [_item(name, code) for code, name in enumerate("ABACBA")]
+        pool = ManualItemPool(items)
+        self.assertEqual(len(pool), 6)
+        self.assertEqual(pool.to_list(), items)
+        self.assertEqual(pool.count("A"), 3)
+        self.assertEqual(pool.items_named(["C", "A"]), [items[0], items[2], items[3], items[5]])
+
+    def test_remove_first_equal(self):
+        items = [_item(name, code) for code, name in enumerate("ABAB")]
+        pool = ManualItemPool(items)
+        pool.remove(_item("A", 100))
+        self.assertEqual(pool.to_list(), items[1:])
+        pool.remove(items[3])
+        # equal items can't be told apart, the first one goes like it would from a list
+        self.assertEqual(pool.to_list(), [items[2], items[3]])
+
+    def test_remove_missing(self):
+        pool = ManualItemPool([_item("A", 1)])
+        with self.assertRaises(ValueError):
+            pool.remove(_item("B", 2))
+        with self.assertRaises(ValueError):
+            pool.remove(_item("A", 1, player=2))
+        pool.remove(_item("A", 1))
+        with self.assertRaises(ValueError):
+            pool.remove(_item("A", 1))
+
+    def test_append_after_remove(self):
+        a, b = _item("A", 1), _item("B", 2)
+        pool = ManualItemPool([a, b])
+        pool.remove(a)
+        pool.append(a)
+        self.assertEqual(pool.to_list(), [b, a])
+
+    def test_same_as_list(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            items = [_item(rng.choice("ABCD"), code, rng.choice((1, 2))) for code in range(rng.randint(0, 20))]
+            expected = list(items)
+            pool = ManualItemPool(items)
+            for _ in range(rng.randint(0, 30)):
+                item = _item(rng.choice("ABCDE"), 0, rng.choice((1, 2)))
+                if rng.random() < 0.3:
+                    expected.append(item)
+                    pool.append(item)
+                elif item in expected:
+                    expected.remove(item)
+                    pool.remove(item)
+                else:
+                    self.assertRaises(ValueError, pool.remove, item)
+            self.assertEqual([id(item) for item in pool.to_list()], [id(item) for item in expected])
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from BaseClasses import Item, ItemClassification, Location
+from .Rules import set_forbidden_items_rule
+
+
+def _item(name: str, player: int = 1) -> Item:
+    return Item(name, ItemClassification.filler, None, player)
+
+
+class ForbiddenItemsRuleTest(TestCase):
+    def test_default_rule(self):
+        location = Location(1, "Test Location")
+        set_forbidden_items_rule(location, frozenset({"A", "B"}), 1)
+        self.assertFalse(location.item_rule(_item("A")))
+        self.assertFalse(location.item_rule(_item("B")))
+        self.assertTrue(location.item_rule(_item("C")))
+        # only this player's items are forbidden
+        self.assertTrue(location.item_rule(_item("A", 2)))
+
+    def test_keeps_existing_rule(self):
+        location = Location(1, "Test Location")
+        location.item_rule = lambda item: item.name != "C"
+        set_forbidden_items_rule(location, frozenset({"A"}), 1)
+        self.assertFalse(location.item_rule(_item("A")))
+        self.assertFalse(location.item_rule(_item("C")))
+        self.assertFalse(location.item_rule(_item("C", 2)))
+        self.assertTrue(location.item_rule(_item("B")))
+        self.assertTrue(location.item_rule(_item("A", 2)))
+
+    def test_chained(self):
+        location = Location(1, "Test Location")
+        set_forbidden_items_rule(location, frozenset({"A"}), 1)
+        set_forbidden_items_rule(location, frozenset({"B"}), 2)
+        self.assertFalse(location.item_rule(_item("A")))
+        self.assertFalse(location.item_rule(_item("B", 2)))
+        self.assertTrue(location.item_rule(_item("B")))
+        self.assertTrue(location.item_rule(_item("A", 2)))
+
+    def test_other_locations_untouched(self):
+        location, other = Location(1, "Test Location"), Location(1, "Other Location")
+        set_forbidden_items_rule(location, frozenset({"A"}), 1)
+        self.assertTrue(other.item_rule(_item("A")))